@@ -0,0 +1,104 @@
+"""Benchmark the size and parse time of the recent file data for each file encoding.
+
+Each encoding is measured with the standard library json module, and with orjson if it is installed:
+
+.. code-block:: bash
+
+    PYTHONPATH=src/python python benchmarks/bench_encoding.py
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import contextlib
+import sys
+import timeit
+from typing import TYPE_CHECKING, Any
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, filesystem
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+ENCODINGS = (constants.FILE_ENCODING__INDENTED, constants.FILE_ENCODING__COMPACT, constants.FILE_ENCODING__COLUMNAR)
+"""The file encodings to benchmark."""
+
+ENTRY_COUNTS = (100, 10_000, 100_000)
+"""The numbers of entries to benchmark."""
+
+
+def _make_data(count: int) -> dict:
+    """Generate recent file data, ordered from most to least recently opened.
+
+    Args:
+        count: The number of entries to generate.
+
+    Returns:
+        The recent file data.
+    """
+    return {
+        f"/mnt/projects/show/sq{idx % 17:03}/sh{idx % 131:04}/hip/file_v{idx:06}.hip": {
+            constants.DATA_NAME__OPEN_TIMESTAMP: 1_700_000_000.123 + idx,
+            constants.DATA_NAME__SAVE_VERSION: f"20.5.{idx % 500}",
+        }
+        for idx in reversed(range(count))
+    }
+
+
+@contextlib.contextmanager
+def _json_library(module: Any) -> Generator[None, None, None]:
+    """Context manager to encode and decode with a specific JSON library.
+
+    Args:
+        module: The orjson module, or None to use the standard library.
+    """
+    original = filesystem.orjson
+    filesystem.orjson = module
+
+    try:
+        yield
+
+    finally:
+        filesystem.orjson = original
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    libraries = {"json": None}
+
+    if filesystem.orjson is not None:
+        libraries["orjson"] = filesystem.orjson
+
+    for count in ENTRY_COUNTS:
+        data = _make_data(count)
+        number = max(1, 100_000 // count)
+
+        for library, module in libraries.items():
+            with _json_library(module):
+                for encoding in ENCODINGS:
+                    content = filesystem.encode_data(data, encoding)
+
+                    if filesystem.decode_data(content) != data:
+                        sys.exit(f"{encoding} data differs after decoding with {library}")
+
+                    encode_time = min(
+                        timeit.repeat(
+                            lambda data=data, encoding=encoding: filesystem.encode_data(data, encoding),
+                            number=number,
+                            repeat=5,
+                        )
+                    )
+                    decode_time = min(
+                        timeit.repeat(lambda content=content: filesystem.decode_data(content), number=number, repeat=5)
+                    )
+
+                    print(
+                        f"{count:>7} entries, {library:>6} {encoding:>8}: {len(content) / 1024:9.1f} KiB, "
+                        f"encode {encode_time / number * 1000:8.3f} ms, decode {decode_time / number * 1000:8.3f} ms"
+                    )
+
+
+if __name__ == "__main__":
+    main()
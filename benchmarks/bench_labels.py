@@ -0,0 +1,82 @@
+"""Benchmark rendering menu labels with LabelTable against tabulate.
+
+tabulate is no longer a dependency of the package so it is installed from the benchmark requirements:
+
+.. code-block:: bash
+
+    pip install -r benchmarks/requirements.txt
+    PYTHONPATH=src/python python benchmarks/bench_labels.py
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import datetime
+import sys
+import timeit
+
+# Third Party
+from tabulate import tabulate
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import labels
+
+ROW_COUNTS = (100, 10_000)
+"""The numbers of rows to benchmark."""
+
+
+def _make_rows(count: int) -> list[list[str]]:
+    """Generate rows similar to those displayed in the menu.
+
+    Args:
+        count: The number of rows to generate.
+
+    Returns:
+        The generated rows.
+    """
+    return [
+        [
+            f"{idx + 1}. $JOB/shots/sq{idx % 17:03}/sh{idx % 131:04}/hip/file_v{idx:03}.hip",
+            f"(20.5.{idx % 500})",
+            datetime.datetime.fromtimestamp(1_700_000_000 + idx * 3600).strftime("%Y-%m-%d %H:%M"),
+        ]
+        for idx in range(count)
+    ]
+
+
+def _render_label_table(rows: list[list[str]]) -> list[str]:
+    table = labels.LabelTable()
+
+    for row in rows:
+        table.add_row(*row)
+
+    return table.render()
+
+
+def _render_tabulate(rows: list[list[str]]) -> list[str]:
+    return tabulate(rows, tablefmt="plain").split("\n")
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    for count in ROW_COUNTS:
+        rows = _make_rows(count)
+
+        if _render_label_table(rows) != _render_tabulate(rows):
+            sys.exit(f"Output differs from tabulate for {count} rows")
+
+        number = max(1, 100_000 // count)
+
+        label_table_time = min(timeit.repeat(lambda rows=rows: _render_label_table(rows), number=number, repeat=5))
+        tabulate_time = min(timeit.repeat(lambda rows=rows: _render_tabulate(rows), number=number, repeat=5))
+
+        print(
+            f"{count:>6} rows: LabelTable {label_table_time / number * 1000:8.3f} ms, "
+            f"tabulate {tabulate_time / number * 1000:8.3f} ms "
+            f"({tabulate_time / label_table_time:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
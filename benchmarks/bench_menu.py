@@ -0,0 +1,344 @@
+"""Benchmark building the menu, adding files and refreshing across history sizes and storage latency.
+
+The package requires Houdini, so a minimal stand-in for the hou module in benchmarks/stubs is used
+instead:
+
+.. code-block:: bash
+
+    PYTHONPATH=src/python:benchmarks/stubs python benchmarks/bench_menu.py --output results.json
+
+Each result is printed as a line of JSON, and all the results are written to the output file, if
+given, so they can be compared between runs.
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import argparse
+import builtins
+import contextlib
+import io
+import json
+import os
+import pathlib
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+from typing import TYPE_CHECKING, Any
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import api, constants, file_status, storage, ui
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from typing import Self
+
+ENTRY_COUNTS = (100, 1_000, 10_000, 100_000)
+"""The numbers of history entries to benchmark."""
+
+EXISTING_FILE_COUNT = 200
+"""The number of the most recently opened files which are created on disk."""
+
+STORAGE_MODES = (constants.STORAGE_MODE__JSON, constants.STORAGE_MODE__JOURNAL, constants.STORAGE_MODE__SQLITE)
+"""The storage modes to benchmark."""
+
+
+# Classes
+
+
+class _SlowFile:
+    """Wrap a file object so that closing a file which was written to is delayed.
+
+    Buffered writes reach the filesystem when the file is flushed, so the latency is applied once per
+    written file rather than for every call to write().
+
+    Args:
+        handle: The file object to wrap.
+        latency: The number of seconds to delay by.
+    """
+
+    def __init__(self, handle: Any, latency: float) -> None:
+        self._handle = handle
+        self._latency = latency
+        self._written = False
+
+    def __enter__(self) -> Self:
+        self._handle.__enter__()
+
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._handle, name)
+
+    def __iter__(self) -> Any:
+        return iter(self._handle)
+
+    def close(self) -> None:
+        """Close the file, delaying if it was written to."""
+        if self._written and not self._handle.closed:
+            time.sleep(self._latency)
+
+        self._handle.close()
+
+    def write(self, data: Any) -> int:
+        """Write data to the file.
+
+        Args:
+            data: The data to write.
+
+        Returns:
+            The amount of data written.
+        """
+        self._written = True
+
+        return self._handle.write(data)
+
+
+# Non-Public Functions
+
+
+def _make_history(count: int, root: pathlib.Path) -> dict:
+    """Generate recent file data, creating the most recently opened files on disk.
+
+    Args:
+        count: The number of entries to generate.
+        root: The directory to generate the files in.
+
+    Returns:
+        The recent file data.
+    """
+    data = {}
+
+    for idx in range(count):
+        path = root / f"sq{idx % 17:03}" / f"sh{idx % 131:04}" / f"file_v{idx:06}.hip"
+
+        # Higher indices are more recent.
+        data[path.as_posix()] = {
+            constants.DATA_NAME__OPEN_TIMESTAMP: 1_700_000_000 + idx,
+            constants.DATA_NAME__SAVE_VERSION: f"20.5.{idx % 500}",
+        }
+
+        if idx >= count - EXISTING_FILE_COUNT:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+
+    return data
+
+
+def _reset() -> None:
+    """Reset all cached package state so each benchmark starts from nothing."""
+    api.RecentFileManager._instances.pop(api.RecentFileManager, None)
+    storage._create_backend.cache_clear()
+    file_status._get_stat_cache.cache_clear()
+    ui._RENDER_CACHE = ui._RenderCache()
+
+
+@contextlib.contextmanager
+def _slow_filesystem(latency: float) -> Generator[None, None, None]:
+    """Context manager to add latency to filesystem operations.
+
+    Checking the status of files or directories, opening files and writing files are delayed. SQLite
+    performs its own file access so is not affected.
+
+    Args:
+        latency: The number of seconds to delay each operation by.
+    """
+    if latency <= 0:
+        yield
+        return
+
+    original_open = io.open
+    original_scandir = os.scandir
+    original_stat = os.stat
+
+    def _open(*args: Any, **kwargs: Any) -> Any:
+        time.sleep(latency)
+
+        return _SlowFile(original_open(*args, **kwargs), latency)
+
+    def _scandir(*args: Any, **kwargs: Any) -> Any:
+        time.sleep(latency)
+
+        return original_scandir(*args, **kwargs)
+
+    def _stat(*args: Any, **kwargs: Any) -> Any:
+        time.sleep(latency)
+
+        return original_stat(*args, **kwargs)
+
+    builtins.open = io.open = _open  # type: ignore[assignment]
+    os.scandir = _scandir  # type: ignore[assignment]
+    os.stat = _stat
+
+    try:
+        yield
+
+    finally:
+        builtins.open = io.open = original_open
+        os.scandir = original_scandir
+        os.stat = original_stat
+
+
+def _time(func: Callable[[], object], repeat: int) -> dict:
+    """Time a function.
+
+    Args:
+        func: The function to time.
+        repeat: The number of times to repeat the measurement.
+
+    Returns:
+        The timing statistics, in seconds per call.
+    """
+    timer = timeit.Timer(func)
+
+    number, _ = timer.autorange()
+    samples = [sample / number for sample in timer.repeat(repeat=repeat, number=number)]
+
+    return {
+        "calls": number * repeat,
+        "min_s": min(samples),
+        "median_s": statistics.median(samples),
+        "max_s": max(samples),
+    }
+
+
+def _run_benchmarks(mode: str, count: int, latency: float, repeat: int, root: pathlib.Path) -> list[dict]:
+    """Run the benchmarks for a storage mode and history size.
+
+    Args:
+        mode: The storage mode.
+        count: The number of history entries.
+        latency: The filesystem latency, in seconds.
+        repeat: The number of times to repeat each measurement.
+        root: A directory to store the data in.
+
+    Returns:
+        The results.
+    """
+    source_path = root / "recent_houdini_files.json"
+    source_path.write_text(json.dumps(_make_history(count, root / "hip")), encoding="utf-8")
+
+    os.environ[constants.RECENT_FILE_SOURCE_VAR_NAME] = source_path.as_posix()
+    os.environ[constants.STORAGE_MODE_VAR_NAME] = mode
+    os.environ[constants.MAX_RECENT_FILES_VAR_NAME] = str(count)
+
+    _reset()
+
+    # Create the journal or database, if necessary, before timing anything.
+    manager = api.RecentFileManager()
+    backend = storage.get_storage_backend()
+
+    timestamps = iter(range(1_800_000_000, 1_900_000_000))
+
+    def _add() -> None:
+        timestamp = next(timestamps)
+        manager.add_recent_file(
+            api.RecentFile((root / "hip" / "new" / f"{timestamp}.hip").as_posix(), timestamp, "20.5.0")
+        )
+
+    def _build_changed() -> None:
+        # A new generation means the menu has to be rendered again.
+        manager.generation += 1
+        ui.build_recent_files_menu()
+
+    def _refresh_changed() -> None:
+        manager.last_access_time = -1
+        manager.refresh_data()
+
+    data = backend.read_history()
+    manager.get_group_index()
+    search_index = manager.get_search_index()
+
+    benchmarks: dict[str, Callable[[], object]] = {
+        "build_menu": ui.build_recent_files_menu,
+        "build_menu_changed": _build_changed,
+        "build_groups_menu": ui.build_groups_menu,
+        "refresh_data": manager.refresh_data,
+        "refresh_data_changed": _refresh_changed,
+        "add_recent_file": _add,
+        "split_entries": lambda: storage._split_entries(data, count - 1),
+        "search": lambda: search_index.search("sh0042 file_v0", constants.SEARCH_MAX_RESULTS),
+    }
+
+    results = []
+
+    with _slow_filesystem(latency):
+        for name, func in benchmarks.items():
+            results.append({
+                "benchmark": name,
+                "mode": mode,
+                "entries": count,
+                "latency_ms": latency * 1000,
+                **_time(func, repeat),
+            })
+
+    if isinstance(backend, storage.SqliteStorageBackend):
+        backend.close()
+
+    return results
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments.
+
+    Args:
+        argv: The arguments to parse, or None to use sys.argv.
+
+    Returns:
+        The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, nargs="+", default=ENTRY_COUNTS, help="History sizes to benchmark.")
+    parser.add_argument("--modes", nargs="+", default=STORAGE_MODES, choices=STORAGE_MODES, help="Storage modes.")
+    parser.add_argument(
+        "--latency",
+        type=float,
+        nargs="+",
+        default=(0.0, 5.0),
+        help="Filesystem latencies to simulate, in milliseconds.",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Number of times to repeat each measurement.")
+    parser.add_argument("--output", type=pathlib.Path, help="File to write the results to as JSON.")
+
+    return parser.parse_args(argv)
+
+
+# Functions
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmarks and output the results.
+
+    Args:
+        argv: The command line arguments, or None to use sys.argv.
+    """
+    args = _parse_args(argv)
+
+    # Watching for changes would hide the cost of checking for them.
+    os.environ.pop(constants.WATCH_MODE_VAR_NAME, None)
+    os.environ.pop(constants.ARCHIVE_VAR_NAME, None)
+
+    results = []
+
+    for latency in args.latency:
+        for mode in args.modes:
+            for count in args.entries:
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    for result in _run_benchmarks(mode, count, latency / 1000, args.repeat, pathlib.Path(temp_dir)):
+                        print(json.dumps(result), flush=True)
+                        results.append(result)
+
+    if args.output is not None:
+        output = {"python": platform.python_version(), "platform": platform.platform(), "results": results}
+        args.output.write_text(json.dumps(output, indent=4), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,23 @@
+"""Minimal stand-in for the hdefereval module so the package can be benchmarked outside Houdini.
+
+This only provides what the package uses, and is only for benchmarking.
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def executeDeferred(func: Callable[..., Any], *args: Any) -> None:
+    """Run a function immediately, as there is no event loop to defer it to.
+
+    Args:
+        func: The function to run.
+        *args: Arguments to pass to the function.
+    """
+    func(*args)
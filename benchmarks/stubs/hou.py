@@ -0,0 +1,74 @@
+"""Minimal stand-in for the hou module so the package can be benchmarked outside Houdini.
+
+This only provides what the package uses, and is only for benchmarking.
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import os
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_VARIABLE_RE = re.compile(r"\$(\w+)")
+
+
+class hipFile:
+    """Stand-in for hou.hipFile."""
+
+    @staticmethod
+    def path() -> str:
+        """Get the current hip file path.
+
+        Returns:
+            The current hip file path.
+        """
+        return os.environ.get("HIPFILE", "/tmp/untitled.hip")
+
+
+class text:
+    """Stand-in for hou.text."""
+
+    @staticmethod
+    def collapseCommonVars(path: str, vars: Sequence[str] = ()) -> str:  # ruff: ignore[builtin-argument-shadowing]
+        """Replace the leading part of a path with the first variable whose value it starts with.
+
+        Args:
+            path: The path to collapse.
+            vars: The variables to collapse.
+
+        Returns:
+            The collapsed path.
+        """
+        for var in vars:
+            value = text.expandString(var)
+
+            if value and value != var and path.startswith(f"{value}/"):
+                return f"{var}{path[len(value) :]}"
+
+        return path
+
+    @staticmethod
+    def expandString(value: str) -> str:
+        """Expand environment variables in a string.
+
+        Args:
+            value: The string to expand.
+
+        Returns:
+            The expanded string.
+        """
+        return _VARIABLE_RE.sub(lambda match: os.environ.get(match.group(1), ""), value)
+
+
+def isUIAvailable() -> bool:
+    """Check whether the UI is available.
+
+    Returns:
+        False, as there is never a UI outside of Houdini.
+    """
+    return False
@@ -22,7 +22,6 @@ authors = ["graham thompson"]
 requires = [
     "houdini-20.5+<21.5",
     "python_singleton",
-    "tabulate",
     "you_can_call_me_houdini",
 ]
 
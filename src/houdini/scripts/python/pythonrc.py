@@ -5,7 +5,10 @@ from you_can_call_me_houdini.api.manager import CallbackManager
 from you_can_call_me_houdini.events import HoudiniSessionEvent
 
 # Houdini Recent Files Menu
-from houdini_recent_files_menu import callbacks
+from houdini_recent_files_menu import callbacks, ui
+
+# Houdini
+import hou
 
 # Register callback function.
 CallbackManager().add_callback(
@@ -14,3 +17,7 @@ CallbackManager().add_callback(
 CallbackManager().add_callback(
     HoudiniSessionEvent.AfterSceneSave, callbacks.add_current_hip_to_recent_files, skip_no_ui=True
 )
+
+# Prepare the menu in the background once the UI is idle so the first time it is opened is fast.
+if hou.isUIAvailable():
+    ui.warm_up()
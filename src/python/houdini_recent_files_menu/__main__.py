@@ -0,0 +1,9 @@
+"""Run the command line interface with python -m houdini_recent_files_menu."""
+
+# Standard Library
+import sys
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import cli
+
+sys.exit(cli.main())
@@ -4,39 +4,111 @@
 from __future__ import annotations
 
 # Standard Library
+import atexit
 import dataclasses
+import functools
+import heapq
+import itertools
 import operator
 import pathlib
+import sys
+import threading
 import time
+from typing import TYPE_CHECKING, Any
 
 # Third Party
 import singleton
 
 # Houdini Recent Files Menu
-from houdini_recent_files_menu import constants, filesystem
-
-# Houdini
-import hou
+from houdini_recent_files_menu import (
+    canonical,
+    constants,
+    file_status,
+    filesystem,
+    frecency,
+    groups,
+    prune,
+    search,
+    settings,
+    storage,
+    team,
+    timing,
+    watcher,
+    writer,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+_GENERATIONS = itertools.count(1)
+"""Source of unique data generation numbers."""
 
 # Classes
 
 
-@dataclasses.dataclass
+class _ThreadSafeSingleton(singleton.Singleton):
+    """Singleton metaclass which is safe to first instantiate from multiple threads.
+
+    Instantiation is serialized so that a class is only ever initialized once, even if the first
+    instance is being created in a background thread when it is requested elsewhere.
+    """
+
+    _instance_lock = threading.RLock()
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        with type(cls)._instance_lock:
+            return super().__call__(*args, **kwargs)
+
+
+@dataclasses.dataclass(slots=True)
 class RecentFile:
-    """An object representing a recently opened hip file."""
+    """An object representing a recently opened hip file.
+
+    The path is kept as an interned string, as that is how it is stored and displayed, and a Path
+    object is only created if it is required.
+    """
 
-    path: pathlib.Path
+    posix_path: str
+    """The path of the file, using forward slashes."""
     open_timestamp: float
     save_version: str | None
-    exists: bool = dataclasses.field(init=False)
+    exists: bool | None = dataclasses.field(default=None, init=False)
+    """Whether the file exists on disk, or None if that is not (yet) known."""
+    size: int | None = dataclasses.field(default=None, init=False)
+    """The size of the file on disk, if known."""
+    modified: float | None = dataclasses.field(default=None, init=False)
+    """The modification timestamp of the file on disk, if known."""
+    _path: pathlib.Path | None = dataclasses.field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        self.exists = self.path.exists()
+        self.posix_path = sys.intern(self.posix_path)
+
+    @property
+    def path(self) -> pathlib.Path:
+        """The path of the file."""
+        if self._path is None:
+            self._path = pathlib.Path(self.posix_path)
+
+        return self._path
+
+    def set_status(self, status: file_status.FileStatus | None) -> None:
+        """Set the on disk status of the file.
+
+        Args:
+            status: The file status, or None if it is unknown.
+        """
+        if status is None:
+            self.exists = self.size = self.modified = None
+
+        else:
+            self.exists = status.exists
+            self.size = status.size
+            self.modified = status.modified
 
     def as_json(self) -> dict:
         """Return a JSON representation of the recent file data."""
         return {
-            self.path.as_posix(): {
+            self.posix_path: {
                 constants.DATA_NAME__OPEN_TIMESTAMP: self.open_timestamp,
                 constants.DATA_NAME__SAVE_VERSION: self.save_version,
             }
@@ -44,13 +116,49 @@ class RecentFile:
 
 
 @dataclasses.dataclass
-class RecentFileManager(metaclass=singleton.Singleton):
+class RecentFileManager(metaclass=_ThreadSafeSingleton):
     """Manage to handle accessing and updating the recently saved files list."""
 
     files: list[RecentFile] = dataclasses.field(default_factory=list, init=False)
     last_access_time: float = dataclasses.field(default=0, init=False)
+    """The modification time of the stored data when it was last accessed."""
+    generation: int = dataclasses.field(default=0, init=False)
+    """A number which is unique to each state of the files list."""
+    project_root: str | None = dataclasses.field(default=None, init=False)
+    """The root directory of the project whose files are listed, if any."""
+    _watcher: watcher.FileWatcher | None = dataclasses.field(default=None, init=False, repr=False)
+    _group_index: groups.GroupIndex | None = dataclasses.field(default=None, init=False, repr=False)
+    _search_index: search.SearchIndex | None = dataclasses.field(default=None, init=False, repr=False)
+    _index_lock: threading.Lock = dataclasses.field(default_factory=threading.Lock, init=False, repr=False)
+    _late_listing_count: int = dataclasses.field(default=0, init=False, repr=False)
+    """The number of late directory listings when the status of the files was last checked."""
 
     def __post_init__(self) -> None:
+        self.project_root = settings.project_root()
+
+        # Start watching before reading so no changes can be missed in between.
+        self._watcher = watcher.create_watcher(storage.get_storage_backend().watch_paths())
+
+        self._init_from_disk()
+
+    def _change_project(self, project_root: str | None) -> None:
+        """Load the files for a different project.
+
+        Args:
+            project_root: The root directory of the project.
+        """
+        if self._watcher is not None:
+            self._watcher.stop()
+
+        self.project_root = project_root
+
+        # The indexes were built from the previous project's history.
+        with self._index_lock:
+            self._group_index = None
+            self._search_index = None
+
+        self._watcher = watcher.create_watcher(storage.get_storage_backend().watch_paths())
+
         self._init_from_disk()
 
     def _init_from_data(self, data: dict) -> None:
@@ -59,96 +167,334 @@ class RecentFileManager(metaclass=singleton.Singleton):
         Args:
             data: The source recent file data.
         """
-        self.files.clear()
+        # The same file may have been opened through different paths.
+        with timing.timed("api.canonicalize"):
+            data = canonical.collapse_duplicates(data)
+
+        # Limit the number of items based on the max to display. Only the displayed items need to be
+        # ordered so the data is not sorted in full.
+        with timing.timed("api.select_files"):
+            if settings.order() == constants.ORDER__FRECENCY:
+                read_items = list(frecency.top(data, settings.max_display_files()).items())
+
+            else:
+                read_items = heapq.nlargest(
+                    settings.max_display_files(),
+                    data.items(),
+                    key=lambda item: item[1][constants.DATA_NAME__OPEN_TIMESTAMP],
+                )
 
-        read_items = []
+        # Taken before checking so that any directory listed late during the check is picked up.
+        self._late_listing_count = file_status.late_listing_count()
 
-        for hip_path, extra_data in data.items():
-            recent_file = RecentFile(
-                pathlib.Path(hip_path),
-                extra_data[constants.DATA_NAME__OPEN_TIMESTAMP],
-                extra_data.get(constants.DATA_NAME__SAVE_VERSION),
-            )
-            read_items.append(recent_file)
+        files = _create_recent_files(read_items)
 
-        read_items.sort(key=operator.attrgetter("open_timestamp"), reverse=True)
+        # Replace the list only once it is complete as it may be updated by a background writer
+        # while the menu is being built.
+        self.files = files
 
-        # Limit the number of items based on the max to display.
-        self.files = read_items[: min(constants.MAX_DISPLAY_FILES, len(read_items))]
+        self.generation = next(_GENERATIONS)
 
+    @timing.timed("api.load")
     def _init_from_disk(self) -> None:
         """Initialize the list of recent files from the source file on disk."""
-        data = filesystem.read_file_data()
+        # Get the modification time first so any change while reading is picked up by the next refresh.
         self.update_last_access_time()
 
+        backend = storage.get_storage_backend()
+
+        with timing.timed("api.read_data"):
+            data = backend.read_data(limit=settings.max_display_files())
+
+        # Any files added by other sessions will be amongst the most recent entries.
+        self._update_indexes(data)
+
+        # The files with the highest scores are not necessarily the most recent ones, but any without a
+        # stored score can only rank highly if they are, so only the highest scoring entries are added.
+        if settings.order() == constants.ORDER__FRECENCY:
+            with timing.timed("api.read_scored_data"):
+                data = {**data, **backend.read_scored_data(limit=settings.max_display_files())}
+
         self._init_from_data(data)
 
+    def _update_indexes(self, data: dict) -> None:
+        """Add entries to the group and search indexes, if they have been built.
+
+        Args:
+            data: The recent file data to add.
+        """
+        with self._index_lock:
+            if self._group_index is not None:
+                self._group_index.update(data)
+
+            if self._search_index is not None:
+                self._search_index.update(data)
+
     def add_recent_file(self, recent_file: RecentFile) -> None:
         """Add a recent file item to the list.
 
         Args:
             recent_file: The recent file to add.
         """
-        # Get the latest version of the data from disk.
-        data = filesystem.read_file_data()
+        self.add_recent_files([recent_file])
+
+    def add_recent_files(self, recent_files: Sequence[RecentFile]) -> None:
+        """Add multiple recent file items to the list with a single write.
+
+        Args:
+            recent_files: The recent files to add.
+        """
+        backend = storage.get_storage_backend()
+
+        data = {}
+
+        for recent_file in recent_files:
+            data.update(recent_file.as_json())
 
-        # Add the information for the required file.
-        data.update(recent_file.as_json())
+        # Each file is stored under its canonical path so that opening it through a different path
+        # updates the same entry.
+        data = canonical.collapse_duplicates(data)
 
-        # Reduce the entries, if necessary.
-        data = _reduce_entries(data)
+        # Add the information for the required files. Depending on the storage backend
+        # this may be anything from a single row update to rewriting the whole file.
+        with timing.timed("api.add_entries"):
+            backend.add_entries(data)
 
-        # Write the update data back to the disk.
-        filesystem.write_file_data(data)
+        self._update_indexes(data)
+
+        # The files were likely just written so any cached status for them is out of date.
+        for directory in {pathlib.Path(path).parent for path in data}:
+            file_status.invalidate_directory(directory)
 
         # Update the access time to reflect that it was just written to
         # with the most up-to-date data.
         self.update_last_access_time()
 
         # Rebuild the internal data with the current state.
-        self._init_from_data(data)
+        self._init_from_data(_read_display_data(backend))
+
+    def get_group_files(self, group: str) -> list[RecentFile]:
+        """Get the most recently opened files in a group.
+
+        Args:
+            group: The group to get the files for.
+
+        Returns:
+            The recent files, ordered from most to least recently opened.
+        """
+        group_index = self.get_group_index()
+
+        with timing.timed("api.get_group_files"), self._index_lock:
+            data = group_index.files(group, settings.max_display_files())
+
+        return _create_recent_files(data.items())
+
+    def get_group_index(self) -> groups.GroupIndex:
+        """Get the index of the full recent file history grouped by project or directory.
+
+        The index is built from the full history the first time it is required, and is then kept up to
+        date as files are added.
+
+        Returns:
+            The group index.
+        """
+        with self._index_lock:
+            if self._group_index is None:
+                with timing.timed("api.build_group_index"):
+                    self._group_index = groups.GroupIndex(
+                        storage.get_storage_backend().read_history(), settings.group_depth()
+                    )
+
+            return self._group_index
+
+    def get_search_index(self) -> search.SearchIndex:
+        """Get the index for searching the full recent file history.
 
+        The index is built from the full history the first time it is required, and is then kept up to
+        date as files are added.
+
+        Returns:
+            The search index.
+        """
+        with self._index_lock:
+            if self._search_index is None:
+                with timing.timed("api.build_search_index"):
+                    self._search_index = search.SearchIndex(storage.get_storage_backend().read_history())
+
+            return self._search_index
+
+    def remove_recent_files(self, data: dict) -> None:
+        """Remove entries from the list with a single write.
+
+        Entries which have been opened again since are kept. The group and search indexes are
+        discarded, to be built again when next required.
+
+        Args:
+            data: The recent file data to remove.
+        """
+        backend = storage.get_storage_backend()
+
+        with timing.timed("api.remove_entries"):
+            backend.remove_entries(data)
+
+        with self._index_lock:
+            self._group_index = None
+            self._search_index = None
+
+        self.update_last_access_time()
+
+        self._init_from_data(_read_display_data(backend))
+
+    @timing.timed("api.refresh_data")
     def refresh_data(self) -> None:
         """Refresh the list of files from disk, if necessary.
 
-        This will check the file modified time against the last access time and reload
-        the data if necessary.
+        If a watcher is running the data is only reloaded when it has reported a change, without
+        accessing the filesystem. Otherwise, the modification time of the stored data is compared to the
+        one from when it was last accessed. Only modification times reported by the filesystem are
+        compared so differences between the local and file server clocks do not matter.
+
+        If the current project has changed, the files for the new project are loaded instead. If any
+        directories which could not be checked in time have been listed since, the files are loaded
+        again so their status is known.
         """
-        modified = filesystem.get_source_file_modification_time()
+        project_root = settings.project_root()
+
+        if project_root != self.project_root:
+            self._change_project(project_root)
+            return
+
+        if file_status.late_listing_count() != self._late_listing_count:
+            self._init_from_disk()
+            return
+
+        if self._watcher is not None:
+            if self._watcher.check_changed():
+                self._init_from_disk()
+
+            return
 
-        if modified > self.last_access_time:
+        modified = storage.get_storage_backend().modification_time()
+
+        if modified != self.last_access_time:
             self._init_from_disk()
 
+    def search(self, query: str, limit: int | None = constants.SEARCH_MAX_RESULTS) -> list[RecentFile]:
+        """Search the full recent file history for files whose path contains every word in the query.
+
+        The data is refreshed first so that files opened in other sessions are merged into the index
+        before the number of matches is limited.
+
+        Args:
+            query: The search query.
+            limit: The maximum number of matches, or None to find them all.
+
+        Returns:
+            The matching recent files, ordered from most to least recently opened.
+        """
+        self.refresh_data()
+
+        index = self.get_search_index()
+
+        with timing.timed("api.search"), self._index_lock:
+            data = index.search(query, limit)
+
+        return _create_recent_files(data.items())
+
     def update_last_access_time(self) -> None:
-        """Update the internal time of when the file was last accessed."""
-        self.last_access_time = time.time()
+        """Update the stored data modification time as of when it was last accessed."""
+        self.last_access_time = storage.get_storage_backend().modification_time()
 
 
 # Non-Public Functions
 
 
-def _reduce_entries(data: dict) -> dict:
-    """Reduce the number of entries if necessary.
+def _create_recent_files(items: Iterable[tuple[str, dict]]) -> list[RecentFile]:
+    """Create recent file items from recent file data, checking the status of each file.
+
+    Args:
+        items: The path and data of each file.
+
+    Returns:
+        The recent file items.
+    """
+    files = [
+        RecentFile(
+            hip_path,
+            extra_data[constants.DATA_NAME__OPEN_TIMESTAMP],
+            extra_data.get(constants.DATA_NAME__SAVE_VERSION),
+        )
+        for hip_path, extra_data in items
+    ]
+
+    # Check the status of the files as a single batch so a slow or unresponsive mount
+    # can only delay things by the probe timeout.
+    with timing.timed("api.check_files"):
+        statuses = file_status.check_files(recent_file.path for recent_file in files)
+
+    for recent_file in files:
+        recent_file.set_status(statuses[recent_file.path])
+
+    return files
+
+
+def _get_current_hip_recent_file() -> RecentFile:
+    """Get a recent file item for the current hip file.
 
-    In the event that there are more entries than allowable, the entries will be
-    sorted by most recently opened, and the oldest one(s) will be discarded.
+    The path is not made canonical here as that may need to resolve it on the filesystem, which would
+    block the UI. It is made canonical when the file is written.
+
+    Returns:
+        The recent file item for the current hip file.
+    """
+    # Houdini is only imported when it is needed so the rest of the module can be used without it.
+    import hou  # ruff: ignore[import-outside-top-level]
+
+    hip_file = pathlib.Path(hou.hipFile.path()).as_posix()
+
+    version = hou.text.expandString("$_HIP_SAVEVERSION") or None
+
+    return RecentFile(hip_file, time.time(), version)
+
+
+@functools.cache
+def _get_write_queue() -> writer.WriteBehindQueue[RecentFile]:
+    """Get the queue for adding recent files in the background.
+
+    Any files which are still queued when the session exits are written then.
+
+    Returns:
+        The background write queue.
+    """
+    queue = writer.WriteBehindQueue(_write_recent_files, settings.write_delay(), "recent_files_writer")
+
+    atexit.register(queue.flush)
+
+    return queue
+
+
+def _read_display_data(backend: storage.StorageBackend) -> dict:
+    """Read the data for the files to display, in the current order.
 
     Args:
-        data: The data to reduce.
+        backend: The storage backend to read from.
 
     Returns:
-        The reduced data, if necessary.
+        The recent file data.
     """
-    # If we're not at the max, don't do anything.
-    if len(data) <= constants.MAX_RECENT_FILES:
-        return data
+    if settings.order() == constants.ORDER__FRECENCY:
+        return backend.read_frecent_data(limit=settings.max_display_files())
+
+    return backend.read_data(limit=settings.max_display_files())
+
+
+def _write_recent_files(recent_files: list[RecentFile]) -> None:
+    """Add recent files queued for writing in the background.
 
-    # Sort the data by most recent and discard any extra older entries.
-    return dict(
-        sorted(data.items(), key=lambda item: item[1][constants.DATA_NAME__OPEN_TIMESTAMP], reverse=True)[
-            : constants.MAX_RECENT_FILES
-        ]
-    )
+    Args:
+        recent_files: The recent files to add.
+    """
+    RecentFileManager().add_recent_files(recent_files)
 
 
 # Functions
@@ -156,9 +502,87 @@ def _reduce_entries(data: dict) -> dict:
 
 def add_current_hip_to_recent_files() -> None:
     """Add the current hip file path to the recent files list."""
-    hip_file = pathlib.Path(hou.hipFile.path())
+    RecentFileManager().add_recent_file(_get_current_hip_recent_file())
 
-    version = hou.text.expandString("$_HIP_SAVEVERSION") or None
 
-    recent_file = RecentFile(hip_file, time.time(), version)
-    RecentFileManager().add_recent_file(recent_file)
+def get_other_projects() -> list[tuple[str | None, float]]:
+    """Get the projects, other than the current one, which have a recent file history.
+
+    The history which is not part of a project is included, as None, if there is a current project.
+
+    Returns:
+        The name of each project and when its history was last modified, ordered from most to least
+        recently modified.
+    """
+    project_root = settings.project_root()
+    current = filesystem.project_key(project_root) if project_root is not None else None
+
+    projects: list[str | None] = [name for name in filesystem.project_names() if name != current]
+
+    if current is not None:
+        projects.append(None)
+
+    modified = [(project, storage.get_project_backend(project).modification_time()) for project in projects]
+
+    return sorted((item for item in modified if item[1]), key=operator.itemgetter(1), reverse=True)
+
+
+def get_project_recent_files(project: str | None) -> list[RecentFile]:
+    """Get the files to display from the history of a project.
+
+    Args:
+        project: The project name, or None for the history which is not part of a project.
+
+    Returns:
+        The recent files, in the current order.
+    """
+    with timing.timed("api.read_project_data"):
+        data = _read_display_data(storage.get_project_backend(project))
+
+    return _create_recent_files(data.items())
+
+
+def get_team_recent_files() -> list[tuple[str, RecentFile]]:
+    """Get the files most recently opened by anyone in the team.
+
+    Returns:
+        The user who opened each file and the recent file, ordered from most to least recently opened.
+        This is empty if no team directory is set.
+    """
+    history = team.get_team_history()
+
+    if history is None:
+        return []
+
+    with timing.timed("api.get_team_files"):
+        team_files = history.top(settings.max_display_files())
+
+    recent_files = _create_recent_files((team_file.path, team_file.entry) for team_file in team_files)
+
+    return [(team_file.user, recent_file) for team_file, recent_file in zip(team_files, recent_files, strict=True)]
+
+
+def prune_missing_recent_files() -> int:
+    """Remove entries whose files have been missing for longer than the grace period.
+
+    Returns:
+        The number of entries removed.
+    """
+    prunable = prune.find_prunable_entries(storage.get_storage_backend().read_data())
+
+    if prunable:
+        RecentFileManager().remove_recent_files(prunable)
+
+    return len(prunable)
+
+
+def queue_current_hip_for_recent_files() -> None:
+    """Queue the current hip file path to be added to the recent files list in the background.
+
+    The hip file information is gathered immediately, but writing it is left to a background thread
+    so the caller does not wait on the filesystem. Repeated updates for the same file in quick
+    succession, such as from autosaves, are combined into a single write.
+    """
+    recent_file = _get_current_hip_recent_file()
+
+    _get_write_queue().enqueue(recent_file.posix_path, recent_file)
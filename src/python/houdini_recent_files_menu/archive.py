@@ -0,0 +1,192 @@
+"""Compressed storage for recent file entries which no longer fit in the recent files list."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import gzip
+import json
+import os
+import time
+import zlib
+from typing import TYPE_CHECKING
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, filesystem
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Generator
+
+# Classes
+
+
+class Archive:
+    """An append-only archive of recent file entries stored in gzip compressed segments.
+
+    Entries are appended to the newest segment as JSON lines in the same form as the standard source
+    file data. Once a segment grows past the segment size it is sealed by recompressing it as a
+    whole, and further entries start a new segment. Segments are only read when the full history is
+    required, so their size does not affect building the menu or adding files.
+
+    Args:
+        directory: The directory containing the archive segments.
+        segment_size: The size, in bytes, a segment can grow to before a new one is started.
+    """
+
+    def __init__(self, directory: pathlib.Path, segment_size: int = constants.ARCHIVE_SEGMENT_SIZE) -> None:
+        self.directory = directory
+        self.segment_size = segment_size
+
+    def _new_segment_path(self) -> pathlib.Path:
+        """Get the path for a new segment.
+
+        Segment names sort in the order they were created.
+
+        Returns:
+            The path for a new segment.
+        """
+        return self.directory / f"{time.time_ns():020d}{constants.ARCHIVE_SEGMENT_SUFFIX}"
+
+    def append(self, data: dict) -> None:
+        """Add entries to the archive.
+
+        Args:
+            data: The recent file data to archive.
+        """
+        if not data:
+            return
+
+        records = "".join(json.dumps({path: entry}, separators=(",", ":")) + "\n" for path, entry in data.items())
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        with filesystem.lock_file(self.directory):
+            segments = self.segments()
+
+            if not segments:
+                segment = self._new_segment_path()
+
+            elif segments[-1].stat().st_size >= self.segment_size:
+                _seal_segment(segments[-1])
+                segment = self._new_segment_path()
+
+            else:
+                segment = segments[-1]
+
+            # Each append adds a new gzip member to the segment, which readers see as one stream.
+            with gzip.open(segment, "at", encoding="utf-8") as handle:
+                handle.write(records)
+
+    def iter_entries(self) -> Generator[tuple[str, dict], None, None]:
+        """Iterate over the archived entries, from oldest to newest.
+
+        A path may appear more than once if it was archived again after being reopened.
+
+        Yields:
+            The path and data of each archived entry.
+        """
+        for segment in self.segments():
+            yield from _iter_segment_entries(segment)
+
+    def read(self) -> dict:
+        """Read all the archived entries.
+
+        Returns:
+            The archived recent file data, with the most recent entry for each path.
+        """
+        data: dict = {}
+
+        for path, entry in self.iter_entries():
+            existing = data.get(path)
+
+            if (
+                existing is None
+                or entry[constants.DATA_NAME__OPEN_TIMESTAMP] >= existing[constants.DATA_NAME__OPEN_TIMESTAMP]
+            ):
+                data[path] = entry
+
+        return data
+
+    def segments(self) -> list[pathlib.Path]:
+        """Get the archive segment files.
+
+        Returns:
+            The segment files, from oldest to newest.
+        """
+        try:
+            paths = list(self.directory.iterdir())
+
+        except FileNotFoundError:
+            return []
+
+        return sorted(path for path in paths if path.name.endswith(constants.ARCHIVE_SEGMENT_SUFFIX))
+
+
+# Non-Public Functions
+
+
+def _iter_segment_entries(segment: pathlib.Path) -> Generator[tuple[str, dict], None, None]:
+    """Iterate over the entries in a segment.
+
+    Damaged records are skipped.
+
+    Args:
+        segment: The segment file.
+
+    Yields:
+        The path and data of each entry.
+    """
+    for line in _iter_segment_lines(segment):
+        try:
+            record = json.loads(line)
+
+        except ValueError:
+            continue
+
+        if isinstance(record, dict):
+            yield from (
+                (path, entry)
+                for path, entry in record.items()
+                if isinstance(entry, dict) and constants.DATA_NAME__OPEN_TIMESTAMP in entry
+            )
+
+
+def _iter_segment_lines(segment: pathlib.Path) -> Generator[str, None, None]:
+    """Iterate over the decompressed lines of a segment.
+
+    Reading stops at a damaged or incomplete gzip member, such as one which is still being written.
+
+    Args:
+        segment: The segment file.
+
+    Yields:
+        Each line of the segment.
+    """
+    try:
+        with gzip.open(segment, "rt", encoding="utf-8") as handle:
+            yield from handle
+
+    except (EOFError, OSError, zlib.error):
+        return
+
+
+def _seal_segment(segment: pathlib.Path) -> None:
+    """Recompress a full segment as a single gzip member for better compression.
+
+    If the segment is damaged it is left as it is.
+
+    Args:
+        segment: The segment file.
+    """
+    temp_path = segment.with_name(f".{segment.name}.{os.getpid()}.tmp")
+
+    try:
+        with gzip.open(segment, "rb") as source, gzip.open(temp_path, "wb") as target:
+            target.write(source.read())
+
+    except (EOFError, OSError, zlib.error):
+        temp_path.unlink(missing_ok=True)
+        return
+
+    temp_path.replace(segment)
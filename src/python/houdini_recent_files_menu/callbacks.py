@@ -9,7 +9,9 @@ from houdini_recent_files_menu import api
 def add_current_hip_to_recent_files(scriptargs: dict) -> None:
     """Callback to add the current hip file to the recent files list.
 
+    The file is written in the background so scene loads and saves do not wait on it.
+
     Args:
         scriptargs: Callback event args.
     """
-    api.add_current_hip_to_recent_files()
+    api.queue_current_hip_for_recent_files()
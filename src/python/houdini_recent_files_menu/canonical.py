@@ -0,0 +1,89 @@
+"""Convert the different paths a file can be opened through to a single canonical path."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import functools
+import os
+import pathlib
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, settings
+
+# Non-Public Functions
+
+
+@functools.lru_cache(maxsize=constants.CANONICAL_CACHE_SIZE)
+def _canonicalize(path: str, path_map: tuple[tuple[str, str], ...], *, resolve: bool) -> str:
+    """Get the canonical path for a file.
+
+    Resolving a path can require several round trips to a network filesystem so the result for each
+    path is remembered.
+
+    Args:
+        path: The path of the file, using forward slashes.
+        path_map: Pairs of path prefixes and the prefix to replace them with.
+        resolve: Whether to resolve symbolic links and ".." segments.
+
+    Returns:
+        The canonical path, using forward slashes.
+    """
+    if resolve:
+        path = pathlib.Path(os.path.realpath(path)).as_posix()
+
+    for prefix, replacement in path_map:
+        base = prefix.rstrip("/")
+
+        if path == base or path.startswith(f"{base}/"):
+            return f"{replacement.rstrip('/')}{path[len(base) :]}"
+
+    return path
+
+
+# Functions
+
+
+def canonical_path(path: str) -> str:
+    """Get the canonical path for a file.
+
+    If enabled, symbolic links and ".." segments are resolved, and then the first matching prefix
+    from the path map is replaced.
+
+    Args:
+        path: The path of the file, using forward slashes.
+
+    Returns:
+        The canonical path, using forward slashes.
+    """
+    return _canonicalize(path, settings.path_map(), resolve=settings.resolve_paths())
+
+
+def collapse_duplicates(data: dict) -> dict:
+    """Combine the entries for paths which refer to the same file.
+
+    Each entry is keyed by its canonical path, keeping the most recently opened entry for each.
+
+    Args:
+        data: The recent file data.
+
+    Returns:
+        The recent file data keyed by canonical path.
+    """
+    resolve = settings.resolve_paths()
+    path_map = settings.path_map()
+
+    # Paths are already canonical if there is nothing to do.
+    if not resolve and not path_map:
+        return data
+
+    collapsed: dict[str, dict] = {}
+
+    for path, entry in data.items():
+        key = _canonicalize(path, path_map, resolve=resolve)
+        current = collapsed.get(key)
+
+        if current is None or entry[constants.DATA_NAME__OPEN_TIMESTAMP] > current[constants.DATA_NAME__OPEN_TIMESTAMP]:
+            collapsed[key] = entry
+
+    return collapsed
@@ -0,0 +1,235 @@
+"""Command line interface for querying and maintaining the recent file history without Houdini.
+
+.. code-block:: bash
+
+    python -m houdini_recent_files_menu list --limit 10
+    python -m houdini_recent_files_menu search explosion fx
+    python -m houdini_recent_files_menu export --format csv --output history.csv
+    python -m houdini_recent_files_menu compact
+    python -m houdini_recent_files_menu prune
+
+The storage settings are read from the same environment variables as in Houdini.
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import argparse
+import csv
+import datetime
+import json
+import pathlib
+import sys
+from typing import TYPE_CHECKING, TextIO
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import (
+    constants,
+    labels,
+    prune,
+    search,
+    settings,
+    storage,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_FIELD_NAMES = ("path", constants.DATA_NAME__OPEN_TIMESTAMP, constants.DATA_NAME__SAVE_VERSION)
+"""The names of the fields output for each entry."""
+
+_FORMAT__CSV = "csv"
+_FORMAT__JSON = "json"
+_FORMAT__TEXT = "text"
+
+# Non-Public Functions
+
+
+def _compact(_: argparse.Namespace) -> int:
+    """Rewrite the stored data so it only contains the entries which fit in the list.
+
+    Returns:
+        The exit code.
+    """
+    removed = storage.get_storage_backend().compact()
+
+    print(f"Removed {removed} entries.")
+
+    return 0
+
+
+def _export(args: argparse.Namespace) -> int:
+    """Write the full history, including archived entries, as JSON or CSV.
+
+    Args:
+        args: The parsed arguments.
+
+    Returns:
+        The exit code.
+    """
+    history = storage.get_storage_backend().read_history()
+
+    if args.output is None:
+        _write_entries(history.items(), args.format, sys.stdout)
+
+    else:
+        with args.output.open("w", encoding="utf-8", newline="") as handle:
+            _write_entries(history.items(), args.format, handle)
+
+    return 0
+
+
+def _iter_rows(entries: Iterable[tuple[str, dict]]) -> Iterator[dict]:
+    """Convert entries to rows of output fields.
+
+    Args:
+        entries: The path and data of each entry.
+
+    Yields:
+        The fields for each entry.
+    """
+    for path, entry in entries:
+        yield {
+            "path": path,
+            constants.DATA_NAME__OPEN_TIMESTAMP: entry[constants.DATA_NAME__OPEN_TIMESTAMP],
+            constants.DATA_NAME__SAVE_VERSION: entry.get(constants.DATA_NAME__SAVE_VERSION),
+        }
+
+
+def _list(args: argparse.Namespace) -> int:
+    """Output the most recently opened files.
+
+    Args:
+        args: The parsed arguments.
+
+    Returns:
+        The exit code.
+    """
+    data = storage.get_storage_backend().read_data(limit=args.limit)
+
+    _write_entries(data.items(), args.format, sys.stdout)
+
+    return 0
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments.
+
+    Args:
+        argv: The arguments to parse, or None to use sys.argv.
+
+    Returns:
+        The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(prog="houdini_recent_files_menu", description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    formats = (_FORMAT__TEXT, _FORMAT__JSON, _FORMAT__CSV)
+
+    list_parser = subparsers.add_parser("list", help="List the most recently opened files.")
+    list_parser.add_argument("--limit", type=int, default=settings.max_display_files(), help="Number of files.")
+    list_parser.add_argument("--format", choices=formats, default=_FORMAT__TEXT, help="Output format.")
+    list_parser.set_defaults(func=_list)
+
+    search_parser = subparsers.add_parser("search", help="Search the full history for paths containing every word.")
+    search_parser.add_argument("words", nargs="+", help="Words to search for.")
+    search_parser.add_argument("--limit", type=int, default=constants.SEARCH_MAX_RESULTS, help="Number of files.")
+    search_parser.add_argument("--format", choices=formats, default=_FORMAT__TEXT, help="Output format.")
+    search_parser.set_defaults(func=_search)
+
+    export_parser = subparsers.add_parser("export", help="Export the full history, including archived entries.")
+    export_parser.add_argument("--format", choices=formats[1:], default=_FORMAT__JSON, help="Output format.")
+    export_parser.add_argument("--output", type=pathlib.Path, help="File to write to, instead of standard output.")
+    export_parser.set_defaults(func=_export)
+
+    compact_parser = subparsers.add_parser("compact", help="Remove entries which no longer fit in the list.")
+    compact_parser.set_defaults(func=_compact)
+
+    prune_parser = subparsers.add_parser("prune", help="Remove entries whose files have been missing for a while.")
+    prune_parser.set_defaults(func=_prune)
+
+    return parser.parse_args(argv)
+
+
+def _prune(_: argparse.Namespace) -> int:
+    """Remove entries whose files have been missing for longer than the grace period.
+
+    Returns:
+        The exit code.
+    """
+    backend = storage.get_storage_backend()
+    prunable = prune.find_prunable_entries(backend.read_data())
+
+    if prunable:
+        backend.remove_entries(prunable)
+
+    print(f"Removed {len(prunable)} entries.")
+
+    return 0
+
+
+def _search(args: argparse.Namespace) -> int:
+    """Output the most recently opened files in the full history matching the search words.
+
+    Args:
+        args: The parsed arguments.
+
+    Returns:
+        The exit code, which is 1 if nothing matched.
+    """
+    data = search.search_data(storage.get_storage_backend().read_history(), " ".join(args.words), args.limit)
+
+    _write_entries(data.items(), args.format, sys.stdout)
+
+    return 0 if data else 1
+
+
+def _write_entries(entries: Iterable[tuple[str, dict]], output_format: str, stream: TextIO) -> None:
+    """Write entries in an output format.
+
+    JSON and CSV output is written one entry at a time.
+
+    Args:
+        entries: The path and data of each entry.
+        output_format: The output format.
+        stream: The stream to write to.
+    """
+    if output_format == _FORMAT__CSV:
+        writer = csv.DictWriter(stream, fieldnames=_FIELD_NAMES)
+        writer.writeheader()
+        writer.writerows(_iter_rows(entries))
+
+    elif output_format == _FORMAT__JSON:
+        stream.write("[")
+        stream.writelines(f"{',' if idx else ''}\n    {json.dumps(row)}" for idx, row in enumerate(_iter_rows(entries)))
+        stream.write("\n]\n")
+
+    else:
+        table = labels.LabelTable()
+
+        for row in _iter_rows(entries):
+            dt = datetime.datetime.fromtimestamp(row[constants.DATA_NAME__OPEN_TIMESTAMP])
+
+            table.add_row(
+                row["path"], f"({row[constants.DATA_NAME__SAVE_VERSION]})", dt.strftime(constants.TIMESTAMP_FORMAT)
+            )
+
+        stream.writelines(f"{label}\n" for label in table.render())
+
+
+# Functions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the command line interface.
+
+    Args:
+        argv: The command line arguments, or None to use sys.argv.
+
+    Returns:
+        The exit code.
+    """
+    args = _parse_args(argv)
+
+    return args.func(args)
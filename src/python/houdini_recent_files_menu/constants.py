@@ -6,18 +6,223 @@ RECENT_FILE_SOURCE_FILE_NAME = "recent_houdini_files.json"
 RECENT_FILE_SOURCE_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_FILE"
 """Environment variable name that can point to the source file."""
 
+PROJECTS_DIRECTORY_SUFFIX = "_projects"
+"""Suffix added to the source file name to get the name of the directory containing the history of each project."""
+
+SHARD_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_SHARD"
+"""Environment variable name that can enable keeping a separate history for each project."""
+
+SHARD__JOB = "job"
+"""Shard value which uses $JOB as the project root."""
+
+ARCHIVE_DIRECTORY_SUFFIX = "_archive"
+"""Suffix added to the source file name to get the archive directory name."""
+
+ARCHIVE_SEGMENT_SUFFIX = ".jsonl.gz"
+"""Suffix of archive segment file names."""
+
+ARCHIVE_SEGMENT_SIZE = 1024 * 1024
+"""Size, in bytes, an archive segment can grow to before a new one is started."""
+
+ARCHIVE_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_ARCHIVE"
+"""Environment variable name that can enable archiving entries which no longer fit in the list."""
+
+DATABASE_FILE_SUFFIX = ".db"
+"""Suffix which replaces that of the source file to get the SQLite database file name."""
+
+JOURNAL_FILE_SUFFIX = ".jsonl"
+"""Suffix which replaces that of the source file to get the journal file name."""
+
+STORAGE_MODE_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_STORAGE"
+"""Environment variable name that can set the storage mode."""
+
+# Supported storage modes.
+STORAGE_MODE__JOURNAL = "journal"
+STORAGE_MODE__JSON = "json"
+STORAGE_MODE__SQLITE = "sqlite"
+
+JOURNAL_COMPACT_SIZE = 256 * 1024
+"""Size, in bytes, the journal can grow to before it is compacted."""
+
+JOURNAL_COMPACT_SIZE_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_JOURNAL_COMPACT_SIZE"
+"""Environment variable name that can override the journal compaction size."""
+
+STAT_CACHE_FILE_SUFFIX = "_stat_cache.json"
+"""Suffix added to the source file name to get the file status cache file name."""
+
+MISSING_FILES_FILE_SUFFIX = "_missing.json"
+"""Suffix added to the source file name to get the name of the file recording when files went missing."""
+
+CANONICAL_CACHE_SIZE = 4096
+"""Number of canonical paths remembered so they do not need to be resolved again."""
+
+PATH_MAP_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_PATH_MAP"
+"""Environment variable name that can set path prefixes to replace, as a list of "from=to" pairs."""
+
+RESOLVE_PATHS_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_RESOLVE_PATHS"
+"""Environment variable name that can enable resolving symbolic links in file paths."""
+
 MAX_RECENT_FILES = 100
 """Maximum number of entries to keep in the file."""
 
+MAX_RECENT_FILES_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_MAX_RECENT_FILES"
+"""Environment variable name that can override the maximum number of entries to keep."""
+
 MAX_DISPLAY_FILES = 100
 """Maximum number of entries to display in the menu."""
 
+MAX_DISPLAY_FILES_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_MAX_DISPLAY_FILES"
+"""Environment variable name that can override the maximum number of entries to display."""
+
 # Key names for storing data in the file.
+DATA_NAME__FRECENCY = "frecency"
 DATA_NAME__OPEN_TIMESTAMP = "open_timestamp"
 DATA_NAME__SAVE_VERSION = "save_version"
 
+ORDER_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_ORDER"
+"""Environment variable name that can set how the files are ordered."""
+
+# Supported orders.
+ORDER__FRECENCY = "frecency"
+ORDER__RECENCY = "recency"
+
+FRECENCY_HALF_LIFE_DAYS = 14.0
+"""Number of days after which the contribution of opening a file to its frecency score has halved."""
+
+FRECENCY_HALF_LIFE_DAYS_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_FRECENCY_HALF_LIFE_DAYS"
+"""Environment variable name that can override the frecency half-life."""
+
+# Key names for storing data in the file status cache.
+DATA_NAME__FILES = "files"
+DATA_NAME__MODIFIED = "modified"
+
+# Key names for storing data in columnar files.
+DATA_NAME__FORMAT = "format"
+DATA_NAME__FRECENCIES = "frecencies"
+DATA_NAME__OPEN_TIMESTAMPS = "open_timestamps"
+DATA_NAME__PATHS = "paths"
+DATA_NAME__SAVE_VERSIONS = "save_versions"
+
+COLUMNAR_FORMAT = "columnar"
+"""Format name identifying a file which stores each field of the entries in a separate list."""
+
+FILE_ENCODING_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_ENCODING"
+"""Environment variable name that can set how the recent file data is encoded when written."""
+
+# Supported file encodings.
+FILE_ENCODING__COLUMNAR = "columnar"
+FILE_ENCODING__COMPACT = "compact"
+FILE_ENCODING__INDENTED = "indented"
+
+GROUP_DEPTH = 0
+"""Number of directories below the root which files are grouped by, or 0 to group by parent directory."""
+
+GROUP_DEPTH_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_GROUP_DEPTH"
+"""Environment variable name that can set the directory depth files are grouped by."""
+
+SEARCH_MAX_RESULTS = 50
+"""Maximum number of files shown when searching the recent file history."""
+
 VARS_TO_COLLAPSE = ("$HIP", "$HOME")
 """Variables to collapse when displaying file paths in the menu."""
 
 TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
 """Timestamp format for UI display."""
+
+PANEL_DISPLAY_CACHE_SIZE = 10_000
+"""Maximum number of formatted paths kept by the recent files panel before they are formatted again."""
+
+PANEL_FILTER_DELAY = 150
+"""Number of milliseconds to wait for further typing before filtering the recent files panel."""
+
+PANEL_INTERFACE_NAME = "houdini_recent_files_menu"
+"""Name of the Python panel interface for the recent files panel."""
+
+PROBE_TIMEOUT = 0.5
+"""Maximum number of seconds to wait for file status checks to complete."""
+
+PROBE_TIMEOUT_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_PROBE_TIMEOUT"
+"""Environment variable name that can override the file status check timeout."""
+
+PROBE_MAX_WORKERS = 8
+"""Maximum number of threads used to check the status of files."""
+
+PRUNE_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_PRUNE"
+"""Environment variable name that can enable removing entries whose files no longer exist."""
+
+PRUNE_GRACE_DAYS = 7.0
+"""Number of days a file has to be missing for before its entry is removed."""
+
+PRUNE_GRACE_DAYS_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_PRUNE_GRACE_DAYS"
+"""Environment variable name that can override the number of days before missing files are removed."""
+
+PRUNE_MAX_WORKERS = 4
+"""Maximum number of threads used to check for missing files in the background."""
+
+PRUNE_MAX_WORKERS_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_PRUNE_MAX_WORKERS"
+"""Environment variable name that can override the number of threads used to check for missing files."""
+
+PRUNE_TIMEOUT = 60.0
+"""Maximum number of seconds to wait for the background checks for missing files to complete."""
+
+PREFETCH_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_PREFETCH"
+"""Environment variable name that can enable reading the most recently opened files ahead of time."""
+
+# Supported prefetch modes.
+PREFETCH_MODE__ADVISE = "advise"
+PREFETCH_MODE__READ = "read"
+
+PREFETCH_COUNT = 3
+"""Number of the most recently opened files which are read ahead of time."""
+
+PREFETCH_COUNT_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_PREFETCH_COUNT"
+"""Environment variable name that can override the number of files read ahead of time."""
+
+PREFETCH_MAX_SIZE_MB = 1024.0
+"""Maximum size, in megabytes, of a file which is read ahead of time."""
+
+PREFETCH_MAX_SIZE_MB_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_PREFETCH_MAX_SIZE_MB"
+"""Environment variable name that can override the maximum size of a file read ahead of time."""
+
+PREFETCH_BUDGET_MB = 4096.0
+"""Maximum number of megabytes read ahead of time in each session."""
+
+PREFETCH_BUDGET_MB_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_PREFETCH_BUDGET_MB"
+"""Environment variable name that can override the number of megabytes read ahead of time in each session."""
+
+PREFETCH_MAX_WORKERS = 2
+"""Maximum number of threads used to read files ahead of time."""
+
+PREFETCH_CHUNK_SIZE = 1024 * 1024
+"""Number of bytes read at a time when reading a file ahead of time."""
+
+WATCH_MODE_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_WATCH"
+"""Environment variable name that can enable watching the stored data for changes."""
+
+# Supported watch modes.
+WATCH_MODE__INOTIFY = "inotify"
+WATCH_MODE__POLL = "poll"
+
+POLL_INTERVAL = 2.0
+"""Number of seconds between checks of the stored data when polling for changes."""
+
+POLL_INTERVAL_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_POLL_INTERVAL"
+"""Environment variable name that can override the polling interval."""
+
+WRITE_DELAY = 1.0
+"""Number of seconds to wait for further updates before writing added files in the background."""
+
+WRITE_DELAY_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_WRITE_DELAY"
+"""Environment variable name that can override the background write delay."""
+
+TEAM_DIRECTORY_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_TEAM_DIR"
+"""Environment variable name that can set the directory containing the histories of each team member."""
+
+TIMING_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_TIMING"
+"""Environment variable name that can enable recording how long each phase takes."""
+
+TIMING_BUFFER_SIZE = 1000
+"""Number of timings kept in memory, after which the oldest are discarded."""
+
+TIMING_BUFFER_SIZE_VAR_NAME = "HOUDINI_RECENT_FILES_MENU_TIMING_BUFFER_SIZE"
+"""Environment variable name that can override the number of timings kept."""
@@ -0,0 +1,393 @@
+"""Batched and cached checks of the on disk status of recent files."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import collections
+import concurrent.futures
+import dataclasses
+import functools
+import json
+import os
+import pathlib
+import tempfile
+import threading
+from typing import TYPE_CHECKING
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, filesystem, settings, threads
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_PENDING_SCANS: dict[pathlib.Path, tuple[frozenset[str], concurrent.futures.Future[DirectoryListing]]] = {}
+"""Directory scans which are still running, keyed by the directory being scanned."""
+
+_PENDING_SCANS_LOCK = threading.Lock()
+"""Lock guarding the pending scans, which are shared by the menu, warm up and writer threads."""
+
+# Classes
+
+
+@dataclasses.dataclass(frozen=True)
+class FileStatus:
+    """The on disk status of a file."""
+
+    exists: bool
+    size: int | None = None
+    modified: float | None = None
+
+    def as_json(self) -> list:
+        """Return a JSON representation of the status."""
+        return [self.exists, self.size, self.modified]
+
+
+@dataclasses.dataclass(frozen=True)
+class DirectoryListing:
+    """The status of a set of files in a directory at a point in time."""
+
+    modified: float
+    files: dict[str, FileStatus]
+
+    def as_json(self) -> dict:
+        """Return a JSON representation of the listing."""
+        return {
+            constants.DATA_NAME__MODIFIED: self.modified,
+            constants.DATA_NAME__FILES: {name: status.as_json() for name, status in self.files.items()},
+        }
+
+
+class StatCache:
+    """A persistent cache of directory listings.
+
+    Listings are only valid as long as the modification time of their directory is unchanged, which
+    happens whenever a file is added to, removed from or renamed within the directory. Reusing a
+    listing therefore only needs a single stat of the directory. Saving over an existing file does not
+    change its directory, so the directories of files added to the list are invalidated instead.
+
+    The cache is shared by the menu, warm up and writer threads so access to the listings is locked.
+
+    Listings from scans which finish after the caller stopped waiting are still added, and counted so
+    that anything displaying unknown file status can tell when to check again.
+
+    Args:
+        path: The path of the cache file.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+        self.late_listing_count = 0
+        self._listings: dict[pathlib.Path, DirectoryListing] = _read_cache_file(path)
+        self._lock = threading.Lock()
+
+    def add_late_listing(self, directory: pathlib.Path, listing: DirectoryListing) -> None:
+        """Add the listing from a scan which finished after the caller stopped waiting for it.
+
+        Args:
+            directory: The directory which was scanned.
+            listing: The directory listing.
+        """
+        if not self.update({directory: listing}):
+            return
+
+        with self._lock:
+            self.late_listing_count += 1
+
+        self.save()
+
+    def get(self, directory: pathlib.Path) -> DirectoryListing | None:
+        """Get the cached listing for a directory.
+
+        Args:
+            directory: The directory to get the listing for.
+
+        Returns:
+            The cached listing, if any.
+        """
+        with self._lock:
+            return self._listings.get(directory)
+
+    def invalidate(self, directory: pathlib.Path) -> None:
+        """Discard the cached listing for a directory.
+
+        Args:
+            directory: The directory to discard the listing for.
+        """
+        with self._lock:
+            self._listings.pop(directory, None)
+
+    def save(self) -> None:
+        """Write the cache to disk in the background."""
+        with self._lock:
+            data = {directory.as_posix(): listing.as_json() for directory, listing in self._listings.items()}
+
+        _get_probe_pool().submit(_write_cache_file, self.path, data)
+
+    def update(self, listings: dict[pathlib.Path, DirectoryListing]) -> bool:
+        """Update the cache with new directory listings.
+
+        Args:
+            listings: The directory listings.
+
+        Returns:
+            Whether any listings were changed.
+        """
+        changed = False
+
+        with self._lock:
+            for directory, listing in listings.items():
+                if self._listings.get(directory) != listing:
+                    self._listings[directory] = listing
+                    changed = True
+
+        return changed
+
+
+# Non-Public Functions
+
+
+def _add_late_listing(
+    cache: StatCache, directory: pathlib.Path, future: concurrent.futures.Future[DirectoryListing]
+) -> None:
+    """Add the listing from a scan which finished after the timeout to the cache.
+
+    Args:
+        cache: The stat cache.
+        directory: The directory which was scanned.
+        future: The finished scan.
+    """
+    if future.exception() is None:
+        cache.add_late_listing(directory, future.result())
+
+
+@functools.cache
+def _get_probe_pool() -> threads.DaemonThreadPool:
+    """Get the shared thread pool used to check for file status.
+
+    Returns:
+        The file status thread pool.
+    """
+    return threads.DaemonThreadPool(constants.PROBE_MAX_WORKERS, "recent_files_probe")
+
+
+@functools.cache
+def _get_stat_cache(path: pathlib.Path) -> StatCache:
+    """Get the stat cache for a cache file.
+
+    Args:
+        path: The path of the cache file.
+
+    Returns:
+        The stat cache.
+    """
+    return StatCache(path)
+
+
+def _read_cache_file(path: pathlib.Path) -> dict[pathlib.Path, DirectoryListing]:
+    """Read cached directory listings from disk.
+
+    A missing or unreadable cache file results in an empty cache.
+
+    Args:
+        path: The path of the cache file.
+
+    Returns:
+        The cached directory listings.
+    """
+    try:
+        with path.open(encoding="utf-8") as handle:
+            data = json.load(handle)
+
+        return {
+            pathlib.Path(directory): DirectoryListing(
+                listing[constants.DATA_NAME__MODIFIED],
+                {name: FileStatus(*status) for name, status in listing[constants.DATA_NAME__FILES].items()},
+            )
+            for directory, listing in data.items()
+        }
+
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def _scan_directory(
+    directory: pathlib.Path, names: frozenset[str], cached: DirectoryListing | None
+) -> DirectoryListing:
+    """Get the status of files in a directory.
+
+    If the directory has not been modified since the cached listing was made, and the listing
+    covers all the required files, the cached listing is returned without scanning.
+
+    Args:
+        directory: The directory to scan.
+        names: The names of the files to get the status of.
+        cached: A previous listing of the directory.
+
+    Returns:
+        The directory listing.
+    """
+    try:
+        modified = directory.stat().st_mtime
+
+    except (FileNotFoundError, NotADirectoryError):
+        return DirectoryListing(-1, {name: FileStatus(exists=False) for name in names})
+
+    if cached is not None and cached.modified == modified and names <= cached.files.keys():
+        return cached
+
+    files = {}
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name not in names:
+                continue
+
+            try:
+                stat = entry.stat()
+
+            except FileNotFoundError:
+                continue
+
+            files[entry.name] = FileStatus(exists=True, size=stat.st_size, modified=stat.st_mtime)
+
+    for name in names - files.keys():
+        files[name] = FileStatus(exists=False)
+
+    return DirectoryListing(modified, files)
+
+
+def _submit_scan(
+    directory: pathlib.Path, names: frozenset[str], cached: DirectoryListing | None
+) -> concurrent.futures.Future[DirectoryListing]:
+    """Schedule a scan of a directory.
+
+    If a scan covering the files is still outstanding from a previous call it will be reused rather
+    than queueing another one behind what is likely a hung mount.
+
+    Args:
+        directory: The directory to scan.
+        names: The names of the files to get the status of.
+        cached: A previous listing of the directory.
+
+    Returns:
+        A future for the directory listing.
+    """
+    with _PENDING_SCANS_LOCK:
+        pending = _PENDING_SCANS.get(directory)
+
+        if pending is not None and names <= pending[0]:
+            return pending[1]
+
+        future = _get_probe_pool().submit(_scan_directory, directory, names, cached)
+        _PENDING_SCANS[directory] = (names, future)
+
+    def _discard(done: concurrent.futures.Future[DirectoryListing]) -> None:
+        with _PENDING_SCANS_LOCK:
+            if _PENDING_SCANS.get(directory, (None, None))[1] is done:
+                del _PENDING_SCANS[directory]
+
+    # Registered after storing so that an already finished scan is removed immediately. This is done
+    # outside the lock as the callback runs straight away in that case.
+    future.add_done_callback(_discard)
+
+    return future
+
+
+def _write_cache_file(path: pathlib.Path, data: dict) -> None:
+    """Write directory listings to disk.
+
+    The file is replaced atomically so concurrent sessions never see a partial cache. Each write uses
+    its own temporary file as saves may run at the same time on different pool threads.
+
+    Args:
+        path: The path of the cache file.
+        data: The JSON representation of the listings.
+    """
+    with tempfile.NamedTemporaryFile(
+        mode="w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    ) as handle:
+        json.dump(data, handle)
+
+    pathlib.Path(handle.name).replace(path)
+
+
+# Functions
+
+
+def check_files(paths: Iterable[pathlib.Path], timeout: float | None = None) -> dict[pathlib.Path, FileStatus | None]:
+    """Get the on disk status of each of the files.
+
+    Files are grouped by their parent directory and each directory is checked once, in parallel,
+    using the persistent stat cache where the directory has not changed. The call returns once all
+    the directories have been checked or the timeout has elapsed, whichever happens first.
+
+    Files in directories which could not be checked in time use the last cached listing, if there is
+    one. Scans which finish after the timeout are still added to the cache, so that a directory which
+    is always slower than the timeout is known the next time it is checked. Files in directories which
+    could not be checked at all, or have never been checked in time, have an unknown (None) status.
+
+    Args:
+        paths: The files to check.
+        timeout: The maximum number of seconds to wait. If None, the configured timeout is used.
+
+    Returns:
+        The status of each file, or None if it could not be determined.
+    """
+    if timeout is None:
+        timeout = settings.probe_timeout()
+
+    paths = list(paths)
+
+    cache = _get_stat_cache(filesystem.stat_cache_file_path())
+
+    grouped: dict[pathlib.Path, set[str]] = collections.defaultdict(set)
+
+    for path in paths:
+        grouped[path.parent].add(path.name)
+
+    cached = {directory: cache.get(directory) for directory in grouped}
+
+    futures = {
+        directory: _submit_scan(directory, frozenset(names), cached[directory]) for directory, names in grouped.items()
+    }
+
+    done, _ = concurrent.futures.wait(futures.values(), timeout=timeout)
+
+    listings = {}
+    fallback_listings = {}
+
+    for directory, future in futures.items():
+        if future not in done:
+            future.add_done_callback(functools.partial(_add_late_listing, cache, directory))
+
+            if (listing := cached[directory]) is not None:
+                fallback_listings[directory] = listing
+
+        elif future.exception() is None:
+            listings[directory] = future.result()
+
+    if cache.update(listings):
+        cache.save()
+
+    listings.update(fallback_listings)
+
+    return {path: listings[path.parent].files.get(path.name) if path.parent in listings else None for path in paths}
+
+
+def invalidate_directory(directory: pathlib.Path) -> None:
+    """Discard any cached status information for files in a directory.
+
+    Args:
+        directory: The directory to discard information for.
+    """
+    _get_stat_cache(filesystem.stat_cache_file_path()).invalidate(directory)
+
+
+def late_listing_count() -> int:
+    """Get the number of directory listings which have been cached since their scan timed out.
+
+    Returns:
+        The number of late listings.
+    """
+    return _get_stat_cache(filesystem.stat_cache_file_path()).late_listing_count
@@ -4,16 +4,169 @@
 from __future__ import annotations
 
 # Standard Library
+import contextlib
+import hashlib
 import json
 import os
 import pathlib
+import re
+from typing import TYPE_CHECKING, Any
 
 # Houdini Recent Files Menu
-from houdini_recent_files_menu import constants
+from houdini_recent_files_menu import constants, settings, timing
+
+try:
+    import fcntl
+
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import orjson
+
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+# Non-Public Functions
+
+
+def _decode_columnar(data: dict) -> dict:
+    """Convert data stored as separate lists for each field back to recent file data.
+
+    Args:
+        data: The columnar data.
+
+    Returns:
+        The recent file data.
+
+    Raises:
+        ValueError: If the lists are not all the same length.
+    """
+    result = {
+        path: {constants.DATA_NAME__OPEN_TIMESTAMP: timestamp, constants.DATA_NAME__SAVE_VERSION: version}
+        for path, timestamp, version in zip(
+            data[constants.DATA_NAME__PATHS],
+            data[constants.DATA_NAME__OPEN_TIMESTAMPS],
+            data[constants.DATA_NAME__SAVE_VERSIONS],
+            strict=True,
+        )
+    }
+
+    scores = data.get(constants.DATA_NAME__FRECENCIES)
+
+    if scores is not None:
+        for entry, score in zip(result.values(), scores, strict=True):
+            if score is not None:
+                entry[constants.DATA_NAME__FRECENCY] = score
+
+    return result
+
+
+def _default_source_file_path() -> pathlib.Path:
+    """Get the path for the source data file which is not part of a project.
+
+    Returns:
+        The path for the source data file.
+    """
+    return pathlib.Path(
+        os.environ.get("HOUDINI_RECENT_FILES_MENU_FILE", pathlib.Path.home() / constants.RECENT_FILE_SOURCE_FILE_NAME)
+    )
+
+
+def _encode_columnar(data: dict) -> dict:
+    """Convert recent file data to separate lists for each field.
+
+    The paths are no longer object keys and the field names are only stored once, so the file is
+    smaller and quicker to parse. Frecency scores are only stored if any of the entries have one.
+
+    Args:
+        data: The recent file data.
+
+    Returns:
+        The columnar data.
+    """
+    result = {
+        constants.DATA_NAME__FORMAT: constants.COLUMNAR_FORMAT,
+        constants.DATA_NAME__PATHS: list(data),
+        constants.DATA_NAME__OPEN_TIMESTAMPS: [entry[constants.DATA_NAME__OPEN_TIMESTAMP] for entry in data.values()],
+        constants.DATA_NAME__SAVE_VERSIONS: [entry.get(constants.DATA_NAME__SAVE_VERSION) for entry in data.values()],
+    }
+
+    scores = [entry.get(constants.DATA_NAME__FRECENCY) for entry in data.values()]
+
+    if any(score is not None for score in scores):
+        result[constants.DATA_NAME__FRECENCIES] = scores
+
+    return result
+
 
 # Functions
 
 
+def archive_directory_path() -> pathlib.Path:
+    """Get the path for the archive directory.
+
+    The archive directory lives next to the source data file.
+
+    Returns:
+        The path for the archive directory.
+    """
+    source_path = source_file_path()
+
+    return source_path.with_name(f"{source_path.stem}{constants.ARCHIVE_DIRECTORY_SUFFIX}")
+
+
+def decode_data(content: bytes) -> Any:
+    """Decode the contents of a data file.
+
+    orjson is used if it is installed, otherwise the standard library. Columnar data is converted back
+    to recent file data, so files can be read whichever encoding they were written with.
+
+    Args:
+        content: The file contents.
+
+    Returns:
+        The decoded data.
+
+    Raises:
+        ValueError: If the contents are not valid.
+    """
+    data = orjson.loads(content) if orjson is not None else json.loads(content)
+
+    if isinstance(data, dict) and data.get(constants.DATA_NAME__FORMAT) == constants.COLUMNAR_FORMAT:
+        return _decode_columnar(data)
+
+    return data
+
+
+def encode_data(data: dict, encoding: str = constants.FILE_ENCODING__COMPACT) -> bytes:
+    """Encode data to be written to a data file.
+
+    Compact and columnar data is encoded with orjson if it is installed, otherwise the standard
+    library. Indented data always uses the standard library so the layout of the file is the same.
+
+    Args:
+        data: The data to encode.
+        encoding: The encoding to use. Columnar encoding is only supported for recent file data.
+
+    Returns:
+        The encoded data.
+    """
+    if encoding == constants.FILE_ENCODING__INDENTED:
+        return json.dumps(data, indent=4).encode()
+
+    if encoding == constants.FILE_ENCODING__COLUMNAR:
+        data = _encode_columnar(data)
+
+    if orjson is not None:
+        return orjson.dumps(data)
+
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
 def get_source_file_modification_time() -> float:
     """Get the modification timestamp of the source file.
 
@@ -23,10 +176,124 @@ def get_source_file_modification_time() -> float:
     return source_file_path().stat().st_mtime
 
 
-def read_file_data() -> dict:
-    """Read the recent file data fom disk."""
-    with source_file_path().open() as handle:
-        return json.load(handle)
+@contextlib.contextmanager
+def lock_file(path: pathlib.Path) -> Generator[None, None, None]:
+    """Context manager to hold an exclusive lock on a file while modifying it.
+
+    The lock is held on a separate hidden file next to the file so that the file itself can be
+    replaced while locked. Locking is not available on all platforms, in which case this does nothing.
+
+    Args:
+        path: The file to lock.
+    """
+    if fcntl is None:  # pragma: no cover
+        yield
+        return
+
+    lock_path = path.with_name(f".{path.name}.lock")
+
+    with lock_path.open("a") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+
+        try:
+            yield
+
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def missing_files_file_path() -> pathlib.Path:
+    """Get the path for the file recording when recent files were first found to be missing.
+
+    The file lives next to the source data file.
+
+    Returns:
+        The path for the missing files file.
+    """
+    source_path = source_file_path()
+
+    return source_path.with_name(f"{source_path.stem}{constants.MISSING_FILES_FILE_SUFFIX}")
+
+
+def project_key(root: str) -> str:
+    """Get the name used to store the recent file history of a project.
+
+    The name is a readable version of the root followed by a short hash of it, so roots which only
+    differ by characters which cannot be used in a name, such as ``/jobs/a_b`` and ``/jobs/a/b``, are
+    still stored separately.
+
+    Args:
+        root: The project root directory, using forward slashes.
+
+    Returns:
+        The project name.
+    """
+    root = root.rstrip("/") or root
+    name = re.sub(r"[^\w.-]+", "_", root).strip("_")
+    digest = hashlib.sha256(root.encode()).hexdigest()[:8]
+
+    return f"{name}-{digest}" if name else digest
+
+
+def project_names() -> list[str]:
+    """Get the names of the projects which have their own recent file history.
+
+    Returns:
+        The project names.
+    """
+    try:
+        return sorted(entry.name for entry in os.scandir(projects_directory_path()) if entry.is_dir())
+
+    except OSError:
+        return []
+
+
+def project_source_file_path(project: str | None) -> pathlib.Path:
+    """Get the path for the source data file of a project.
+
+    Each project has a directory within the projects directory, containing its source data file.
+
+    Args:
+        project: The project name, or None for the source data file which is not part of a project.
+
+    Returns:
+        The path for the source data file.
+    """
+    source_path = _default_source_file_path()
+
+    if project is None:
+        return source_path
+
+    return projects_directory_path() / project / source_path.name
+
+
+def projects_directory_path() -> pathlib.Path:
+    """Get the path for the directory containing the history of each project.
+
+    The projects directory lives next to the source data file.
+
+    Returns:
+        The path for the projects directory.
+    """
+    source_path = _default_source_file_path()
+
+    return source_path.with_name(f"{source_path.stem}{constants.PROJECTS_DIRECTORY_SUFFIX}")
+
+
+def read_file_data(path: pathlib.Path | None = None) -> dict:
+    """Read the recent file data fom disk.
+
+    Args:
+        path: The file to read. If None, the source file is read.
+
+    Returns:
+        The recent file data.
+    """
+    with timing.timed("filesystem.read"):
+        content = (path or source_file_path()).read_bytes()
+
+    with timing.timed("filesystem.parse"):
+        return decode_data(content)
 
 
 def source_file_path() -> pathlib.Path:
@@ -34,19 +301,49 @@ def source_file_path() -> pathlib.Path:
 
     This uses $HOUDINI_RECENT_FILES_MENU_FILE if it exists, otherwise $HOME/recent_houdini_files.json
 
+    If there is a current project, the source data file for the project is used instead, along with
+    the files which live next to it.
+
     Returns:
         The path for the source data file.
     """
-    return pathlib.Path(
-        os.environ.get("HOUDINI_RECENT_FILES_MENU_FILE", pathlib.Path.home() / constants.RECENT_FILE_SOURCE_FILE_NAME)
-    )
+    root = settings.project_root()
+
+    return project_source_file_path(project_key(root) if root is not None else None)
+
+
+def stat_cache_file_path() -> pathlib.Path:
+    """Get the path for the file status cache file.
 
+    The cache file lives next to the source data file.
 
-def write_file_data(data: dict) -> None:
+    Returns:
+        The path for the file status cache file.
+    """
+    source_path = source_file_path()
+
+    return source_path.with_name(f"{source_path.stem}{constants.STAT_CACHE_FILE_SUFFIX}")
+
+
+def write_file_data(
+    data: dict, path: pathlib.Path | None = None, encoding: str = constants.FILE_ENCODING__COMPACT
+) -> None:
     """Write the data to the disk file.
 
+    The data is written to a temporary file which is then moved into place, so that concurrent
+    readers never see a partial file.
+
     Args:
         data: The recent file data to write.
+        path: The file to write. If None, the source file is written.
+        encoding: The encoding to use. Columnar encoding is only supported for recent file data.
     """
-    with source_file_path().open(mode="w") as handle:
-        json.dump(data, handle, indent=4)
+    path = path or source_file_path()
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+    with timing.timed("filesystem.encode"):
+        content = encode_data(data, encoding)
+
+    with timing.timed("filesystem.write"):
+        temp_path.write_bytes(content)
+        temp_path.replace(path)
@@ -0,0 +1,135 @@
+"""Rank recent file data by frecency, which combines how often and how recently each file was opened.
+
+Each time a file is opened it adds to the file's score, and that contribution halves every half-life.
+Rather than decaying every score as time passes, each contribution is measured against a fixed
+reference time, the epoch, so an open at time ``t`` contributes ``exp(rate * t)`` and stored scores
+never need to be updated. Decaying all the scores to the current time would divide them by the same
+amount, so ordering by the stored scores is the same as ordering by the decayed ones.
+
+The scores are stored as natural logarithms so they do not overflow, and recording an open only
+needs the file's previous score.
+"""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import heapq
+import math
+from typing import TYPE_CHECKING
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Non-Public Functions
+
+
+def _log_add(first: float, second: float) -> float:
+    """Add two values stored as natural logarithms, without converting them back.
+
+    Args:
+        first: The logarithm of the first value.
+        second: The logarithm of the second value.
+
+    Returns:
+        The logarithm of the sum of the values.
+    """
+    high, low = (first, second) if first >= second else (second, first)
+
+    return high + math.log1p(math.exp(low - high))
+
+
+# Functions
+
+
+def add_scores(data: dict, get_entry: Callable[[str], dict | None]) -> dict:
+    """Add the frecency score of each entry being added, if files are ordered by frecency.
+
+    Each score is the entry's previous score with the new open added to it. An entry which has the
+    same open timestamp as the previous one has already been counted, so keeps the previous score.
+
+    Args:
+        data: The recent file data being added.
+        get_entry: Function which gets the currently stored entry for a path, if there is one.
+
+    Returns:
+        The recent file data with scores, or the data unchanged if files are ordered by recency.
+    """
+    if settings.order() != constants.ORDER__FRECENCY:
+        return data
+
+    rate = decay_rate()
+
+    scored = {}
+
+    for path, entry in data.items():
+        open_timestamp = entry[constants.DATA_NAME__OPEN_TIMESTAMP]
+        previous = get_entry(path)
+
+        if previous is None:
+            score = open_timestamp * rate
+
+        elif previous[constants.DATA_NAME__OPEN_TIMESTAMP] == open_timestamp:
+            score = get_score(previous, rate)
+
+        else:
+            score = _log_add(get_score(previous, rate), open_timestamp * rate)
+
+        scored[path] = {**entry, constants.DATA_NAME__FRECENCY: score}
+
+    return scored
+
+
+def decay_rate() -> float:
+    """Get the rate at which the contribution of opening a file decays.
+
+    Returns:
+        The decay rate, per second.
+    """
+    return math.log(2) / settings.frecency_half_life()
+
+
+def get_score(entry: dict, rate: float) -> float:
+    """Get the frecency score of an entry.
+
+    Entries which were added while files were ordered by recency have no score, or a score which does
+    not include the latest open, so a score is never less than that of the latest open alone.
+
+    Args:
+        entry: The entry data.
+        rate: The decay rate.
+
+    Returns:
+        The score, as a natural logarithm.
+    """
+    latest = entry[constants.DATA_NAME__OPEN_TIMESTAMP] * rate
+    score = entry.get(constants.DATA_NAME__FRECENCY)
+
+    return latest if score is None else max(score, latest)
+
+
+def top(data: dict, limit: int | None = None) -> dict:
+    """Get the entries with the highest frecency scores.
+
+    Only the returned entries need to be ordered so the data is not sorted in full when there is a
+    limit.
+
+    Args:
+        data: The recent file data.
+        limit: The number of entries to get, or None to get them all.
+
+    Returns:
+        The recent file data, ordered from highest to lowest score.
+    """
+    rate = decay_rate()
+
+    def key(item: tuple[str, dict]) -> float:
+        return get_score(item[1], rate)
+
+    if limit is None:
+        return dict(sorted(data.items(), key=key, reverse=True))
+
+    return dict(heapq.nlargest(limit, data.items(), key=key))
@@ -0,0 +1,107 @@
+"""Recent file data grouped by project or directory."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import posixpath
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, index
+
+# Classes
+
+
+class GroupIndex:
+    """Recent file data grouped by the directory the files are in.
+
+    Each group keeps its entries ordered by when they were opened, so listing the groups does not
+    need to look at their entries, and listing the entries in a group only looks at that group.
+
+    Args:
+        data: The initial recent file data.
+        depth: The number of directories below the root to group by, or 0 to group by each file's
+            parent directory.
+    """
+
+    def __init__(self, data: dict | None = None, depth: int = 0) -> None:
+        self.depth = depth
+        self._groups: dict[str, index.RecencyIndex] = {}
+        self._latest: dict[str, float] = {}
+
+        if data:
+            self.update(data)
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def files(self, group: str, limit: int | None = None) -> dict:
+        """Get the entries in a group.
+
+        Args:
+            group: The group to get the entries for.
+            limit: The number of entries to get, or None to get them all.
+
+        Returns:
+            The recent file data, ordered from most to least recently opened.
+        """
+        entries = self._groups.get(group)
+
+        if entries is None:
+            return {}
+
+        return entries.top(limit)
+
+    def groups(self) -> list[tuple[str, int]]:
+        """Get the groups.
+
+        Returns:
+            Each group and the number of entries in it, ordered from the group with the most to least
+            recently opened entry.
+        """
+        keys = sorted(self._latest, key=self._latest.__getitem__, reverse=True)
+
+        return [(key, len(self._groups[key])) for key in keys]
+
+    def update(self, data: dict) -> None:
+        """Add or update entries.
+
+        Args:
+            data: The recent file data to add.
+        """
+        for path, entry in data.items():
+            group = _get_group(path, self.depth)
+            timestamp = entry[constants.DATA_NAME__OPEN_TIMESTAMP]
+
+            entries = self._groups.get(group)
+
+            if entries is None:
+                entries = self._groups[group] = index.RecencyIndex()
+
+            entries.update({path: entry})
+
+            if timestamp > self._latest.get(group, float("-inf")):
+                self._latest[group] = timestamp
+
+
+# Non-Public Functions
+
+
+def _get_group(path: str, depth: int) -> str:
+    """Get the group a file path belongs to.
+
+    Args:
+        path: The file path.
+        depth: The number of directories below the root to group by, or 0 to group by the parent
+            directory.
+
+    Returns:
+        The group for the path.
+    """
+    directory = posixpath.dirname(path)
+
+    if depth <= 0:
+        return directory
+
+    # The first part is the root, which is empty for paths starting with "/", or a drive letter.
+    return "/".join(directory.split("/")[: depth + 1])
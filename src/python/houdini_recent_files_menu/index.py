@@ -0,0 +1,104 @@
+"""An ordered index of recent file data."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import bisect
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants
+
+# Classes
+
+
+class RecencyIndex:
+    """Recent file data kept ordered by open timestamp.
+
+    Adding or updating an entry finds its position in the order with a binary search rather than sorting
+    all the entries, and getting the most recently opened entries does not need to sort at all. Inserting
+    into or removing from the order is still linear in the number of entries, as the following entries are
+    shifted along, but that is a single memory move which is far cheaper than a sort for histories of this
+    size.
+
+    Args:
+        data: The initial recent file data.
+    """
+
+    def __init__(self, data: dict | None = None) -> None:
+        self._entries: dict[str, dict] = dict(data or {})
+        self._order: list[tuple[float, str]] = sorted(
+            (entry[constants.DATA_NAME__OPEN_TIMESTAMP], path) for path, entry in self._entries.items()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, path: str) -> None:
+        """Remove an entry if it exists.
+
+        Args:
+            path: The path of the entry to remove.
+        """
+        entry = self._entries.pop(path, None)
+
+        if entry is not None:
+            del self._order[bisect.bisect_left(self._order, (entry[constants.DATA_NAME__OPEN_TIMESTAMP], path))]
+
+    def get(self, path: str) -> dict | None:
+        """Get the entry for a path.
+
+        Args:
+            path: The path of the entry.
+
+        Returns:
+            The entry data, or None if there is no entry for the path.
+        """
+        return self._entries.get(path)
+
+    def top(self, limit: int | None = None) -> dict:
+        """Get the most recently opened entries.
+
+        Args:
+            limit: The number of entries to get, or None to get them all.
+
+        Returns:
+            The recent file data, ordered from most to least recently opened.
+        """
+        order = self._order if limit is None else self._order[len(self._order) - min(limit, len(self._order)) :]
+
+        return {path: self._entries[path] for _, path in reversed(order)}
+
+    def trim(self, limit: int) -> dict:
+        """Remove the least recently opened entries so there are no more than the limit.
+
+        Args:
+            limit: The number of entries to keep.
+
+        Returns:
+            The removed recent file data.
+        """
+        excess = len(self._order) - max(limit, 0)
+
+        if excess <= 0:
+            return {}
+
+        removed = {path: self._entries.pop(path) for _, path in self._order[:excess]}
+
+        del self._order[:excess]
+
+        return removed
+
+    def update(self, data: dict) -> None:
+        """Add or update entries.
+
+        Each entry takes O(log n) comparisons to position, and O(n) to shift the order along.
+
+        Args:
+            data: The recent file data to add.
+        """
+        for path, entry in data.items():
+            self._remove(path)
+
+            bisect.insort(self._order, (entry[constants.DATA_NAME__OPEN_TIMESTAMP], path))
+            self._entries[path] = entry
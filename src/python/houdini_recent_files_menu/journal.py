@@ -0,0 +1,190 @@
+"""Append-only journal storage for recent file data."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import json
+import os
+from typing import TYPE_CHECKING
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import filesystem, index
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable
+
+# Classes
+
+
+class Journal:
+    """An append-only journal of recent file records.
+
+    Each line of the journal is a JSON object in the same form as the standard source file data,
+    usually containing a single entry. Later records for a path replace earlier ones.
+
+    The journal remembers how far into the file it has read, so subsequent reads only need to parse
+    records which were appended since. If the file is replaced, for example by another session
+    compacting it, it will be read again from the start. The records read are kept ordered by open
+    timestamp.
+
+    Args:
+        path: The path of the journal file.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+
+        self._index = index.RecencyIndex()
+        self._file_id: tuple[int, int] | None = None
+        self._offset = 0
+
+    def _read_tail(self) -> None:
+        """Apply any records which have been appended since the last read."""
+        try:
+            handle = self.path.open("rb")
+
+        except FileNotFoundError:
+            self._index = index.RecencyIndex()
+            self._file_id = None
+            self._offset = 0
+            return
+
+        with handle:
+            stat = os.fstat(handle.fileno())
+            file_id = (stat.st_dev, stat.st_ino)
+
+            # The file has been replaced or truncated so start over.
+            if file_id != self._file_id or stat.st_size < self._offset:
+                self._index = index.RecencyIndex()
+                self._file_id = file_id
+                self._offset = 0
+
+            if stat.st_size == self._offset:
+                return
+
+            handle.seek(self._offset)
+            chunk = handle.read()
+
+        # Only consume complete lines; a partial trailing line is still being written.
+        end = chunk.rfind(b"\n") + 1
+
+        for line in chunk[:end].splitlines():
+            try:
+                self._index.update(json.loads(line))
+
+            # Skip any damaged records rather than losing the whole history.
+            except (AttributeError, KeyError, TypeError, ValueError):
+                continue
+
+        self._offset += end
+
+    def _replace(self, data: dict) -> None:
+        """Replace the contents of the journal, which must already be locked.
+
+        The new journal is written to a temporary file and moved into place so that concurrent
+        readers never see a partial file.
+
+        Args:
+            data: The recent file data the journal should contain.
+        """
+        temp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+
+        contents = "".join(json.dumps({path: entry}, separators=(",", ":")) + "\n" for path, entry in data.items())
+        encoded = contents.encode("utf-8")
+
+        with temp_path.open("wb") as handle:
+            handle.write(encoded)
+            stat = os.fstat(handle.fileno())
+
+        temp_path.replace(self.path)
+
+        # The written data is already known, so there is no need to read it back in. Any records
+        # appended after the replacement will be picked up by the next read.
+        self._index = index.RecencyIndex(data)
+        self._file_id = (stat.st_dev, stat.st_ino)
+        self._offset = len(encoded)
+
+    def append(self, data: dict) -> None:
+        """Append a record to the journal.
+
+        Args:
+            data: The recent file data to record.
+        """
+        record = json.dumps(data, separators=(",", ":")) + "\n"
+
+        with filesystem.lock_file(self.path), self.path.open("a", encoding="utf-8") as handle:
+            handle.write(record)
+
+    def compact(self, data: dict) -> None:
+        """Replace the contents of the journal.
+
+        Any records in the journal which have not been read are discarded, so to keep them use
+        rewrite() instead.
+
+        Args:
+            data: The recent file data the journal should contain.
+        """
+        with filesystem.lock_file(self.path):
+            self._replace(data)
+
+    def exists(self) -> bool:
+        """Check whether the journal file exists.
+
+        Returns:
+            Whether the journal file exists.
+        """
+        return self.path.exists()
+
+    def get(self, path: str) -> dict | None:
+        """Get the current entry for a path from the journal.
+
+        Args:
+            path: The path of the entry.
+
+        Returns:
+            The entry data, or None if there is no entry for the path.
+        """
+        self._read_tail()
+
+        return self._index.get(path)
+
+    def read(self, limit: int | None = None) -> dict:
+        """Read the current recent file data from the journal.
+
+        Args:
+            limit: Only read this many of the most recently opened entries.
+
+        Returns:
+            The recent file data, ordered from most to least recently opened.
+        """
+        self._read_tail()
+
+        return self._index.top(limit)
+
+    def rewrite(self, update: Callable[[dict], dict]) -> None:
+        """Replace the contents of the journal with an update of its current data.
+
+        The journal is locked from reading the current data until it has been replaced, so records
+        appended by other sessions in between are never lost.
+
+        Args:
+            update: Function which is given the current recent file data and returns the data the
+                journal should contain.
+        """
+        with filesystem.lock_file(self.path):
+            self._read_tail()
+            self._replace(update(self._index.top()))
+
+    def size(self) -> int:
+        """Get the size of the journal file.
+
+        Returns:
+            The size of the journal file in bytes, or 0 if it does not exist.
+        """
+        try:
+            return self.path.stat().st_size
+
+        except FileNotFoundError:
+            return 0
@@ -0,0 +1,58 @@
+"""Rendering of column aligned menu labels."""
+
+# Future
+from __future__ import annotations
+
+# Classes
+
+
+class LabelTable:
+    """Columns of text rendered as aligned menu labels.
+
+    The output matches that of tabulate's "plain" table format for text columns: each cell is
+    stripped of surrounding whitespace, left aligned to the width of its column, columns are
+    separated by two spaces and trailing whitespace is removed. Column widths are updated as rows
+    are added so rendering is a single pass over the rows.
+    """
+
+    separator = "  "
+    """The string separating columns."""
+
+    def __init__(self) -> None:
+        self._rows: list[tuple[str, ...]] = []
+        self._widths: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add_row(self, *cells: str) -> None:
+        """Add a row to the table.
+
+        Args:
+            *cells: The text of each column.
+        """
+        row = tuple(cell.strip() for cell in cells)
+        widths = self._widths
+
+        for idx, cell in enumerate(row):
+            if idx == len(widths):
+                widths.append(len(cell))
+
+            elif len(cell) > widths[idx]:
+                widths[idx] = len(cell)
+
+        self._rows.append(row)
+
+    def render(self) -> list[str]:
+        """Render the rows as aligned labels.
+
+        Returns:
+            The label for each row.
+        """
+        widths = self._widths
+        separator = self.separator
+
+        return [
+            separator.join(cell.ljust(width) for cell, width in zip(row, widths, strict=False)).rstrip()
+            for row in self._rows
+        ]
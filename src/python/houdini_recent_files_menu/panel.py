@@ -0,0 +1,464 @@
+"""A dockable Python panel listing the recent files, which stays responsive with very long lists."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import array
+import datetime
+import itertools
+from typing import TYPE_CHECKING, Any
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import api, constants, settings, timing
+
+# Houdini
+import hou
+
+try:
+    from PySide6 import QtCore, QtWidgets
+
+except ImportError:  # pragma: no cover
+    from PySide2 import QtCore, QtWidgets
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_COLUMN__PATH = 0
+_COLUMN__VERSION = 1
+_COLUMN__OPENED = 2
+_COLUMN__EXISTS = 3
+
+_HEADERS = ("Path", "Version", "Opened", "Exists")
+"""The header label for each column."""
+
+_EXISTS_LABELS = {True: "Yes", False: "No", None: "Unknown"}
+"""The label for whether each file exists on disk."""
+
+# Classes
+
+
+class RecentFilesModel(QtCore.QAbstractTableModel):
+    """A table model of the recent files which only formats the rows being displayed.
+
+    The files are never copied into rows of text. Instead the model keeps the order of the rows as an
+    array of indices into the list of files, which is sorted and filtered using the values of each
+    file. Cells are formatted when the view asks for them, which it only does for the rows which are
+    visible, and formatted paths are kept as collapsing the variables in them is relatively slow.
+
+    Args:
+        parent: The parent object.
+    """
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+
+        self._files: list[api.RecentFile] = []
+        self._generation = 0
+        self._display_key: tuple = ()
+        self._display_paths: dict[str, str] = {}
+        self._folded_paths: list[str] | None = None
+        self._order = array.array("I")
+        self._rows = array.array("I")
+        self._sort_column = _COLUMN__OPENED
+        self._sort_order = QtCore.Qt.SortOrder.DescendingOrder
+        self._terms: list[str] = []
+
+    def _filter_rows(self, candidates: array.array | None = None) -> array.array:
+        """Get the indices of the files matching the filter, in the sorted order.
+
+        Args:
+            candidates: The indices of the only files which can match, in the sorted order, or None to
+                check every file.
+
+        Returns:
+            The index of the file displayed in each row.
+        """
+        if candidates is None:
+            candidates = self._order
+
+        if not self._terms:
+            return array.array("I", candidates)
+
+        folded_paths = self._get_folded_paths()
+
+        return array.array("I", (idx for idx in candidates if all(term in folded_paths[idx] for term in self._terms)))
+
+    def _format_cell(self, recent_file: api.RecentFile, column: int) -> str:
+        """Format the text displayed for a file in a column.
+
+        Args:
+            recent_file: The file to format.
+            column: The column to format.
+
+        Returns:
+            The text to display.
+        """
+        if column == _COLUMN__PATH:
+            display = self._display_paths.get(recent_file.posix_path)
+
+            if display is None:
+                # Only the recently displayed paths are kept, however far the list is scrolled.
+                if len(self._display_paths) >= constants.PANEL_DISPLAY_CACHE_SIZE:
+                    self._display_paths.clear()
+
+                display = hou.text.collapseCommonVars(recent_file.posix_path, vars=constants.VARS_TO_COLLAPSE)
+                self._display_paths[recent_file.posix_path] = display
+
+            return display
+
+        if column == _COLUMN__VERSION:
+            return recent_file.save_version or ""
+
+        if column == _COLUMN__OPENED:
+            dt = datetime.datetime.fromtimestamp(recent_file.open_timestamp)
+
+            return dt.strftime(constants.TIMESTAMP_FORMAT)
+
+        return _EXISTS_LABELS[recent_file.exists]
+
+    def _get_folded_paths(self) -> list[str]:
+        """Get the case folded path of each file, which filtering and sorting by path compare.
+
+        Returns:
+            The folded paths.
+        """
+        if self._folded_paths is None:
+            self._folded_paths = [recent_file.posix_path.casefold() for recent_file in self._files]
+
+        return self._folded_paths
+
+    def _get_sort_key(self) -> Callable[[int], Any]:
+        """Get the function giving the value each file is sorted by in the current sort column.
+
+        The values for every file are found once up front, so sorting only compares plain values.
+
+        Returns:
+            The sort key function, taking the index of a file.
+        """
+        if self._sort_column == _COLUMN__PATH:
+            return self._get_folded_paths().__getitem__
+
+        if self._sort_column == _COLUMN__VERSION:
+            # There are far fewer versions than files so each is only parsed once.
+            version_keys = {
+                version: _get_version_key(version)
+                for version in {recent_file.save_version for recent_file in self._files}
+            }
+
+            return [version_keys[recent_file.save_version] for recent_file in self._files].__getitem__
+
+        if self._sort_column == _COLUMN__EXISTS:
+            return [
+                (recent_file.exists is not None, bool(recent_file.exists)) for recent_file in self._files
+            ].__getitem__
+
+        return [recent_file.open_timestamp for recent_file in self._files].__getitem__
+
+    def _sort_files(self) -> array.array:
+        """Get the indices of all the files in the current sort order.
+
+        Files with the same value keep their order, from most to least recently opened.
+
+        Returns:
+            The sorted file indices.
+        """
+        with timing.timed("panel.sort"):
+            return array.array(
+                "I",
+                sorted(
+                    range(len(self._files)),
+                    key=self._get_sort_key(),
+                    reverse=self._sort_order == QtCore.Qt.SortOrder.DescendingOrder,
+                ),
+            )
+
+    def columnCount(self, parent: QtCore.QModelIndex | None = None) -> int:  # ruff: ignore[no-self-use]
+        """Get the number of columns.
+
+        Args:
+            parent: The parent index, which is invalid for the table itself.
+
+        Returns:
+            The number of columns.
+        """
+        return 0 if parent is not None and parent.isValid() else len(_HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> Any:
+        """Get the data for a cell.
+
+        Args:
+            index: The cell.
+            role: The type of data to get.
+
+        Returns:
+            The data, or None if there is none.
+        """
+        if not index.isValid():
+            return None
+
+        recent_file = self._files[self._rows[index.row()]]
+
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self._format_cell(recent_file, index.column())
+
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            return recent_file.posix_path
+
+        return None
+
+    def file_path(self, row: int) -> str:
+        """Get the path of the file in a row.
+
+        Args:
+            row: The row.
+
+        Returns:
+            The path of the file, using forward slashes.
+        """
+        return self._files[self._rows[row]].posix_path
+
+    def headerData(  # ruff: ignore[no-self-use]
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Get the header label for a column.
+
+        Args:
+            section: The column.
+            orientation: The header orientation.
+            role: The type of data to get.
+
+        Returns:
+            The header label, or None for any other data.
+        """
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return _HEADERS[section]
+
+        return None
+
+    def refresh(self) -> None:
+        """Refresh the list of files, if it has changed since it was last displayed."""
+        manager = api.RecentFileManager()
+        manager.refresh_data()
+
+        display_key = tuple(hou.text.expandString(var) for var in constants.VARS_TO_COLLAPSE)
+
+        if manager.generation == self._generation and display_key == self._display_key:
+            return
+
+        self.beginResetModel()
+
+        self._files = manager.files
+        self._generation = manager.generation
+
+        # The collapsed paths depend on the values of the variables, such as $HIP.
+        if display_key != self._display_key:
+            self._display_paths.clear()
+            self._display_key = display_key
+
+        self._folded_paths = None
+        self._order = self._sort_files()
+        self._rows = self._filter_rows()
+
+        self.endResetModel()
+
+    def rowCount(self, parent: QtCore.QModelIndex | None = None) -> int:
+        """Get the number of rows.
+
+        Args:
+            parent: The parent index, which is invalid for the table itself.
+
+        Returns:
+            The number of files matching the filter.
+        """
+        return 0 if parent is not None and parent.isValid() else len(self._rows)
+
+    def set_filter(self, text: str) -> None:
+        """Only display the files whose path contains every word in some text.
+
+        Matching ignores case, and the words can appear anywhere in the path in any order.
+
+        Args:
+            text: The text to filter by.
+        """
+        terms = text.casefold().split()
+
+        if terms == self._terms:
+            return
+
+        # When the words have only been added to, such as while typing, only the files which already
+        # matched can still match.
+        narrowed = all(any(term in new_term for new_term in terms) for term in self._terms)
+
+        self.beginResetModel()
+
+        self._terms = terms
+
+        with timing.timed("panel.filter"):
+            self._rows = self._filter_rows(self._rows if narrowed else None)
+
+        self.endResetModel()
+
+    def sort(self, column: int, order: QtCore.Qt.SortOrder = QtCore.Qt.SortOrder.AscendingOrder) -> None:
+        """Sort the files by a column.
+
+        Files are compared by their values rather than the displayed text, for example so versions
+        and timestamps are in numerical order.
+
+        Args:
+            column: The column to sort by.
+            order: The sort order.
+        """
+        self.layoutAboutToBeChanged.emit()
+
+        persistent_indexes = self.persistentIndexList()
+        persistent_files = [self._rows[index.row()] for index in persistent_indexes]
+
+        self._sort_column = column
+        self._sort_order = order
+        self._order = self._sort_files()
+        self._rows = self._filter_rows()
+
+        # Keep any selected rows pointing at the same files.
+        if persistent_indexes:
+            rows = {file_idx: row for row, file_idx in enumerate(self._rows)}
+
+            self.changePersistentIndexList(
+                persistent_indexes,
+                [
+                    self.index(rows[file_idx], index.column())
+                    for index, file_idx in zip(persistent_indexes, persistent_files, strict=True)
+                ],
+            )
+
+        self.layoutChanged.emit()
+
+
+class RecentFilesPanel(QtWidgets.QWidget):
+    """A panel listing the recent files, which can be filtered and sorted.
+
+    Double-clicking a file opens it. The list is refreshed while the panel is visible so files opened
+    in other sessions are included.
+
+    Args:
+        parent: The parent widget.
+    """
+
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        super().__init__(parent)
+
+        self.model = RecentFilesModel(self)
+
+        self._filter_edit = QtWidgets.QLineEdit(self)
+        self._filter_edit.setPlaceholderText("Filter by path")
+        self._filter_edit.setClearButtonEnabled(True)
+
+        # Wait until typing has stopped rather than filtering after every key.
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(constants.PANEL_FILTER_DELAY)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self._filter_edit.textChanged.connect(self._filter_timer.start)
+
+        self._view = QtWidgets.QTableView(self)
+        self._view.setModel(self.model)
+        self._view.setAlternatingRowColors(True)
+        self._view.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._view.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        self._view.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self._view.setShowGrid(False)
+        self._view.setWordWrap(False)
+        self._view.doubleClicked.connect(self._open_file)
+
+        # Sizing the rows or columns to their contents would format every row, so fixed sizes are used.
+        self._view.verticalHeader().setVisible(False)
+        self._view.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+
+        header = self._view.horizontalHeader()
+        header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(_COLUMN__PATH, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        header.setStretchLastSection(False)
+
+        self._view.setSortingEnabled(True)
+        self._view.sortByColumn(_COLUMN__OPENED, QtCore.Qt.SortOrder.DescendingOrder)
+
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setInterval(int(settings.poll_interval() * 1000))
+        self._refresh_timer.timeout.connect(self.model.refresh)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self._filter_edit)
+        layout.addWidget(self._view)
+
+    def _apply_filter(self) -> None:
+        """Filter the files by the entered text."""
+        self.model.set_filter(self._filter_edit.text())
+
+    def _open_file(self, index: QtCore.QModelIndex) -> None:
+        """Open the file which was double-clicked.
+
+        Args:
+            index: The cell which was double-clicked.
+        """
+        hou.hipFile.load(self.model.file_path(index.row()))
+
+    def hideEvent(self, event: Any) -> None:
+        """Stop refreshing the list while the panel is hidden.
+
+        Args:
+            event: The hide event.
+        """
+        self._refresh_timer.stop()
+
+        super().hideEvent(event)
+
+    def showEvent(self, event: Any) -> None:
+        """Refresh the list when the panel is shown, then periodically while it is visible.
+
+        Args:
+            event: The show event.
+        """
+        self.model.refresh()
+        self._refresh_timer.start()
+
+        super().showEvent(event)
+
+
+# Non-Public Functions
+
+
+def _get_version_key(version: str | None) -> tuple[int, ...]:
+    """Get a value which sorts Houdini versions in numerical order.
+
+    Args:
+        version: The Houdini version, such as "20.5.123".
+
+    Returns:
+        The numbers in the version.
+    """
+    if not version:
+        return ()
+
+    return tuple(int(part) for part in itertools.takewhile(str.isdigit, version.split(".")))
+
+
+# Functions
+
+
+def create_panel() -> RecentFilesPanel:
+    """Create the recent files panel, for the Python panel interface.
+
+    Returns:
+        The panel widget.
+    """
+    return RecentFilesPanel()
+
+
+def show_panel() -> None:
+    """Show the recent files panel in a new floating pane."""
+    pane_tab = hou.ui.curDesktop().createFloatingPaneTab(hou.paneTabType.PythonPanel)
+    pane_tab.setActiveInterface(hou.pypanel.interfaceByName(constants.PANEL_INTERFACE_NAME))
@@ -0,0 +1,177 @@
+"""Read the most recently opened files ahead of time so reopening them is not limited by slow storage."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import functools
+import os
+import threading
+from typing import TYPE_CHECKING
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, settings, threads, timing
+
+if TYPE_CHECKING:
+    import concurrent.futures
+    import io
+    import pathlib
+    from collections.abc import Iterable
+
+    from houdini_recent_files_menu import api
+
+# Classes
+
+
+class Prefetcher:
+    """Read recent files into the operating system's page cache in the background.
+
+    Each file is only read again if its size or modification time has changed since it was last read,
+    and once the budget has been used up nothing more is read.
+
+    Args:
+        budget: The maximum total number of bytes to read.
+        max_workers: The maximum number of files to read at a time.
+    """
+
+    def __init__(self, budget: int, max_workers: int) -> None:
+        self.budget = budget
+        self._pool = threads.DaemonThreadPool(max_workers, "recent_files_prefetch")
+        self._prefetched: dict[str, tuple[int, float | None]] = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, recent_files: Iterable[api.RecentFile], mode: str) -> list[concurrent.futures.Future[int]]:
+        """Start reading the most recently opened files which exist and are small enough.
+
+        Files which are not known to exist, or whose size is not known, are skipped.
+
+        Args:
+            recent_files: The recent files, ordered from most to least recently opened.
+            mode: The prefetch mode.
+
+        Returns:
+            The futures for the files being read, which give the number of bytes read.
+        """
+        count = settings.prefetch_count()
+        max_size = settings.prefetch_max_size()
+
+        futures = []
+
+        with self._lock:
+            for recent_file in recent_files:
+                if count <= 0:
+                    break
+
+                if not recent_file.exists or recent_file.size is None or recent_file.size > max_size:
+                    continue
+
+                count -= 1
+
+                signature = (recent_file.size, recent_file.modified)
+
+                if self._prefetched.get(recent_file.posix_path) == signature or recent_file.size > self.budget:
+                    continue
+
+                self.budget -= recent_file.size
+                self._prefetched[recent_file.posix_path] = signature
+
+                futures.append(self._pool.submit(_read_ahead, recent_file.path, mode))
+
+        return futures
+
+
+# Non-Public Functions
+
+
+def _advise_will_need(handle: io.FileIO) -> int:
+    """Ask the operating system to read a whole file into the page cache in the background.
+
+    Args:
+        handle: The open file.
+
+    Returns:
+        The number of bytes requested to be read.
+    """
+    size = os.fstat(handle.fileno()).st_size
+    os.posix_fadvise(handle.fileno(), 0, size, os.POSIX_FADV_WILLNEED)
+
+    return size
+
+
+@functools.cache
+def _get_prefetcher() -> Prefetcher:
+    """Get the prefetcher for the session.
+
+    The same object is returned each time so the budget covers the whole session.
+
+    Returns:
+        The prefetcher.
+    """
+    return Prefetcher(settings.prefetch_budget(), constants.PREFETCH_MAX_WORKERS)
+
+
+@timing.timed("prefetch.read_ahead")
+def _read_ahead(path: pathlib.Path, mode: str) -> int:
+    """Read a file into the page cache.
+
+    In advise mode the operating system is asked to read the file in the background, which returns
+    without waiting for it. If that is not supported, or in read mode, the file is read and discarded,
+    which works with any filesystem.
+
+    Args:
+        path: The file to read.
+        mode: The prefetch mode.
+
+    Returns:
+        The number of bytes read, or requested to be read.
+    """
+    try:
+        with path.open("rb", buffering=0) as handle:
+            if mode == constants.PREFETCH_MODE__ADVISE and hasattr(os, "posix_fadvise"):
+                return _advise_will_need(handle)
+
+            return _read_all(handle)
+
+    except OSError:
+        return 0
+
+
+def _read_all(handle: io.FileIO) -> int:
+    """Read the rest of a file, discarding the contents.
+
+    The same buffer is reused for each chunk so reading does not create any objects.
+
+    Args:
+        handle: The open file, without buffering.
+
+    Returns:
+        The number of bytes read.
+    """
+    buffer = bytearray(constants.PREFETCH_CHUNK_SIZE)
+    total = 0
+
+    while read := handle.readinto(buffer):
+        total += read
+
+    return total
+
+
+# Functions
+
+
+def prefetch_files(recent_files: Iterable[api.RecentFile]) -> list[concurrent.futures.Future[int]]:
+    """Start reading the most recently opened files ahead of time, if enabled.
+
+    Args:
+        recent_files: The recent files, ordered from most to least recently opened.
+
+    Returns:
+        The futures for the files being read, which give the number of bytes read. This is empty if
+        prefetching is disabled.
+    """
+    mode = settings.prefetch_mode()
+
+    if mode is None:
+        return []
+
+    return _get_prefetcher().prefetch(recent_files, mode)
@@ -0,0 +1,169 @@
+"""Find recent file entries whose files have been missing for long enough to be removed."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import collections
+import concurrent.futures
+import functools
+import os
+import pathlib
+import time
+from typing import TYPE_CHECKING
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, filesystem, settings, threads, timing
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Non-Public Functions
+
+
+def _find_missing(directory: pathlib.Path, names: frozenset[str]) -> frozenset[str]:
+    """Find which files in a directory no longer exist.
+
+    The directory is listed once rather than checking each file.
+
+    Args:
+        directory: The directory containing the files.
+        names: The names of the files to check.
+
+    Returns:
+        The names of the files which do not exist.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            existing = {entry.name for entry in entries}
+
+    except (FileNotFoundError, NotADirectoryError):
+        return names
+
+    return names - existing
+
+
+@functools.cache
+def _get_prune_pool() -> threads.DaemonThreadPool:
+    """Get the thread pool used to check for missing files.
+
+    It is separate to the pool used when building the menu so that checking the whole list never
+    delays that.
+
+    Returns:
+        The thread pool.
+    """
+    return threads.DaemonThreadPool(settings.prune_max_workers(), "recent_files_prune")
+
+
+def _read_missing_since(path: pathlib.Path) -> dict[str, float]:
+    """Read when each file was first found to be missing.
+
+    A missing or unreadable file results in nothing being recorded.
+
+    Args:
+        path: The file to read.
+
+    Returns:
+        The time each file was first found to be missing.
+    """
+    try:
+        data = filesystem.read_file_data(path)
+
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict):
+        return {}
+
+    return {file_path: since for file_path, since in data.items() if isinstance(since, (float, int))}
+
+
+# Functions
+
+
+def check_missing(paths: Iterable[str], timeout: float = constants.PRUNE_TIMEOUT) -> dict[str, bool]:
+    """Check whether each of the files is missing.
+
+    Files are grouped by their parent directory and each directory is listed once, in parallel, with at
+    most the configured number of directories listed at a time. Files in directories which could not
+    be listed in time, or at all, such as on a hung network mount, are left out of the result.
+
+    Args:
+        paths: The files to check.
+        timeout: The maximum number of seconds to wait.
+
+    Returns:
+        Whether each file is missing.
+    """
+    grouped: dict[str, set[str]] = collections.defaultdict(set)
+
+    for path in paths:
+        directory, _, name = path.rpartition("/")
+        grouped[directory].add(name)
+
+    pool = _get_prune_pool()
+
+    futures = {
+        directory: pool.submit(_find_missing, pathlib.Path(directory or "/"), frozenset(names))
+        for directory, names in grouped.items()
+    }
+
+    concurrent.futures.wait(futures.values(), timeout=timeout)
+
+    result = {}
+
+    for directory, future in futures.items():
+        if not future.done() or future.exception() is not None:
+            continue
+
+        missing = future.result()
+
+        for name in grouped[directory]:
+            result[f"{directory}/{name}"] = name in missing
+
+    return result
+
+
+@timing.timed("prune.find_prunable_entries")
+def find_prunable_entries(data: dict, now: float | None = None) -> dict:
+    """Find the entries whose files have been missing for longer than the grace period.
+
+    When each file was first found to be missing is recorded next to the source file, so the grace
+    period covers every session. Files which are found again are forgotten, and files which could not
+    be checked keep their previous record.
+
+    Args:
+        data: The recent file data to check.
+        now: The current time, or None to use the system time.
+
+    Returns:
+        The recent file data which can be removed.
+    """
+    if now is None:
+        now = time.time()
+
+    record_path = filesystem.missing_files_file_path()
+    previous = _read_missing_since(record_path)
+
+    missing = check_missing(data)
+
+    missing_since = {}
+
+    for path in data:
+        is_missing = missing.get(path)
+
+        if is_missing or (is_missing is None and path in previous):
+            missing_since[path] = previous.get(path, now)
+
+    grace_period = settings.prune_grace_period()
+
+    prunable = {path: data[path] for path, since in missing_since.items() if now - since >= grace_period}
+
+    for path in prunable:
+        del missing_since[path]
+
+    if missing_since != previous:
+        filesystem.write_file_data(missing_since, record_path)
+
+    return prunable
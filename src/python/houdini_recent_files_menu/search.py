@@ -0,0 +1,238 @@
+"""An in-memory index for searching the recent file history."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import array
+import itertools
+from typing import TYPE_CHECKING
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_BATCH_SIZE = 256
+"""The number of candidate entries checked at a time when searching."""
+
+_NGRAM_SIZE = 3
+"""The length of the substrings which are indexed."""
+
+# Classes
+
+
+class SearchIndex:
+    """An n-gram index of recent file paths.
+
+    Every substring of _NGRAM_SIZE characters of each path maps to the ids of the entries containing
+    it. Ids are given out in the order entries are added, so more recently opened entries have
+    higher ids, and each id list is kept in that order by only ever being appended to.
+
+    A search only needs to check the entries in the shortest id list out of all the n-grams in the
+    query, starting with the most recent, and can stop as soon as it has enough matches. Entries added
+    from other sessions may have been opened before ones which are already indexed, so the matches are
+    ordered by when they were opened before the limit is applied.
+
+    Entries which are updated are given a new id, leaving the old one unused until enough have
+    built up that the index is rebuilt.
+
+    Args:
+        data: The initial recent file data.
+    """
+
+    def __init__(self, data: dict | None = None) -> None:
+        self._paths: list[str | None] = []
+        self._entries: list[dict] = []
+        self._folded_paths: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._postings: dict[str, array.array] = {}
+
+        if data:
+            self.update(data)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _add(self, path: str, entry: dict) -> None:
+        """Add an entry with a new id.
+
+        Args:
+            path: The file path.
+            entry: The file data.
+        """
+        entry_id = len(self._paths)
+        folded_path = path.casefold()
+
+        self._paths.append(path)
+        self._entries.append(entry)
+        self._folded_paths.append(folded_path)
+        self._ids[path] = entry_id
+
+        for ngram in _get_ngrams(folded_path):
+            ids = self._postings.get(ngram)
+
+            if ids is None:
+                self._postings[ngram] = array.array("I", (entry_id,))
+
+            else:
+                ids.append(entry_id)
+
+    def _get_candidates(self, terms: list[str]) -> Sequence[int]:
+        """Get the ids of the entries which might match the search terms.
+
+        Args:
+            terms: The folded search terms.
+
+        Returns:
+            The candidate ids, from least to most recent.
+        """
+        ngrams = set().union(*(_get_ngrams(term) for term in terms))
+
+        # Terms which are too short to be indexed have to be checked against every entry.
+        if not ngrams:
+            return range(len(self._paths))
+
+        postings = []
+
+        for ngram in ngrams:
+            ids = self._postings.get(ngram)
+
+            # Nothing contains this n-gram so nothing can match.
+            if ids is None:
+                return ()
+
+            postings.append(ids)
+
+        return min(postings, key=len)
+
+    def _rebuild(self) -> None:
+        """Rebuild the index from the current entries, discarding any unused ids."""
+        entries = [(path, entry) for path, entry in zip(self._paths, self._entries, strict=True) if path is not None]
+
+        self._paths = []
+        self._entries = []
+        self._folded_paths = []
+        self._ids = {}
+        self._postings = {}
+
+        for path, entry in entries:
+            self._add(path, entry)
+
+    def search(self, query: str, limit: int | None = None) -> dict:
+        """Search for entries whose path contains every word in the query.
+
+        Matching ignores case, and the words can appear anywhere in the path in any order.
+
+        Args:
+            query: The search query.
+            limit: The maximum number of matches, or None to find them all.
+
+        Returns:
+            The matching recent file data, ordered from most to least recently opened.
+        """
+        terms = _get_terms(query)
+
+        if not terms or limit == 0:
+            return {}
+
+        candidates = self._get_candidates(terms)
+        matches: dict[str, dict] = {}
+
+        # Candidates are checked in batches, from the most recent, so that checking them stays fast but
+        # it can stop once there are enough matches. Unused ids never match as their path is empty.
+        for end in range(len(candidates), 0, -_BATCH_SIZE):
+            batch = candidates[max(end - _BATCH_SIZE, 0) : end]
+
+            for term in terms:
+                batch = [entry_id for entry_id in batch if term in self._folded_paths[entry_id]]
+
+            for entry_id in reversed(batch):
+                matches[self._paths[entry_id]] = self._entries[entry_id]  # type: ignore[index]
+
+            if limit is not None and len(matches) >= limit:
+                break
+
+        ordered = sorted(matches.items(), key=lambda item: item[1][constants.DATA_NAME__OPEN_TIMESTAMP], reverse=True)
+
+        return dict(ordered[:limit])
+
+    def update(self, data: dict) -> None:
+        """Add or update entries.
+
+        Entries which are no more recent than the ones already indexed are ignored.
+
+        Args:
+            data: The recent file data to add.
+        """
+        for path, entry in sorted(data.items(), key=lambda item: item[1][constants.DATA_NAME__OPEN_TIMESTAMP]):
+            entry_id = self._ids.get(path)
+
+            if entry_id is not None:
+                timestamp = self._entries[entry_id][constants.DATA_NAME__OPEN_TIMESTAMP]
+
+                if timestamp >= entry[constants.DATA_NAME__OPEN_TIMESTAMP]:
+                    continue
+
+                # The old id is left in the n-gram lists but no longer refers to anything.
+                self._paths[entry_id] = None
+                self._folded_paths[entry_id] = ""
+
+            self._add(path, entry)
+
+        if len(self._paths) > 2 * len(self._ids):
+            self._rebuild()
+
+
+# Non-Public Functions
+
+
+def _get_ngrams(text: str) -> set[str]:
+    """Get the unique n-grams in some text.
+
+    Args:
+        text: The text to get the n-grams for.
+
+    Returns:
+        The n-grams in the text.
+    """
+    return {text[idx : idx + _NGRAM_SIZE] for idx in range(len(text) - _NGRAM_SIZE + 1)}
+
+
+def _get_terms(query: str) -> list[str]:
+    """Get the terms to search for from a query.
+
+    Args:
+        query: The search query.
+
+    Returns:
+        The folded words in the query.
+    """
+    return query.casefold().split()
+
+
+# Functions
+
+
+def search_data(data: dict, query: str, limit: int | None = None) -> dict:
+    """Search recent file data for entries whose path contains every word in the query.
+
+    This checks each entry in turn, so is quicker than building a SearchIndex for a single search.
+
+    Args:
+        data: The recent file data, ordered from most to least recently opened.
+        query: The search query.
+        limit: The maximum number of matches, or None to find them all.
+
+    Returns:
+        The matching recent file data, ordered from most to least recently opened.
+    """
+    terms = _get_terms(query)
+
+    if not terms:
+        return {}
+
+    matches = ((path, entry) for path, entry in data.items() if all(term in path.casefold() for term in terms))
+
+    return dict(itertools.islice(matches, limit))
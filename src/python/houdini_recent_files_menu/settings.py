@@ -0,0 +1,452 @@
+"""Functions for reading user configurable settings from the environment."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import logging
+import os
+import pathlib
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants
+
+_LOGGER = logging.getLogger(__name__)
+"""Logger for settings which have invalid values."""
+
+# Non-Public Functions
+
+
+def _get_env_bool(name: str) -> bool:
+    """Get a boolean value from an environment variable.
+
+    Any value other than "", "0" or "off" is considered to be True.
+
+    Args:
+        name: The environment variable name.
+
+    Returns:
+        The setting value.
+    """
+    return os.environ.get(name, "").lower() not in {"", "0", "off"}
+
+
+def _get_env_float(name: str, default: float) -> float:
+    """Get a float value from an environment variable.
+
+    Args:
+        name: The environment variable name.
+        default: The value to use if the variable is not set or is not a valid number.
+
+    Returns:
+        The setting value.
+    """
+    try:
+        return float(os.environ[name])
+
+    except (KeyError, ValueError):
+        return default
+
+
+def _get_env_int(name: str, default: int) -> int:
+    """Get an integer value from an environment variable.
+
+    Args:
+        name: The environment variable name.
+        default: The value to use if the variable is not set or is not a valid integer.
+
+    Returns:
+        The setting value.
+    """
+    try:
+        return int(os.environ[name])
+
+    except (KeyError, ValueError):
+        return default
+
+
+# Functions
+
+
+def archive_enabled() -> bool:
+    """Get whether entries which no longer fit in the recent files list are archived.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_ARCHIVE, which enables archiving when set to any value other
+    than "", "0" or "off".
+
+    Returns:
+        Whether archiving is enabled.
+    """
+    return _get_env_bool(constants.ARCHIVE_VAR_NAME)
+
+
+def file_encoding() -> str:
+    """Get how the recent file data is encoded when written.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_ENCODING if it is set to a supported encoding, otherwise
+    constants.FILE_ENCODING__COMPACT.
+
+    Returns:
+        The file encoding.
+    """
+    encoding = os.environ.get(constants.FILE_ENCODING_VAR_NAME, "").lower()
+
+    if encoding in {
+        constants.FILE_ENCODING__COLUMNAR,
+        constants.FILE_ENCODING__COMPACT,
+        constants.FILE_ENCODING__INDENTED,
+    }:
+        return encoding
+
+    return constants.FILE_ENCODING__COMPACT
+
+
+def frecency_half_life() -> float:
+    """Get the time after which the contribution of opening a file to its frecency score has halved.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_FRECENCY_HALF_LIFE_DAYS if it is set, otherwise
+    constants.FRECENCY_HALF_LIFE_DAYS. The default is also used, with a warning, if the value is not
+    positive as scores could not be decayed with it.
+
+    Returns:
+        The half-life, in seconds.
+    """
+    days = _get_env_float(constants.FRECENCY_HALF_LIFE_DAYS_VAR_NAME, constants.FRECENCY_HALF_LIFE_DAYS)
+
+    if not days > 0:
+        _LOGGER.warning(
+            "$%s must be a positive number of days, using %s instead of %s",
+            constants.FRECENCY_HALF_LIFE_DAYS_VAR_NAME,
+            constants.FRECENCY_HALF_LIFE_DAYS,
+            days,
+        )
+        days = constants.FRECENCY_HALF_LIFE_DAYS
+
+    return days * 24 * 60 * 60
+
+
+def group_depth() -> int:
+    """Get the number of directories below the root which files are grouped by.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_GROUP_DEPTH if it is set, otherwise constants.GROUP_DEPTH. A
+    depth of 0 groups files by their parent directory.
+
+    Returns:
+        The group depth.
+    """
+    return _get_env_int(constants.GROUP_DEPTH_VAR_NAME, constants.GROUP_DEPTH)
+
+
+def journal_compact_size() -> int:
+    """Get the size, in bytes, the journal can grow to before it is compacted.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_JOURNAL_COMPACT_SIZE if it is set, otherwise
+    constants.JOURNAL_COMPACT_SIZE.
+
+    Returns:
+        The journal compaction size.
+    """
+    return _get_env_int(constants.JOURNAL_COMPACT_SIZE_VAR_NAME, constants.JOURNAL_COMPACT_SIZE)
+
+
+def max_display_files() -> int:
+    """Get the maximum number of entries to display in the menu.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_MAX_DISPLAY_FILES if it is set, otherwise
+    constants.MAX_DISPLAY_FILES.
+
+    Returns:
+        The maximum number of entries to display.
+    """
+    return _get_env_int(constants.MAX_DISPLAY_FILES_VAR_NAME, constants.MAX_DISPLAY_FILES)
+
+
+def max_recent_files() -> int:
+    """Get the maximum number of entries to keep.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_MAX_RECENT_FILES if it is set, otherwise
+    constants.MAX_RECENT_FILES.
+
+    Returns:
+        The maximum number of entries to keep.
+    """
+    return _get_env_int(constants.MAX_RECENT_FILES_VAR_NAME, constants.MAX_RECENT_FILES)
+
+
+def order() -> str:
+    """Get how the recent files are ordered.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_ORDER if it is set to a supported order, otherwise
+    constants.ORDER__RECENCY.
+
+    Returns:
+        The order.
+    """
+    value = os.environ.get(constants.ORDER_VAR_NAME, "").lower()
+
+    if value in {constants.ORDER__FRECENCY, constants.ORDER__RECENCY}:
+        return value
+
+    return constants.ORDER__RECENCY
+
+
+def path_map() -> tuple[tuple[str, str], ...]:
+    """Get the path prefixes which are replaced to make the canonical path of a file.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_PATH_MAP, a list of "from=to" pairs separated by the path
+    separator, for example "/net/jobs=/jobs:/mnt/jobs=/jobs". Pairs which are not valid are ignored.
+
+    Returns:
+        Pairs of path prefixes and the prefix to replace them with, in order.
+    """
+    pairs = []
+
+    for item in os.environ.get(constants.PATH_MAP_VAR_NAME, "").split(os.pathsep):
+        prefix, separator, replacement = item.partition("=")
+
+        if separator and prefix and replacement:
+            pairs.append((prefix, replacement))
+
+    return tuple(pairs)
+
+
+def poll_interval() -> float:
+    """Get the number of seconds between checks when polling the stored data for changes.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_POLL_INTERVAL if it is set, otherwise constants.POLL_INTERVAL.
+
+    Returns:
+        The polling interval.
+    """
+    return _get_env_float(constants.POLL_INTERVAL_VAR_NAME, constants.POLL_INTERVAL)
+
+
+def probe_timeout() -> float:
+    """Get the maximum number of seconds to wait for file status checks.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_PROBE_TIMEOUT if it is set, otherwise constants.PROBE_TIMEOUT.
+
+    Returns:
+        The file status check timeout.
+    """
+    return _get_env_float(constants.PROBE_TIMEOUT_VAR_NAME, constants.PROBE_TIMEOUT)
+
+
+def project_root() -> str | None:
+    """Get the root directory of the current project, which has its own recent file history.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_SHARD. If it is set to "job", or any other value which
+    enables it, the project root is $JOB. If it is set to a path prefix, such as "/jobs", the project
+    root is the directory directly below the prefix which contains $JOB.
+
+    Returns:
+        The project root, using forward slashes, or None if there is no current project.
+    """
+    shard = os.environ.get(constants.SHARD_VAR_NAME, "")
+    job = os.environ.get("JOB", "")
+
+    if shard.lower() in {"", "0", "off"} or not job:
+        return None
+
+    job = pathlib.Path(job).as_posix().rstrip("/")
+
+    if "/" not in shard and "\\" not in shard:
+        return job
+
+    prefix = pathlib.Path(shard).as_posix().rstrip("/")
+
+    if not job.startswith(f"{prefix}/"):
+        return None
+
+    return f"{prefix}/{job[len(prefix) + 1 :].split('/')[0]}"
+
+
+def prefetch_budget() -> int:
+    """Get the maximum number of bytes read ahead of time in each session.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_PREFETCH_BUDGET_MB if it is set, otherwise
+    constants.PREFETCH_BUDGET_MB.
+
+    Returns:
+        The maximum number of bytes.
+    """
+    return int(_get_env_float(constants.PREFETCH_BUDGET_MB_VAR_NAME, constants.PREFETCH_BUDGET_MB) * 1024 * 1024)
+
+
+def prefetch_count() -> int:
+    """Get the number of the most recently opened files which are read ahead of time.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_PREFETCH_COUNT if it is set, otherwise constants.PREFETCH_COUNT.
+
+    Returns:
+        The number of files.
+    """
+    return _get_env_int(constants.PREFETCH_COUNT_VAR_NAME, constants.PREFETCH_COUNT)
+
+
+def prefetch_max_size() -> int:
+    """Get the maximum size of a file which is read ahead of time.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_PREFETCH_MAX_SIZE_MB if it is set, otherwise
+    constants.PREFETCH_MAX_SIZE_MB.
+
+    Returns:
+        The maximum file size, in bytes.
+    """
+    return int(_get_env_float(constants.PREFETCH_MAX_SIZE_MB_VAR_NAME, constants.PREFETCH_MAX_SIZE_MB) * 1024 * 1024)
+
+
+def prefetch_mode() -> str | None:
+    """Get the mode used to read the most recently opened files ahead of time.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_PREFETCH if it is set to a supported mode. Any other
+    non-empty value, such as "1", uses constants.PREFETCH_MODE__ADVISE.
+
+    Returns:
+        The prefetch mode, or None if prefetching is disabled.
+    """
+    mode = os.environ.get(constants.PREFETCH_VAR_NAME, "").lower()
+
+    if mode in {"", "0", "off"}:
+        return None
+
+    if mode == constants.PREFETCH_MODE__READ:
+        return mode
+
+    return constants.PREFETCH_MODE__ADVISE
+
+
+def prune_enabled() -> bool:
+    """Get whether entries whose files no longer exist are removed in the background.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_PRUNE, which enables removing entries when set to any value
+    other than "", "0" or "off".
+
+    Returns:
+        Whether removing missing files is enabled.
+    """
+    return _get_env_bool(constants.PRUNE_VAR_NAME)
+
+
+def prune_grace_period() -> float:
+    """Get the number of seconds a file has to be missing for before its entry is removed.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_PRUNE_GRACE_DAYS if it is set, otherwise
+    constants.PRUNE_GRACE_DAYS, converted to seconds.
+
+    Returns:
+        The grace period.
+    """
+    return _get_env_float(constants.PRUNE_GRACE_DAYS_VAR_NAME, constants.PRUNE_GRACE_DAYS) * 24 * 60 * 60
+
+
+def prune_max_workers() -> int:
+    """Get the maximum number of threads used to check for missing files in the background.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_PRUNE_MAX_WORKERS if it is set, otherwise
+    constants.PRUNE_MAX_WORKERS.
+
+    Returns:
+        The maximum number of threads.
+    """
+    return _get_env_int(constants.PRUNE_MAX_WORKERS_VAR_NAME, constants.PRUNE_MAX_WORKERS)
+
+
+def resolve_paths() -> bool:
+    """Get whether symbolic links and ".." segments are resolved to make the canonical path of a file.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_RESOLVE_PATHS, which enables resolving when set to any value
+    other than "", "0" or "off".
+
+    Returns:
+        Whether paths are resolved.
+    """
+    return _get_env_bool(constants.RESOLVE_PATHS_VAR_NAME)
+
+
+def storage_mode() -> str:
+    """Get the mode used to store the recent file data.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_STORAGE if it is set to a supported mode, otherwise
+    constants.STORAGE_MODE__JSON.
+
+    Returns:
+        The storage mode.
+    """
+    mode = os.environ.get(constants.STORAGE_MODE_VAR_NAME, "").lower()
+
+    if mode in {constants.STORAGE_MODE__JOURNAL, constants.STORAGE_MODE__JSON, constants.STORAGE_MODE__SQLITE}:
+        return mode
+
+    return constants.STORAGE_MODE__JSON
+
+
+def team_directory() -> pathlib.Path | None:
+    """Get the directory containing the recent file histories of each team member.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_TEAM_DIR if it is set.
+
+    Returns:
+        The team directory, or None if it is not set.
+    """
+    directory = os.environ.get(constants.TEAM_DIRECTORY_VAR_NAME)
+
+    if not directory:
+        return None
+
+    return pathlib.Path(directory)
+
+
+def timing_buffer_size() -> int:
+    """Get the number of phase timings to keep in memory.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_TIMING_BUFFER_SIZE if it is set, otherwise
+    constants.TIMING_BUFFER_SIZE.
+
+    Returns:
+        The number of timings to keep.
+    """
+    return _get_env_int(constants.TIMING_BUFFER_SIZE_VAR_NAME, constants.TIMING_BUFFER_SIZE)
+
+
+def timing_enabled() -> bool:
+    """Get whether the time taken by each phase of loading and displaying the menu is recorded.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_TIMING, which enables recording when set to any value other
+    than "", "0" or "off".
+
+    Returns:
+        Whether timing is enabled.
+    """
+    return _get_env_bool(constants.TIMING_VAR_NAME)
+
+
+def watch_mode() -> str | None:
+    """Get the mode used to watch the stored data for changes.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_WATCH if it is set to a supported mode. Any other
+    non-empty value, such as "1", uses constants.WATCH_MODE__INOTIFY.
+
+    Returns:
+        The watch mode, or None if watching is disabled.
+    """
+    mode = os.environ.get(constants.WATCH_MODE_VAR_NAME, "").lower()
+
+    if mode in {"", "0", "off"}:
+        return None
+
+    if mode == constants.WATCH_MODE__POLL:
+        return mode
+
+    return constants.WATCH_MODE__INOTIFY
+
+
+def write_delay() -> float:
+    """Get the number of seconds to wait for further updates before writing added files.
+
+    This uses $HOUDINI_RECENT_FILES_MENU_WRITE_DELAY if it is set, otherwise constants.WRITE_DELAY.
+
+    Returns:
+        The background write delay.
+    """
+    return _get_env_float(constants.WRITE_DELAY_VAR_NAME, constants.WRITE_DELAY)
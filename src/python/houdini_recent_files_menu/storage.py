@@ -0,0 +1,836 @@
+"""Storage backends for the recent file data."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import abc
+import contextlib
+import functools
+import sqlite3
+import threading
+from typing import TYPE_CHECKING
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import (
+    archive,
+    constants,
+    filesystem,
+    frecency,
+    index,
+    journal,
+    settings,
+)
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable, Generator
+
+_INSERT_QUERY = "INSERT INTO recent_files (path, open_timestamp, save_version, frecency) VALUES (?, ?, ?, ?)"
+"""Query to insert a row into the recent files table."""
+
+_SELECT_QUERY = "SELECT path, open_timestamp, save_version, frecency FROM recent_files"
+"""Query to select rows from the recent files table."""
+
+# Classes
+
+
+class StorageBackend(abc.ABC):
+    """Base class for storing recent file data.
+
+    Data is exchanged in the same form as the standard source file: a dictionary of hip file paths to
+    dictionaries containing the open timestamp and save version.
+
+    If an archive is provided, entries which no longer fit in the list are moved to it rather than
+    being discarded.
+
+    Backends are shared by the menu, warm up and writer threads, so anything which reads or changes
+    what a backend keeps in memory holds its lock.
+
+    Args:
+        path: The path of the storage file.
+        archive: The archive for entries which no longer fit.
+    """
+
+    def __init__(self, path: pathlib.Path, archive: archive.Archive | None = None) -> None:
+        self.path = path
+        self.archive = archive
+
+        self._lock = threading.RLock()
+
+    def _archive_entries(self, data: dict) -> None:
+        """Move entries which no longer fit in the list to the archive, if there is one.
+
+        Args:
+            data: The recent file data which no longer fits.
+        """
+        if self.archive is not None and data:
+            self.archive.append(data)
+
+    @abc.abstractmethod
+    def add_entries(self, data: dict) -> None:
+        """Add or update entries.
+
+        If there are then more entries than allowed, the least recently opened ones are discarded. If
+        files are ordered by frecency, the score of each entry is updated from the stored one.
+
+        Args:
+            data: The recent file data to add.
+        """
+
+    def compact(self) -> int:
+        """Rewrite the stored data so it only contains the entries which fit in the list.
+
+        Entries which no longer fit are discarded, or moved to the archive if there is one.
+
+        Returns:
+            The number of entries removed.
+        """
+        with self._lock:
+            kept, removed = _split_entries(self.read_data(), settings.max_recent_files())
+
+            self._archive_entries(removed)
+            self.write_data(kept)
+
+        return len(removed)
+
+    def modification_time(self) -> float:
+        """Get the time the stored data was last modified.
+
+        Returns:
+            The modification timestamp, or 0 if nothing has been stored yet.
+        """
+        try:
+            return self.path.stat().st_mtime
+
+        except FileNotFoundError:
+            return 0
+
+    @abc.abstractmethod
+    def read_data(self, limit: int | None = None) -> dict:
+        """Read the stored data.
+
+        Args:
+            limit: Only read this many of the most recently opened entries.
+
+        Returns:
+            The recent file data, ordered from most to least recently opened.
+        """
+
+    def read_frecent_data(self, limit: int | None = None) -> dict:
+        """Read the stored data with the highest frecency scores.
+
+        An entry without a stored score ranks by its latest open, so it can only be amongst the highest
+        scoring entries if it is also amongst the most recently opened ones. Only those and the entries
+        with the highest stored scores need to be ranked.
+
+        Args:
+            limit: Only read this many of the entries with the highest scores.
+
+        Returns:
+            The recent file data, ordered from highest to lowest score.
+        """
+        return frecency.top({**self.read_data(limit), **self.read_scored_data(limit)}, limit)
+
+    def read_scored_data(self, limit: int | None = None) -> dict:
+        """Read the stored entries which have the highest stored frecency scores.
+
+        Entries without a stored score are left out.
+
+        Args:
+            limit: Only read this many of the entries with the highest stored scores.
+
+        Returns:
+            The recent file data, ordered from highest to lowest stored score.
+        """
+        data = self.read_data()
+
+        return frecency.top(
+            {path: entry for path, entry in data.items() if constants.DATA_NAME__FRECENCY in entry}, limit
+        )
+
+    def read_history(self) -> dict:
+        """Read the stored data along with any archived entries.
+
+        This reads the whole archive so should only be used when the full history is required.
+
+        Returns:
+            The recent file history, ordered from most to least recently opened.
+        """
+        history = self.archive.read() if self.archive is not None else {}
+        history.update(self.read_data())
+
+        return index.RecencyIndex(history).top()
+
+    @abc.abstractmethod
+    def remove_entries(self, data: dict) -> None:
+        """Remove entries in a single update.
+
+        Entries which have been opened again since, and so have a newer open timestamp, are kept. The
+        stored data is read and written back as one change, so entries added by other sessions in
+        between are kept.
+
+        Args:
+            data: The recent file data to remove.
+        """
+
+    @abc.abstractmethod
+    def write_data(self, data: dict) -> None:
+        """Replace all the stored data.
+
+        Args:
+            data: The recent file data to store.
+        """
+
+    def watch_paths(self) -> tuple[pathlib.Path, ...]:
+        """Get the files which change when the stored data changes.
+
+        Returns:
+            The files to watch for changes.
+        """
+        return (self.path,)
+
+
+class JsonStorageBackend(StorageBackend):
+    """Store recent file data in a single JSON file.
+
+    The data last read or written is kept ordered by open timestamp, and reused until the file changes
+    on disk. The file is locked before it is read for a change, so that changes made by other sessions
+    in between are not lost when it is written back.
+    """
+
+    def __init__(self, path: pathlib.Path, archive: archive.Archive | None = None) -> None:
+        super().__init__(path, archive)
+
+        self._index = index.RecencyIndex()
+        self._signature: tuple[int, int] | None = None
+
+    def _get_signature(self) -> tuple[int, int] | None:
+        """Get a value which changes whenever the file is modified.
+
+        Returns:
+            The file signature, or None if the file does not exist.
+        """
+        try:
+            stat = self.path.stat()
+
+        except FileNotFoundError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self) -> index.RecencyIndex:
+        """Get the index of the stored data, reading the file if it has changed.
+
+        Returns:
+            The index of the stored data.
+        """
+        signature = self._get_signature()
+
+        if signature != self._signature:
+            self._index = index.RecencyIndex(filesystem.read_file_data(self.path) if signature is not None else None)
+            self._signature = signature
+
+        return self._index
+
+    def _write(self) -> None:
+        """Write the indexed data to the file."""
+        try:
+            filesystem.write_file_data(self._index.top(), self.path, settings.file_encoding())
+
+        except OSError:
+            # The file may or may not have been changed so make sure it is read again.
+            self._signature = None
+            raise
+
+        self._signature = self._get_signature()
+
+    def add_entries(self, data: dict) -> None:
+        """Add or update entries.
+
+        The entries are added to the index and the whole file is written back.
+
+        Args:
+            data: The recent file data to add.
+        """
+        with self._lock, filesystem.lock_file(self.path):
+            current = self._load()
+            current.update(frecency.add_scores(data, current.get))
+
+            # Archive first so that entries are never lost if writing fails.
+            self._archive_entries(current.trim(settings.max_recent_files()))
+
+            self._write()
+
+    def compact(self) -> int:
+        """Rewrite the stored data so it only contains the entries which fit in the list.
+
+        Entries which no longer fit are discarded, or moved to the archive if there is one.
+
+        Returns:
+            The number of entries removed.
+        """
+        with self._lock, filesystem.lock_file(self.path):
+            removed = self._load().trim(settings.max_recent_files())
+
+            self._archive_entries(removed)
+            self._write()
+
+        return len(removed)
+
+    def read_data(self, limit: int | None = None) -> dict:
+        """Read the stored data.
+
+        Args:
+            limit: Only read this many of the most recently opened entries.
+
+        Returns:
+            The recent file data, ordered from most to least recently opened.
+        """
+        with self._lock:
+            return self._load().top(limit)
+
+    def remove_entries(self, data: dict) -> None:
+        """Remove entries in a single update.
+
+        Entries which have been opened again since, and so have a newer open timestamp, are kept.
+
+        Args:
+            data: The recent file data to remove.
+        """
+        with self._lock, filesystem.lock_file(self.path):
+            self._index = index.RecencyIndex(_remove_entries(self._load().top(), data))
+
+            self._write()
+
+    def write_data(self, data: dict) -> None:
+        """Replace all the stored data.
+
+        Args:
+            data: The recent file data to store.
+        """
+        with self._lock, filesystem.lock_file(self.path):
+            self._index = index.RecencyIndex(data)
+
+            self._write()
+
+
+class JournalStorageBackend(StorageBackend):
+    """Store recent file data in an append-only journal.
+
+    If the journal does not exist yet, the data from the standard JSON source file is used and the
+    journal is created from it on the first write.
+
+    Args:
+        path: The path of the journal file.
+        source_path: The path of the standard JSON source file.
+        archive: The archive for entries which no longer fit.
+    """
+
+    def __init__(self, path: pathlib.Path, source_path: pathlib.Path, archive: archive.Archive | None = None) -> None:
+        super().__init__(path, archive)
+
+        self._journal = journal.Journal(path)
+        self._source = JsonStorageBackend(source_path)
+
+    def add_entries(self, data: dict) -> None:
+        """Add or update entries.
+
+        Only the new records are appended. Once the journal grows too large it is compacted to contain
+        only the allowed number of entries.
+
+        Args:
+            data: The recent file data to add.
+        """
+        with self._lock:
+            if not self._journal.exists():
+                self._compact(lambda current: {**current, **frecency.add_scores(data, current.get)})
+                return
+
+            self._journal.append(frecency.add_scores(data, self._journal.get))
+
+            if self._journal.size() > settings.journal_compact_size():
+                self._compact()
+
+    def _compact(self, update: Callable[[dict], dict] | None = None) -> dict:
+        """Replace the journal contents with the entries which fit in the list.
+
+        Args:
+            update: Function which is given the current recent file data and returns the updated data,
+                if it should be changed first.
+
+        Returns:
+            The recent file data which no longer fits.
+        """
+        removed: dict = {}
+
+        def _keep_fitting(current: dict) -> dict:
+            kept, removed_entries = _split_entries(
+                update(current) if update is not None else current, settings.max_recent_files()
+            )
+
+            # Archive before the journal is replaced so that entries are never lost.
+            self._archive_entries(removed_entries)
+            removed.update(removed_entries)
+
+            return kept
+
+        self._rewrite(_keep_fitting)
+
+        return removed
+
+    def _rewrite(self, update: Callable[[dict], dict]) -> None:
+        """Replace the journal contents with an update of the current data.
+
+        The journal is locked while the current data is read and replaced, so records appended by other
+        sessions in between are not lost. Until the journal exists, the current data is that of the
+        source file.
+
+        Args:
+            update: Function which is given the current recent file data and returns the data the
+                journal should contain.
+        """
+
+        def _update(current: dict) -> dict:
+            return update(current if self._journal.exists() else self._source.read_data())
+
+        self._journal.rewrite(_update)
+
+    def compact(self) -> int:
+        """Rewrite the stored data so it only contains the entries which fit in the list.
+
+        Entries which no longer fit are discarded, or moved to the archive if there is one. The journal
+        is locked throughout so records appended by other sessions are kept.
+
+        Returns:
+            The number of entries removed.
+        """
+        with self._lock:
+            return len(self._compact())
+
+    def modification_time(self) -> float:
+        """Get the time the stored data was last modified.
+
+        Returns:
+            The modification timestamp, or 0 if nothing has been stored yet.
+        """
+        if self._journal.exists():
+            return super().modification_time()
+
+        return self._source.modification_time()
+
+    def read_data(self, limit: int | None = None) -> dict:
+        """Read the stored data.
+
+        Only records appended since the previous read are parsed.
+
+        Args:
+            limit: Only read this many of the most recently opened entries.
+
+        Returns:
+            The recent file data, ordered from most to least recently opened.
+        """
+        with self._lock:
+            if not self._journal.exists():
+                return self._source.read_data(limit)
+
+            return self._journal.read(limit)
+
+    def remove_entries(self, data: dict) -> None:
+        """Remove entries in a single update.
+
+        Entries which have been opened again since, and so have a newer open timestamp, are kept. The
+        journal is locked throughout so records appended by other sessions are kept.
+
+        Args:
+            data: The recent file data to remove.
+        """
+        with self._lock:
+            self._rewrite(lambda current: _remove_entries(current, data))
+
+    def write_data(self, data: dict) -> None:
+        """Replace all the stored data.
+
+        Args:
+            data: The recent file data to store.
+        """
+        with self._lock:
+            self._journal.compact(data)
+
+    def watch_paths(self) -> tuple[pathlib.Path, ...]:
+        """Get the files which change when the stored data changes.
+
+        The source file is included as its data is used until the journal is created.
+
+        Returns:
+            The files to watch for changes.
+        """
+        return self.path, self._source.path
+
+
+class SqliteStorageBackend(StorageBackend):
+    """Store recent file data in an indexed SQLite database.
+
+    The database uses write-ahead logging so reads are not blocked by writes in other sessions. Note
+    that this requires the database to be on a local filesystem.
+
+    When the database is created it is populated with any data from the standard JSON source file.
+
+    Args:
+        path: The path of the database file.
+        source_path: The path of the standard JSON source file.
+        archive: The archive for entries which no longer fit.
+    """
+
+    def __init__(self, path: pathlib.Path, source_path: pathlib.Path, archive: archive.Archive | None = None) -> None:
+        super().__init__(path, archive)
+
+        self._connection: sqlite3.Connection | None = None
+        self._source = JsonStorageBackend(source_path)
+
+    @contextlib.contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        """Context manager providing exclusive use of the database connection.
+
+        The connection is created, along with the database if necessary, on first use.
+        """
+        with self._lock:
+            if self._connection is None:
+                self._connection = self._create_connection()
+
+            yield self._connection
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """Connect to the database, creating it if necessary.
+
+        Returns:
+            The database connection.
+        """
+        connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+
+        with connection:
+            exists = connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'recent_files'").fetchone()
+
+            if exists is None:
+                connection.execute(
+                    "CREATE TABLE recent_files "
+                    "(path TEXT PRIMARY KEY, open_timestamp REAL NOT NULL, save_version TEXT, frecency REAL)"
+                )
+                connection.execute("CREATE INDEX recent_files_open_timestamp ON recent_files (open_timestamp)")
+                connection.executemany(_INSERT_QUERY, _entries_as_rows(self._source.read_data()))
+
+            # Databases created before frecency scores were stored do not have a column for them.
+            elif "frecency" not in {row[1] for row in connection.execute("PRAGMA table_info(recent_files)")}:
+                connection.execute("ALTER TABLE recent_files ADD COLUMN frecency REAL")
+
+            # Databases may also have been given the column before it was indexed.
+            connection.execute("CREATE INDEX IF NOT EXISTS recent_files_frecency ON recent_files (frecency)")
+
+        return connection
+
+    def _wal_path(self) -> pathlib.Path:
+        """Get the path of the write-ahead log file.
+
+        Returns:
+            The path of the write-ahead log file.
+        """
+        return self.path.with_name(f"{self.path.name}-wal")
+
+    def add_entries(self, data: dict) -> None:
+        """Add or update entries.
+
+        Each entry is a single row upsert, and discarding old entries uses the timestamp index. Any
+        frecency scores are updated from the stored rows within the same transaction.
+
+        Args:
+            data: The recent file data to add.
+        """
+        with self._connect() as connection, connection:
+            data = frecency.add_scores(data, lambda path: _select_entry(connection, path))
+
+            connection.executemany(
+                f"{_INSERT_QUERY} ON CONFLICT (path) DO UPDATE SET open_timestamp = excluded.open_timestamp, "
+                "save_version = excluded.save_version, frecency = excluded.frecency",
+                _entries_as_rows(data),
+            )
+            cutoff = connection.execute(
+                "SELECT open_timestamp FROM recent_files ORDER BY open_timestamp DESC LIMIT 1 OFFSET ?",
+                (settings.max_recent_files() - 1,),
+            ).fetchone()
+
+            if cutoff is None:
+                return
+
+            if self.archive is not None:
+                # Archiving within the transaction means the rows are kept if it fails.
+                rows = connection.execute(f"{_SELECT_QUERY} WHERE open_timestamp < ?", cutoff).fetchall()
+                self._archive_entries(_rows_as_entries(rows))
+
+            connection.execute("DELETE FROM recent_files WHERE open_timestamp < ?", cutoff)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def compact(self) -> int:
+        """Rewrite the stored data so it only contains the entries which fit in the list.
+
+        Entries which no longer fit are discarded, or moved to the archive if there is one. The
+        database is then rebuilt to reclaim any unused space.
+
+        Returns:
+            The number of entries removed.
+        """
+        removed = super().compact()
+
+        with self._connect() as connection:
+            connection.execute("VACUUM")
+
+        return removed
+
+    def modification_time(self) -> float:
+        """Get the time the stored data was last modified.
+
+        Changes are first written to the write-ahead log so its modification time is also considered.
+
+        Returns:
+            The modification timestamp, or 0 if nothing has been stored yet.
+        """
+        try:
+            wal_modified = self._wal_path().stat().st_mtime
+
+        except FileNotFoundError:
+            wal_modified = 0
+
+        return max(super().modification_time(), wal_modified)
+
+    def read_data(self, limit: int | None = None) -> dict:
+        """Read the stored data.
+
+        Args:
+            limit: Only read this many of the most recently opened entries.
+
+        Returns:
+            The recent file data, ordered from most to least recently opened.
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"{_SELECT_QUERY} ORDER BY open_timestamp DESC LIMIT ?", (-1 if limit is None else limit,)
+            ).fetchall()
+
+        return _rows_as_entries(rows)
+
+    def read_scored_data(self, limit: int | None = None) -> dict:
+        """Read the stored entries which have the highest stored frecency scores.
+
+        The rows are read in order from the frecency index, so only the rows returned are visited.
+
+        Args:
+            limit: Only read this many of the entries with the highest stored scores.
+
+        Returns:
+            The recent file data, ordered from highest to lowest stored score.
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"{_SELECT_QUERY} WHERE frecency IS NOT NULL ORDER BY frecency DESC LIMIT ?",
+                (-1 if limit is None else limit,),
+            ).fetchall()
+
+        return _rows_as_entries(rows)
+
+    def remove_entries(self, data: dict) -> None:
+        """Remove entries in a single transaction.
+
+        Entries which have been opened again since, and so have a newer open timestamp, are kept.
+
+        Args:
+            data: The recent file data to remove.
+        """
+        with self._connect() as connection, connection:
+            connection.executemany(
+                "DELETE FROM recent_files WHERE path = ? AND open_timestamp <= ?",
+                [(path, entry[constants.DATA_NAME__OPEN_TIMESTAMP]) for path, entry in data.items()],
+            )
+
+    def write_data(self, data: dict) -> None:
+        """Replace all the stored data.
+
+        Args:
+            data: The recent file data to store.
+        """
+        with self._connect() as connection, connection:
+            connection.execute("DELETE FROM recent_files")
+            connection.executemany(_INSERT_QUERY, _entries_as_rows(data))
+
+    def watch_paths(self) -> tuple[pathlib.Path, ...]:
+        """Get the files which change when the stored data changes.
+
+        Changes are first written to the write-ahead log so it is also watched.
+
+        Returns:
+            The files to watch for changes.
+        """
+        return self.path, self._wal_path()
+
+
+# Non-Public Functions
+
+
+@functools.cache
+def _create_backend(
+    mode: str, source_path: pathlib.Path, archive_directory: pathlib.Path | None = None
+) -> StorageBackend:
+    """Create the storage backend for a storage mode and source file.
+
+    Backends are cached so that they can keep track of what they have already read.
+
+    Args:
+        mode: The storage mode.
+        source_path: The path of the standard JSON source file.
+        archive_directory: The directory to archive entries which no longer fit in, if any.
+
+    Returns:
+        The storage backend.
+    """
+    # A project's directory is only created once its history is first used.
+    with contextlib.suppress(OSError):
+        source_path.parent.mkdir(parents=True, exist_ok=True)
+
+    entry_archive = archive.Archive(archive_directory) if archive_directory is not None else None
+
+    if mode == constants.STORAGE_MODE__JOURNAL:
+        return JournalStorageBackend(source_path.with_suffix(constants.JOURNAL_FILE_SUFFIX), source_path, entry_archive)
+
+    if mode == constants.STORAGE_MODE__SQLITE:
+        return SqliteStorageBackend(source_path.with_suffix(constants.DATABASE_FILE_SUFFIX), source_path, entry_archive)
+
+    return JsonStorageBackend(source_path, entry_archive)
+
+
+def _entries_as_rows(data: dict) -> list[tuple[str, float, str | None, float | None]]:
+    """Convert recent file data to database rows.
+
+    Args:
+        data: The recent file data.
+
+    Returns:
+        The database rows.
+    """
+    return [
+        (
+            path,
+            entry[constants.DATA_NAME__OPEN_TIMESTAMP],
+            entry.get(constants.DATA_NAME__SAVE_VERSION),
+            entry.get(constants.DATA_NAME__FRECENCY),
+        )
+        for path, entry in data.items()
+    ]
+
+
+def _remove_entries(current: dict, data: dict) -> dict:
+    """Remove entries from recent file data, unless they have a newer open timestamp.
+
+    Args:
+        current: The current recent file data.
+        data: The recent file data to remove.
+
+    Returns:
+        The remaining recent file data.
+    """
+    return {
+        path: entry
+        for path, entry in current.items()
+        if path not in data
+        or entry[constants.DATA_NAME__OPEN_TIMESTAMP] > data[path][constants.DATA_NAME__OPEN_TIMESTAMP]
+    }
+
+
+def _rows_as_entries(rows: list[tuple[str, float, str | None, float | None]]) -> dict:
+    """Convert database rows to recent file data.
+
+    Frecency scores are only included for rows which have one.
+
+    Args:
+        rows: The database rows.
+
+    Returns:
+        The recent file data.
+    """
+    data = {}
+
+    for path, open_timestamp, save_version, score in rows:
+        entry = {constants.DATA_NAME__OPEN_TIMESTAMP: open_timestamp, constants.DATA_NAME__SAVE_VERSION: save_version}
+
+        if score is not None:
+            entry[constants.DATA_NAME__FRECENCY] = score
+
+        data[path] = entry
+
+    return data
+
+
+def _select_entry(connection: sqlite3.Connection, path: str) -> dict | None:
+    """Get the stored entry for a path.
+
+    Args:
+        connection: The database connection.
+        path: The path of the entry.
+
+    Returns:
+        The entry data, or None if there is no entry for the path.
+    """
+    row = connection.execute(f"{_SELECT_QUERY} WHERE path = ?", (path,)).fetchone()
+
+    return None if row is None else _rows_as_entries([row])[path]
+
+
+def _split_entries(data: dict, limit: int) -> tuple[dict, dict]:
+    """Split data into the most recently opened entries and the rest.
+
+    Args:
+        data: The recent file data.
+        limit: The number of entries to keep.
+
+    Returns:
+        The kept data, ordered from most to least recently opened, and the rest of the data.
+    """
+    entries = index.RecencyIndex(data)
+    removed = entries.trim(limit)
+
+    return entries.top(), removed
+
+
+# Functions
+
+
+def get_project_backend(project: str | None) -> StorageBackend:
+    """Get the storage backend for the history of a project, in the current storage mode.
+
+    This is used to read the history of projects other than the current one, so their entries are
+    never archived.
+
+    Args:
+        project: The project name, or None for the history which is not part of a project.
+
+    Returns:
+        The storage backend.
+    """
+    return _create_backend(settings.storage_mode(), filesystem.project_source_file_path(project))
+
+
+def get_storage_backend() -> StorageBackend:
+    """Get the storage backend for the current storage mode and source file.
+
+    The source file is that of the current project, if there is one.
+
+    Returns:
+        The storage backend.
+    """
+    archive_directory = filesystem.archive_directory_path() if settings.archive_enabled() else None
+
+    return _create_backend(settings.storage_mode(), filesystem.source_file_path(), archive_directory)
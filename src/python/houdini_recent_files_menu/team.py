@@ -0,0 +1,187 @@
+"""Combine the recent file histories of everyone in a team."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import dataclasses
+import functools
+import heapq
+import itertools
+import os
+import pathlib
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, filesystem, settings
+
+# Classes
+
+
+@dataclasses.dataclass(frozen=True)
+class TeamFile:
+    """A file recently opened by a member of the team."""
+
+    user: str
+    """The name of the user who opened the file."""
+    path: str
+    entry: dict
+    """The recent file data for the file."""
+
+
+@dataclasses.dataclass(frozen=True)
+class _UserHistory:
+    """The most recent entries from a user's history file."""
+
+    signature: tuple[int, int]
+    """The modification time and size of the history file when it was read."""
+    limit: int
+    """The number of entries which were kept."""
+    files: list[TeamFile]
+    """The most recent entries, ordered from most to least recently opened."""
+
+
+class TeamHistory:
+    """The recent file histories of a team, stored in a shared directory.
+
+    Each user has a directory containing their recent_houdini_files.json file, for example
+    <directory>/<user>/recent_houdini_files.json.
+
+    Each history is read once and its most recent entries kept, ordered by when they were opened. It
+    is only read again when the file changes, so a refresh only reads the histories which were
+    updated. The most recent entries across the team are then found by merging the ordered entries
+    of each user, only going as far as needed.
+
+    Args:
+        directory: The directory containing the user directories.
+    """
+
+    def __init__(self, directory: pathlib.Path) -> None:
+        self.directory = directory
+        self._histories: dict[str, _UserHistory] = {}
+
+    def _refresh(self, limit: int) -> None:
+        """Read any histories which have changed since they were last read.
+
+        Args:
+            limit: The number of entries to keep from each history.
+        """
+        histories = {}
+
+        try:
+            user_dirs = [entry for entry in os.scandir(self.directory) if entry.is_dir()]
+
+        except OSError:
+            user_dirs = []
+
+        for user_dir in user_dirs:
+            path = pathlib.Path(user_dir.path, constants.RECENT_FILE_SOURCE_FILE_NAME)
+
+            try:
+                stat = path.stat()
+
+            except OSError:
+                continue
+
+            signature = (stat.st_mtime_ns, stat.st_size)
+            history = self._histories.get(user_dir.name)
+
+            if history is None or history.signature != signature or history.limit < limit:
+                # If the file could not be read, such as while it is being written, the previous
+                # entries are used until it can be.
+                history = _read_user_history(user_dir.name, path, signature, limit) or history
+
+            if history is not None:
+                histories[user_dir.name] = history
+
+        self._histories = histories
+
+    def top(self, limit: int) -> list[TeamFile]:
+        """Get the files most recently opened by anyone in the team.
+
+        Args:
+            limit: The number of files to get.
+
+        Returns:
+            The recently opened files, ordered from most to least recently opened.
+        """
+        self._refresh(limit)
+
+        merged = heapq.merge(
+            *(history.files for history in self._histories.values()),
+            key=lambda team_file: team_file.entry[constants.DATA_NAME__OPEN_TIMESTAMP],
+            reverse=True,
+        )
+
+        return list(itertools.islice(merged, limit))
+
+
+# Non-Public Functions
+
+
+@functools.cache
+def _get_team_history(directory: pathlib.Path) -> TeamHistory:
+    """Get the team history for a directory.
+
+    The same object is returned for the same directory so that its cached histories are reused.
+
+    Args:
+        directory: The team directory.
+
+    Returns:
+        The team history.
+    """
+    return TeamHistory(directory)
+
+
+def _read_user_history(user: str, path: pathlib.Path, signature: tuple[int, int], limit: int) -> _UserHistory | None:
+    """Read the most recent entries from a user's history file.
+
+    Args:
+        user: The user name.
+        path: The history file.
+        signature: The modification time and size of the file.
+        limit: The number of entries to keep.
+
+    Returns:
+        The user's history, or None if the file could not be read.
+    """
+    try:
+        data = filesystem.read_file_data(path)
+
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict):
+        return None
+
+    entries = (
+        (file_path, entry)
+        for file_path, entry in data.items()
+        if isinstance(entry, dict) and isinstance(entry.get(constants.DATA_NAME__OPEN_TIMESTAMP), (float, int))
+    )
+
+    files = [
+        TeamFile(user, file_path, entry)
+        for file_path, entry in heapq.nlargest(
+            limit, entries, key=lambda item: item[1][constants.DATA_NAME__OPEN_TIMESTAMP]
+        )
+    ]
+
+    return _UserHistory(signature, limit, files)
+
+
+# Functions
+
+
+def get_team_history() -> TeamHistory | None:
+    """Get the recent file histories of the team.
+
+    Returns:
+        The team history, or None if no team directory is set.
+    """
+    directory = settings.team_directory()
+
+    if directory is None:
+        return None
+
+    return _get_team_history(directory)
@@ -0,0 +1,87 @@
+"""Background thread helpers for the package."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import concurrent.futures
+import queue
+import threading
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_T = TypeVar("_T")
+
+# Classes
+
+
+class DaemonThreadPool:
+    """A minimal thread pool whose worker threads never block the interpreter from exiting.
+
+    The standard library ThreadPoolExecutor joins its workers when the interpreter exits, so a
+    filesystem call hung on a stale network mount would also hang Houdini on exit. The workers
+    here are daemon threads which are simply abandoned instead.
+
+    Args:
+        max_workers: The maximum number of worker threads.
+        name: The prefix for the worker thread names.
+    """
+
+    def __init__(self, max_workers: int, name: str) -> None:
+        self._max_workers = max(1, max_workers)
+        self._name = name
+        self._queue: queue.SimpleQueue[tuple[concurrent.futures.Future, Callable[..., Any], tuple]] = (
+            queue.SimpleQueue()
+        )
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def _start_worker(self) -> None:
+        """Start an additional worker thread, if the maximum has not been reached."""
+        with self._lock:
+            if len(self._threads) >= self._max_workers:
+                return
+
+            thread = threading.Thread(target=self._work, name=f"{self._name}_{len(self._threads)}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _work(self) -> None:
+        """Process submitted work items forever."""
+        while True:
+            future, func, args = self._queue.get()
+
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                result = func(*args)
+
+            except BaseException as exc:  # ruff: ignore[blind-except]
+                future.set_exception(exc)
+
+            else:
+                future.set_result(result)
+
+    @property
+    def max_workers(self) -> int:
+        """The maximum number of worker threads."""
+        return self._max_workers
+
+    def submit(self, func: Callable[..., _T], *args: Any) -> concurrent.futures.Future[_T]:
+        """Schedule a function to be run in the pool.
+
+        Args:
+            func: The function to run.
+            *args: Arguments to pass to the function.
+
+        Returns:
+            A future representing the result of the function.
+        """
+        future: concurrent.futures.Future[_T] = concurrent.futures.Future()
+        self._queue.put((future, func, args))
+        self._start_worker()
+
+        return future
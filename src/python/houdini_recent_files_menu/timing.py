@@ -0,0 +1,133 @@
+"""Record how long each phase of loading and displaying the recent files menu takes."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import collections
+import contextlib
+import dataclasses
+import json
+import threading
+import time
+from typing import TYPE_CHECKING
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import settings
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Generator
+
+_TIMINGS: collections.deque[PhaseTiming] = collections.deque(maxlen=max(settings.timing_buffer_size(), 0))
+"""The most recent timings, oldest first."""
+
+# Classes
+
+
+@dataclasses.dataclass(frozen=True)
+class PhaseTiming:
+    """The time taken by a single run of a phase."""
+
+    phase: str
+    started: float
+    """The time the phase started, as a Unix timestamp."""
+    duration: float
+    """The number of seconds the phase took."""
+    thread: str
+    """The name of the thread the phase ran in."""
+
+    def as_json(self) -> dict:
+        """Return a JSON representation of the timing."""
+        return dataclasses.asdict(self)
+
+
+# Functions
+
+
+def clear() -> None:
+    """Discard all the recorded timings."""
+    _TIMINGS.clear()
+
+
+def dump(path: pathlib.Path | None = None) -> str:
+    """Dump the recorded timings, and a summary of them, as JSON.
+
+    Args:
+        path: An optional file to write the JSON to.
+
+    Returns:
+        The JSON text.
+    """
+    text = json.dumps(
+        {"summary": summarize(), "timings": [timing.as_json() for timing in get_timings()]},
+        indent=4,
+    )
+
+    if path is not None:
+        path.write_text(text, encoding="utf-8")
+
+    return text
+
+
+def get_timings() -> list[PhaseTiming]:
+    """Get the recorded timings.
+
+    Returns:
+        The recorded timings, oldest first.
+    """
+    return list(_TIMINGS)
+
+
+def log_timings() -> None:
+    """Log a summary of the recorded timings to the Houdini log."""
+    import hou  # ruff: ignore[import-outside-top-level]
+
+    for phase, stats in summarize().items():
+        message = (
+            f"{phase}: {stats['count']} calls, {stats['total'] * 1000:.2f}ms total, {stats['max'] * 1000:.2f}ms max"
+        )
+
+        hou.logging.log(hou.logging.LogEntry(message=message, source_context=__name__))
+
+
+def summarize() -> dict[str, dict]:
+    """Summarize the recorded timings for each phase.
+
+    Returns:
+        The number of runs, and the total and maximum time taken, for each phase.
+    """
+    summary: dict[str, dict] = {}
+
+    for timing in get_timings():
+        stats = summary.setdefault(timing.phase, {"count": 0, "total": 0.0, "max": 0.0})
+
+        stats["count"] += 1
+        stats["total"] += timing.duration
+        stats["max"] = max(stats["max"], timing.duration)
+
+    return summary
+
+
+@contextlib.contextmanager
+def timed(phase: str) -> Generator[None, None, None]:
+    """Context manager, or decorator, to record the time taken by a phase.
+
+    Nothing is recorded unless timing is enabled, in which case the oldest timings are discarded once
+    the buffer is full.
+
+    Args:
+        phase: The name of the phase.
+    """
+    if not settings.timing_enabled():
+        yield
+        return
+
+    started = time.time()
+    start = time.perf_counter()
+
+    try:
+        yield
+
+    finally:
+        _TIMINGS.append(PhaseTiming(phase, started, time.perf_counter() - start, threading.current_thread().name))
@@ -4,45 +4,214 @@
 from __future__ import annotations
 
 # Standard Library
+import dataclasses
 import datetime
-
-# Third Party
-from tabulate import tabulate
+import threading
 
 # Houdini Recent Files Menu
-from houdini_recent_files_menu import api, constants
+from houdini_recent_files_menu import api, constants, labels, prefetch, settings, timing
 
 # Houdini
+import hdefereval
 import hou
 
+# Classes
+
+
+@dataclasses.dataclass
+class _RenderCache:
+    """Previously rendered menu data."""
+
+    menu_key: tuple | None = None
+    """The state the menu was rendered for."""
+    menu: list[str] = dataclasses.field(default_factory=list)
+    """The rendered menu tokens and labels."""
+    rows: dict[tuple, tuple[str, str, str]] = dataclasses.field(default_factory=dict)
+    """The rendered cells for each file, keyed by the state they were rendered for."""
+
+
+_RENDER_CACHE = _RenderCache()
+
+_NO_PROJECT_TOKEN = "-"
+"""The menu token for the history which is not part of a project."""
+
+
 # Non-Public Functions
 
 
-def _build_display_table(manager: api.RecentFileManager) -> list[str]:
-    rows = []
+def _build_display_table(recent_files: list[api.RecentFile]) -> list[str]:
+    table = labels.LabelTable()
+    rendered_cells = {}
 
-    for idx, recent_file in enumerate(manager.files):
-        dt = datetime.datetime.fromtimestamp(recent_file.open_timestamp)
+    display_key = _get_display_key()
 
-        display = hou.text.collapseCommonVars(recent_file.path.as_posix(), vars=constants.VARS_TO_COLLAPSE)
+    for idx, recent_file in enumerate(recent_files):
+        row_key = (
+            recent_file.posix_path,
+            recent_file.open_timestamp,
+            recent_file.save_version,
+            recent_file.exists,
+            display_key,
+        )
 
-        # Indicate if the file no longer exists on disk.
-        if not recent_file.exists:
-            display = f"{display} (no longer exists)"
+        # Only render the files which have changed since the last time.
+        cells = _RENDER_CACHE.rows.get(row_key)
 
-        rows.append([
-            f"{idx + 1}. {display}",
-            f"({recent_file.save_version})",
-            dt.strftime(constants.TIMESTAMP_FORMAT),
-        ])
+        if cells is None:
+            cells = _render_cells(recent_file)
 
-    # Generate the table data and split it back out into rows.
-    return tabulate(rows, tablefmt="plain").split("\n")
+        rendered_cells[row_key] = cells
+
+        table.add_row(f"{idx + 1}. {cells[0]}", cells[1], cells[2])
+
+    # Only keep the rows which are still being displayed.
+    _RENDER_CACHE.rows = rendered_cells
+
+    with timing.timed("ui.render_table"):
+        return table.render()
+
+
+def _choose_file_to_open(recent_files: list[api.RecentFile], message: str, title: str) -> None:
+    """Prompt to choose one of the recent files, then open it.
+
+    Args:
+        recent_files: The recent files to choose from.
+        message: The message to display.
+        title: The dialog title.
+    """
+    table = labels.LabelTable()
+
+    for recent_file in recent_files:
+        table.add_row(*_render_cells(recent_file))
+
+    selection = hou.ui.selectFromList(
+        table.render(),
+        exclusive=True,
+        message=message,
+        title=title,
+        column_header="Files",
+    )
+
+    if selection:
+        hou.hipFile.load(recent_files[selection[0]].posix_path)
+
+
+def _get_display_key() -> tuple:
+    """Get a value representing the settings which affect how files are displayed.
+
+    Returns:
+        The current values of the variables which are collapsed and the timestamp format.
+    """
+    return tuple(hou.text.expandString(var) for var in constants.VARS_TO_COLLAPSE), constants.TIMESTAMP_FORMAT
+
+
+def _load_in_background() -> None:
+    """Load the recent file data, then render the menu once the UI is idle.
+
+    The data is loaded, and the file status checked, in this thread so that slow storage does not
+    block the UI. Rendering requires the main thread. If enabled, the most recently opened files then
+    start being read ahead of time, and entries whose files have been missing for long enough are
+    removed.
+
+    The group and search indexes are not built here as they read the full history, which would slow
+    down startup for sessions which never use them. They are built the first time they are required.
+    """
+    manager = api.RecentFileManager()
+
+    hdefereval.executeDeferred(build_recent_files_menu)
+
+    prefetch.prefetch_files(manager.files)
+
+    if settings.prune_enabled() and api.prune_missing_recent_files():
+        # The menu was rendered with the removed entries.
+        hdefereval.executeDeferred(build_recent_files_menu)
+
+
+def _render_cells(recent_file: api.RecentFile) -> tuple[str, str, str]:
+    """Render the display cells for a recent file.
+
+    Args:
+        recent_file: The recent file to render.
+
+    Returns:
+        The file path, version and timestamp cells.
+    """
+    dt = datetime.datetime.fromtimestamp(recent_file.open_timestamp)
+
+    with timing.timed("ui.collapse_vars"):
+        display = hou.text.collapseCommonVars(recent_file.posix_path, vars=constants.VARS_TO_COLLAPSE)
+
+    # Indicate if the file no longer exists on disk, or if that could not be determined in time.
+    if recent_file.exists is None:
+        display = f"{display} (existence unknown)"
+
+    elif not recent_file.exists:
+        display = f"{display} (no longer exists)"
+
+    return display, f"({recent_file.save_version})", dt.strftime(constants.TIMESTAMP_FORMAT)
 
 
 # Functions
 
 
+@timing.timed("ui.build_groups_menu")
+def build_groups_menu() -> list[str]:
+    """Build the menu items for the Open Recent Files By Directory menu.
+
+    Only the groups are listed, so this does not depend on the number of files in them.
+
+    Returns:
+        The menu tokens and labels.
+    """
+    manager = api.RecentFileManager()
+    # Always refresh the data before building the menu so files from other sessions are included.
+    manager.refresh_data()
+
+    group_counts = manager.get_group_index().groups()[: settings.max_display_files()]
+
+    table = labels.LabelTable()
+
+    for group, count in group_counts:
+        table.add_row(
+            hou.text.collapseCommonVars(group, vars=constants.VARS_TO_COLLAPSE),
+            f"({count} file{'s' if count != 1 else ''})",
+        )
+
+    menu: list[str] = []
+
+    for (group, _), row in zip(group_counts, table.render(), strict=True):
+        menu.extend((group, row))
+
+    return menu
+
+
+@timing.timed("ui.build_projects_menu")
+def build_projects_menu() -> list[str]:
+    """Build the menu items for the Open Recent Files From Other Projects menu.
+
+    Only the projects are listed, so none of their histories are read.
+
+    Returns:
+        The menu tokens and labels.
+    """
+    projects = api.get_other_projects()[: settings.max_display_files()]
+
+    table = labels.LabelTable()
+
+    for project, modified in projects:
+        dt = datetime.datetime.fromtimestamp(modified)
+
+        table.add_row(project if project is not None else "(No project)", dt.strftime(constants.TIMESTAMP_FORMAT))
+
+    menu: list[str] = []
+
+    for (project, _), row in zip(projects, table.render(), strict=True):
+        menu.extend((project if project is not None else _NO_PROJECT_TOKEN, row))
+
+    return menu
+
+
+@timing.timed("ui.build_menu")
 def build_recent_files_menu() -> list[str]:
     """Build the menu items for the Open Recent Files menu.
 
@@ -53,13 +222,111 @@ def build_recent_files_menu() -> list[str]:
     # Always refresh the data before building the menu.
     manager.refresh_data()
 
+    # Read the generation and files once so a background reload cannot change them part way through. The generation
+    # is read first as it is updated after the files, so at worst the menu is built again unnecessarily next time.
+    generation = manager.generation
+    recent_files = manager.files
+
+    # If nothing has changed since the menu was last built it can be reused as is.
+    menu_key = (generation, _get_display_key())
+
+    if menu_key == _RENDER_CACHE.menu_key:
+        return list(_RENDER_CACHE.menu)
+
+    # The files have changed so any new ones can start being read while the menu is open.
+    prefetch.prefetch_files(recent_files)
+
     # Generate the table data and split it back out into rows.
-    label_rows = _build_display_table(manager)
+    label_rows = _build_display_table(recent_files)
 
     menu: list[str] = []
 
     # Add each file and its label representation to the menu.
-    for recent_file, row in zip(manager.files, label_rows):
-        menu.extend((recent_file.path.as_posix(), row))
+    for recent_file, row in zip(recent_files, label_rows, strict=True):
+        menu.extend((recent_file.posix_path, row))
+
+    _RENDER_CACHE.menu_key = menu_key
+    _RENDER_CACHE.menu = menu
+
+    return list(menu)
+
+
+@timing.timed("ui.build_team_menu")
+def build_team_menu() -> list[str]:
+    """Build the menu items for the Recently Opened By Team menu.
+
+    Returns:
+        The menu tokens and labels.
+    """
+    team_files = api.get_team_recent_files()
+
+    table = labels.LabelTable()
+
+    for idx, (user, recent_file) in enumerate(team_files):
+        display, version, timestamp = _render_cells(recent_file)
+
+        table.add_row(f"{idx + 1}. {display}", user, version, timestamp)
+
+    menu: list[str] = []
+
+    for (_, recent_file), row in zip(team_files, table.render(), strict=True):
+        menu.extend((recent_file.posix_path, row))
 
     return menu
+
+
+def open_group(group: str) -> None:
+    """Prompt to choose one of the files in a group, then open it.
+
+    Args:
+        group: The group to choose a file from.
+    """
+    recent_files = api.RecentFileManager().get_group_files(group)
+
+    if recent_files:
+        _choose_file_to_open(recent_files, f"Recent files in {group}:", "Open Recent Files")
+
+
+def open_project(project: str) -> None:
+    """Prompt to choose one of the files recently opened in another project, then open it.
+
+    Args:
+        project: The menu token for the project to choose a file from.
+    """
+    recent_files = api.get_project_recent_files(project if project != _NO_PROJECT_TOKEN else None)
+
+    if recent_files:
+        name = project if project != _NO_PROJECT_TOKEN else "no project"
+        _choose_file_to_open(recent_files, f"Recent files in {name}:", "Open Recent Files")
+
+
+def search_recent_files() -> None:
+    """Prompt to search the full recent file history, then open the chosen file."""
+    button, query = hou.ui.readInput(
+        "Search the recent file history for paths containing all of these words:",
+        buttons=("Search", "Cancel"),
+        close_choice=1,
+        title="Search Recent Files",
+    )
+
+    if button != 0 or not query.strip():
+        return
+
+    recent_files = api.RecentFileManager().search(query)
+
+    if not recent_files:
+        hou.ui.displayMessage(f"No recent files match '{query}'.", title="Search Recent Files")
+        return
+
+    _choose_file_to_open(recent_files, f"Recent files matching '{query}':", "Search Recent Files")
+
+
+def warm_up() -> None:
+    """Prepare the recent files menu so the first time it is opened is as fast as any other.
+
+    Nothing is done until the UI is idle so this does not delay startup. The data is then loaded in a
+    background thread, and the menu is rendered ready for when it is first opened.
+    """
+    hdefereval.executeDeferred(
+        threading.Thread(target=_load_in_background, name="recent_files_warm_up", daemon=True).start
+    )
@@ -0,0 +1,324 @@
+"""Watchers which detect changes to the recent file data in the background."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import abc
+import contextlib
+import ctypes
+import ctypes.util
+import errno
+import os
+import pathlib
+import re
+import select
+import struct
+import sys
+import threading
+from typing import TYPE_CHECKING
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, settings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# inotify(7) values.
+_IN_CLOEXEC = 0o2000000
+_IN_EVENT_MASK = (
+    0x00000002  # IN_MODIFY
+    | 0x00000004  # IN_ATTRIB
+    | 0x00000008  # IN_CLOSE_WRITE
+    | 0x00000040  # IN_MOVED_FROM
+    | 0x00000080  # IN_MOVED_TO
+    | 0x00000100  # IN_CREATE
+    | 0x00000200  # IN_DELETE
+)
+_IN_EVENT_HEADER = struct.Struct("iIII")
+
+# The mount table, and the filesystem types it lists which inotify cannot watch for changes made by other hosts.
+_MOUNTS_PATH = pathlib.Path("/proc/mounts")
+_NETWORK_FILESYSTEM_TYPES = frozenset((
+    "9p",
+    "afs",
+    "ceph",
+    "cifs",
+    "fuse.sshfs",
+    "glusterfs",
+    "gpfs",
+    "lustre",
+    "ncpfs",
+    "nfs",
+    "nfs4",
+    "smb3",
+    "smbfs",
+))
+
+# Classes
+
+
+class FileWatcher(abc.ABC):
+    """Base class for watching files for changes in a background thread.
+
+    Args:
+        paths: The files to watch.
+    """
+
+    def __init__(self, paths: Iterable[pathlib.Path]) -> None:
+        self.paths = tuple(paths)
+
+        self._changed = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @abc.abstractmethod
+    def _watch(self) -> None:
+        """Watch for changes until stopped."""
+
+    def check_changed(self) -> bool:
+        """Check whether any of the files have changed since the last check.
+
+        This does not access the filesystem.
+
+        Returns:
+            Whether any of the files have changed.
+        """
+        if not self._changed.is_set():
+            return False
+
+        self._changed.clear()
+
+        return True
+
+    def start(self) -> None:
+        """Start watching in a background thread."""
+        self._thread = threading.Thread(target=self._watch, name=f"recent_files_{type(self).__name__}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching and wait for the background thread to finish."""
+        self._stopped.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+class InotifyWatcher(FileWatcher):
+    """Watch files using Linux inotify.
+
+    The parent directories of the files are watched so that files which are replaced, or do not exist
+    yet, are handled. Note that inotify does not report changes made by other hosts to files on network
+    filesystems; use the PollingWatcher in that case.
+
+    Args:
+        paths: The files to watch.
+
+    Raises:
+        OSError: If inotify is unavailable or the directories cannot be watched.
+    """
+
+    def __init__(self, paths: Iterable[pathlib.Path]) -> None:
+        super().__init__(paths)
+
+        self._names = {path.name.encode() for path in self.paths}
+
+        libc = _get_libc()
+
+        self._fd = libc.inotify_init1(_IN_CLOEXEC)
+
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+
+        for directory in {path.parent for path in self.paths}:
+            if libc.inotify_add_watch(self._fd, os.fsencode(directory), _IN_EVENT_MASK) < 0:
+                error = ctypes.get_errno()
+                os.close(self._fd)
+                raise OSError(error, os.strerror(error), str(directory))
+
+        self._wake_read, self._wake_write = os.pipe()
+
+    def _process_events(self, buffer: bytes) -> None:
+        """Flag a change if any of the events are for the watched files.
+
+        Args:
+            buffer: The raw inotify events.
+        """
+        offset = 0
+
+        while offset < len(buffer):
+            _, _, _, length = _IN_EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _IN_EVENT_HEADER.size
+
+            name = buffer[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if name in self._names:
+                self._changed.set()
+
+    def _watch(self) -> None:
+        """Watch for changes until stopped."""
+        try:
+            while not self._stopped.is_set():
+                readable, _, _ = select.select([self._fd, self._wake_read], [], [])
+
+                if self._fd in readable:
+                    self._process_events(os.read(self._fd, 64 * 1024))
+
+        finally:
+            for fd in (self._fd, self._wake_read, self._wake_write):
+                with contextlib.suppress(OSError):
+                    os.close(fd)
+
+    def stop(self) -> None:
+        """Stop watching and wait for the background thread to finish."""
+        self._stopped.set()
+
+        # Wake up the watch thread so it can see it has been stopped.
+        with contextlib.suppress(OSError):
+            os.write(self._wake_write, b"\0")
+
+        super().stop()
+
+
+class PollingWatcher(FileWatcher):
+    """Watch files by periodically checking their status.
+
+    Args:
+        paths: The files to watch.
+        interval: The number of seconds between checks.
+    """
+
+    def __init__(self, paths: Iterable[pathlib.Path], interval: float) -> None:
+        super().__init__(paths)
+
+        self.interval = interval
+
+        # Get the initial state now so any changes after creation are detected.
+        self._signatures = self._get_signatures()
+
+    def _get_signatures(self) -> list[tuple[int, int, int] | None]:
+        """Get values which change whenever the files are modified or replaced.
+
+        Returns:
+            The signature of each file, or None for files which do not exist.
+        """
+        signatures: list[tuple[int, int, int] | None] = []
+
+        for path in self.paths:
+            try:
+                stat = path.stat()
+
+            except OSError:
+                signatures.append(None)
+
+            else:
+                signatures.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+
+        return signatures
+
+    def _watch(self) -> None:
+        """Watch for changes until stopped."""
+        while not self._stopped.wait(self.interval):
+            signatures = self._get_signatures()
+
+            if signatures != self._signatures:
+                self._signatures = signatures
+                self._changed.set()
+
+
+# Non-Public Functions
+
+
+def _get_libc() -> ctypes.CDLL:
+    """Load the C library.
+
+    Returns:
+        The C library.
+
+    Raises:
+        OSError: If the platform does not provide inotify.
+    """
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.ENOSYS, os.strerror(errno.ENOSYS), "inotify")
+
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+
+    if not hasattr(libc, "inotify_init1"):
+        raise OSError(errno.ENOSYS, os.strerror(errno.ENOSYS), "inotify")
+
+    return libc
+
+
+def _is_network_filesystem(directory: pathlib.Path) -> bool:
+    """Check whether a directory is on a network filesystem, according to the mount table.
+
+    Args:
+        directory: The directory to check. It does not need to exist.
+
+    Returns:
+        Whether the directory is on a network filesystem, False if the mount table cannot be read.
+    """
+    try:
+        mounts = _MOUNTS_PATH.read_text(encoding="utf-8").splitlines()
+
+    except OSError:
+        return False
+
+    resolved = directory.resolve()
+    mount_point: pathlib.Path | None = None
+    filesystem_type = ""
+
+    for line in mounts:
+        try:
+            _, mount, mount_type, *_ = line.split()
+
+        except ValueError:
+            continue
+
+        # Spaces and other characters in mount points are escaped as octal sequences.
+        path = pathlib.Path(re.sub(r"\\([0-7]{3})", lambda match: chr(int(match.group(1), 8)), mount))
+
+        # The most specific mount point containing the directory is the one it is on.
+        if resolved.is_relative_to(path) and (mount_point is None or path.is_relative_to(mount_point)):
+            mount_point = path
+            filesystem_type = mount_type
+
+    return filesystem_type in _NETWORK_FILESYSTEM_TYPES
+
+
+# Functions
+
+
+def create_watcher(paths: Iterable[pathlib.Path]) -> FileWatcher | None:
+    """Create and start a watcher for the files, according to the configured watch mode.
+
+    When using inotify, the polling watcher is used if any of the files are on a network filesystem, where
+    inotify does not report changes made by other hosts, or if inotify cannot be set up.
+
+    Args:
+        paths: The files to watch.
+
+    Returns:
+        The running watcher, or None if watching is disabled.
+    """
+    mode = settings.watch_mode()
+
+    if mode is None:
+        return None
+
+    paths = tuple(paths)
+    watcher: FileWatcher | None = None
+
+    if mode == constants.WATCH_MODE__INOTIFY and not any(_is_network_filesystem(path.parent) for path in paths):
+        with contextlib.suppress(OSError):
+            watcher = InotifyWatcher(paths)
+
+    if watcher is None:
+        watcher = PollingWatcher(paths, settings.poll_interval())
+
+    watcher.start()
+
+    return watcher
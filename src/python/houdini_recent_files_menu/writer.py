@@ -0,0 +1,119 @@
+"""Background writing of recent file updates."""
+
+# Future
+from __future__ import annotations
+
+# Standard Library
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+_LOGGER = logging.getLogger(__name__)
+"""Logger for failures when writing in the background."""
+
+_T = TypeVar("_T")
+
+# Classes
+
+
+class WriteBehindQueue(Generic[_T]):
+    """Queue items to be written together by a background thread.
+
+    Items are keyed so that repeated updates for the same key before they are written replace each
+    other and only the latest is written. Pending items are written once nothing has been queued for
+    the delay, so a burst of updates results in a single write.
+
+    If writing fails in the background, the failure is logged and the items are kept and written with
+    the next batch.
+
+    Args:
+        write_func: The function to write a batch of items.
+        delay: The number of seconds to wait after the last item is queued before writing.
+        name: The name of the background thread.
+    """
+
+    def __init__(self, write_func: Callable[[list[_T]], None], delay: float, name: str) -> None:
+        self.delay = delay
+        self.name = name
+
+        self._condition = threading.Condition()
+        self._last_queued = 0.0
+        self._pending: dict[Hashable, _T] = {}
+        self._thread: threading.Thread | None = None
+        self._write_func = write_func
+        self._write_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def _run(self) -> None:
+        """Write pending items whenever they have stopped being updated."""
+        failed_at: float | None = None
+
+        while True:
+            with self._condition:
+                # After a failed write, wait for something new to be queued before trying again.
+                while not self._pending or self._last_queued == failed_at:
+                    self._condition.wait()
+
+                # Wait until nothing else has been queued for the delay.
+                while (remaining := self._last_queued + self.delay - time.monotonic()) > 0:
+                    self._condition.wait(remaining)
+
+                queued = self._last_queued
+
+            try:
+                self.flush()
+
+            # The items are kept to be retried with the next batch.
+            except Exception:
+                _LOGGER.exception("Failed to write in the background, retrying with the next update")
+                failed_at = queued
+
+    def enqueue(self, key: Hashable, item: _T) -> None:
+        """Queue an item to be written.
+
+        Args:
+            key: The key identifying the item. Any pending item with the same key is replaced.
+            item: The item to write.
+        """
+        with self._condition:
+            # Remove any existing item so the pending items stay in the order they were last queued.
+            self._pending.pop(key, None)
+            self._pending[key] = item
+            self._last_queued = time.monotonic()
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+            self._condition.notify()
+
+    def flush(self) -> None:
+        """Write any pending items immediately.
+
+        If writing fails, the items are kept to be written later and the exception is raised.
+        """
+        # Only allow one write at a time so batches are written in the order they were queued.
+        with self._write_lock:
+            with self._condition:
+                pending = self._pending
+                self._pending = {}
+
+            if not pending:
+                return
+
+            try:
+                self._write_func(list(pending.values()))
+
+            except Exception:
+                with self._condition:
+                    # Anything queued since is newer so takes precedence.
+                    self._pending = {**pending, **self._pending}
+
+                raise
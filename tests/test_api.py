@@ -2,13 +2,28 @@
 
 # Standard Library
 import json
+import os
 import pathlib
+import sys
+import threading
+import time
 
 # Third Party
 import pytest
 
 # Houdini Recent Files Menu
-from houdini_recent_files_menu import api, constants
+from houdini_recent_files_menu import (
+    api,
+    constants,
+    file_status,
+    filesystem,
+    groups,
+    search,
+    storage,
+    team,
+    watcher,
+    writer,
+)
 
 # Fixtures
 
@@ -33,30 +48,92 @@ def init_test_manager(mocker):
 # Tests
 
 
+class Test_ThreadSafeSingleton:
+    """Test the houdini_recent_files_menu.api._ThreadSafeSingleton metaclass."""
+
+    def test___call__(self, mocker):
+        """Test that only a single instance is created when requested from multiple threads."""
+        created = []
+
+        def _init(self):
+            created.append(self)
+            time.sleep(0.05)
+
+        mocker.patch.object(api.RecentFileManager, "__post_init__", _init)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(api.RecentFileManager())) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert len(created) == 1
+        assert all(result is created[0] for result in results)
+
+
 class TestRecentFile:
     """Test the houdini_recent_files_menu.api.RecentFile object."""
 
-    def test___init__(self, mocker):
+    def test___init__(self):
         """Test object initialization."""
-        mock_path = mocker.MagicMock(spec=pathlib.Path)
+        inst = api.RecentFile("/path/to/file.hip", 123456.789, "20.5.456")
 
-        inst = api.RecentFile(mock_path, 123456.789, "20.5.456")
-
-        assert inst.path == mock_path
-        assert inst.open_timestamp == 123456.789
+        assert inst.posix_path == "/path/to/file.hip"
+        assert inst.open_timestamp == pytest.approx(123456.789)
         assert inst.save_version == "20.5.456"
-        assert inst.exists == mock_path.exists.return_value
+        assert inst.exists is None
+        assert inst.size is None
+        assert inst.modified is None
 
-    def test_as_json(self, mocker):
-        """Test RecentFile.as_json()."""
-        mock_path = mocker.MagicMock(spec=pathlib.Path)
+        # The path should be interned so each file shares a single copy of it.
+        assert inst.posix_path is sys.intern(pathlib.Path("/path/to/file.hip").as_posix())
+
+        # Objects should be compact.
+        assert not hasattr(inst, "__dict__")
+
+    def test_path(self):
+        """Test RecentFile.path."""
+        inst = api.RecentFile("/path/to/file.hip", 123456.789, "20.5.456")
+
+        assert inst._path is None
+
+        result = inst.path
+
+        assert result == pathlib.Path("/path/to/file.hip")
+
+        # The path should only be created once.
+        assert inst.path is result
+
+        # The path is derived from the path string so should not affect comparisons.
+        assert inst == api.RecentFile("/path/to/file.hip", 123456.789, "20.5.456")
+
+    def test_set_status(self):
+        """Test RecentFile.set_status()."""
+        inst = api.RecentFile("/path/to/file.hip", 123456.789, "20.5.456")
+
+        inst.set_status(file_status.FileStatus(exists=True, size=1024, modified=123.4))
+
+        assert inst.exists
+        assert inst.size == 1024
+        assert inst.modified == pytest.approx(123.4)
+
+        inst.set_status(None)
+
+        assert inst.exists is None
+        assert inst.size is None
+        assert inst.modified is None
 
-        inst = api.RecentFile(mock_path, 123456.789, "20.5.456")
+    def test_as_json(self):
+        """Test RecentFile.as_json()."""
+        inst = api.RecentFile("/path/to/file.hip", 123456.789, "20.5.456")
 
         result = inst.as_json()
 
         assert result == {
-            mock_path.as_posix.return_value: {
+            "/path/to/file.hip": {
                 constants.DATA_NAME__OPEN_TIMESTAMP: 123456.789,
                 constants.DATA_NAME__SAVE_VERSION: "20.5.456",
             }
@@ -71,17 +148,55 @@ class TestRecentFileManager:
         inst = init_test_manager()
         assert inst.files == []
         assert inst.last_access_time == 0
+        assert inst.generation == 0
 
     def test___post_init__(self, mocker):
         """Test object post initialization."""
+        mock_backend = mocker.patch("houdini_recent_files_menu.storage.get_storage_backend").return_value
+        mock_create_watcher = mocker.patch("houdini_recent_files_menu.watcher.create_watcher")
         mock_init_from_disk = mocker.patch.object(api.RecentFileManager, "_init_from_disk")
 
         inst = api.RecentFileManager()
         assert inst.files == []
         assert inst.last_access_time == 0
+        assert inst._watcher == mock_create_watcher.return_value
+
+        mock_create_watcher.assert_called_with(mock_backend.watch_paths.return_value)
+        mock_init_from_disk.assert_called()
+
+    def test__change_project(self, mocker, init_test_manager):
+        """Test RecentFileManager._change_project()."""
+        mock_backend = mocker.patch("houdini_recent_files_menu.storage.get_storage_backend").return_value
+        mock_create_watcher = mocker.patch("houdini_recent_files_menu.watcher.create_watcher")
+        mock_init_from_disk = mocker.patch.object(api.RecentFileManager, "_init_from_disk")
+
+        mock_watcher = mocker.MagicMock(spec=watcher.FileWatcher)
+
+        inst = init_test_manager()
+        inst._watcher = mock_watcher
+        inst._group_index = groups.GroupIndex()
+        inst._search_index = search.SearchIndex()
+
+        inst._change_project("/jobs/show")
+
+        assert inst.project_root == "/jobs/show"
+        mock_watcher.stop.assert_called()
+        mock_create_watcher.assert_called_with(mock_backend.watch_paths.return_value)
+        assert inst._watcher == mock_create_watcher.return_value
+
+        # The indexes should be built again from the new project's history.
+        assert inst._group_index is None
+        assert inst._search_index is None
 
         mock_init_from_disk.assert_called()
 
+        # There may not be a watcher to stop.
+        mock_create_watcher.return_value = None
+        inst._change_project(None)
+        inst._change_project("/jobs/show")
+
+        assert inst._watcher is None
+
     def test__init_from_data(self, mocker, shared_datadir, init_test_manager):
         """Test RecentFileManager._init_from_data()."""
         data_file = shared_datadir / "test__init_from_data.json"
@@ -92,6 +207,13 @@ class TestRecentFileManager:
         # on the max display list, so patch it to 3 to ensure an item is removed.
         mocker.patch("houdini_recent_files_menu.constants.MAX_DISPLAY_FILES", 3)
 
+        mock_check = mocker.patch(
+            "houdini_recent_files_menu.file_status.check_files",
+            side_effect=lambda paths: {
+                path: None if path.name == "file4.hipnc" else file_status.FileStatus(True, 10, 20.0) for path in paths
+            },
+        )
+
         inst = init_test_manager()
         inst.files.append(None)  # Insert placeholder data to test that the list is cleared.
 
@@ -102,51 +224,178 @@ class TestRecentFileManager:
         # The expected ordering of file names from most recently opened to least recently.
         assert [f.path.name for f in inst.files] == ["file2.hipnc", "file4.hipnc", "file3.hipnc"]
 
-    def test__init_from_disk(self, mocker, init_test_manager):
+        # Only the displayed files should be checked, and unknown results should be preserved.
+        mock_check.assert_called_once()
+        assert [f.exists for f in inst.files] == [True, None, True]
+        assert [f.size for f in inst.files] == [10, None, 10]
+
+        # Each initialization should result in a new generation.
+        generation = inst.generation
+        inst._init_from_data(test_data)
+        assert inst.generation > generation > 0
+
+    def test__init_from_data__duplicates(self, mocker, monkeypatch, init_test_manager):
+        """Test that entries for the same file opened through different paths are combined."""
+        monkeypatch.setenv(constants.PATH_MAP_VAR_NAME, "/net/jobs=/jobs")
+        mocker.patch("houdini_recent_files_menu.file_status.check_files", side_effect=dict.fromkeys)
+
+        inst = init_test_manager()
+        inst._init_from_data({
+            "/net/jobs/show/file1.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 3},
+            "/jobs/show/file1.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 1},
+            "/jobs/show/file2.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 2},
+        })
+
+        assert [(f.posix_path, f.open_timestamp) for f in inst.files] == [
+            ("/jobs/show/file1.hip", 3),
+            ("/jobs/show/file2.hip", 2),
+        ]
+
+    def test__init_from_data__frecency(self, mocker, monkeypatch, init_test_manager):
+        """Test that the files with the highest frecency scores are listed when ordered by frecency."""
+        monkeypatch.setenv(constants.ORDER_VAR_NAME, constants.ORDER__FRECENCY)
+        mocker.patch("houdini_recent_files_menu.constants.MAX_DISPLAY_FILES", 2)
+        mocker.patch("houdini_recent_files_menu.file_status.check_files", side_effect=dict.fromkeys)
+
+        inst = init_test_manager()
+        inst._init_from_data({
+            "/jobs/show/file3.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 3},
+            "/jobs/show/file2.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 2, constants.DATA_NAME__FRECENCY: 10.0},
+            "/jobs/show/file1.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 1, constants.DATA_NAME__FRECENCY: 5.0},
+        })
+
+        assert [f.posix_path for f in inst.files] == ["/jobs/show/file2.hip", "/jobs/show/file1.hip"]
+
+    @pytest.mark.parametrize("order", (constants.ORDER__FRECENCY, constants.ORDER__RECENCY))
+    def test__init_from_disk(self, mocker, monkeypatch, init_test_manager, order):
         """Test RecentFileManager._init_from_disk()."""
-        mock_read = mocker.patch("houdini_recent_files_menu.filesystem.read_file_data")
+        monkeypatch.setenv(constants.ORDER_VAR_NAME, order)
+        mock_backend = mocker.patch("houdini_recent_files_menu.storage.get_storage_backend").return_value
+        mock_backend.read_data.return_value = {"/path/to/file2.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 2}}
+        mock_backend.read_scored_data.return_value = {
+            "/path/to/file1.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 1, constants.DATA_NAME__FRECENCY: 5.0}
+        }
         mock_update = mocker.patch.object(api.RecentFileManager, "update_last_access_time")
+        mock_update_index = mocker.patch.object(api.RecentFileManager, "_update_indexes")
         mock_init_from_data = mocker.patch.object(api.RecentFileManager, "_init_from_data")
 
         inst = init_test_manager()
         inst._init_from_disk()
 
         mock_update.assert_called()
-        mock_init_from_data.assert_called_with(mock_read.return_value)
+        mock_backend.read_data.assert_called_with(limit=constants.MAX_DISPLAY_FILES)
+
+        # The indexes are updated with the most recent files whatever the order.
+        mock_update_index.assert_called_with(mock_backend.read_data.return_value)
+
+        if order == constants.ORDER__FRECENCY:
+            # The most recent files are reused rather than read again.
+            mock_backend.read_data.assert_called_once()
+            mock_backend.read_scored_data.assert_called_with(limit=constants.MAX_DISPLAY_FILES)
+            mock_init_from_data.assert_called_with({
+                "/path/to/file2.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 2},
+                "/path/to/file1.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 1, constants.DATA_NAME__FRECENCY: 5.0},
+            })
+
+        else:
+            mock_backend.read_scored_data.assert_not_called()
+            mock_init_from_data.assert_called_with(mock_backend.read_data.return_value)
+
+    def test__update_indexes(self, mocker, init_test_manager):
+        """Test RecentFileManager._update_indexes()."""
+        inst = init_test_manager()
+
+        # Nothing should happen if the indexes have not been built.
+        inst._update_indexes({"/path/to/file1.hip": {}})
+
+        inst._group_index = mocker.MagicMock(spec=groups.GroupIndex)
+        inst._search_index = mocker.MagicMock(spec=search.SearchIndex)
+        inst._update_indexes({"/path/to/file1.hip": {}})
+
+        inst._group_index.update.assert_called_once_with({"/path/to/file1.hip": {}})
+        inst._search_index.update.assert_called_once_with({"/path/to/file1.hip": {}})
 
     def test_add_recent_file(self, mocker, init_test_manager):
         """Test RecentFileManager.add_recent_file()."""
-        mocker.patch("houdini_recent_files_menu.filesystem.read_file_data", return_value={})
-        mock_write = mocker.patch("houdini_recent_files_menu.filesystem.write_file_data")
+        mock_add = mocker.patch.object(api.RecentFileManager, "add_recent_files")
+
+        mock_recent = mocker.MagicMock(spec=api.RecentFile)
+
+        inst = init_test_manager()
+        inst.add_recent_file(mock_recent)
+
+        mock_add.assert_called_with([mock_recent])
+
+    def test_add_recent_files(self, mocker, init_test_manager):
+        """Test RecentFileManager.add_recent_files()."""
+        mock_backend = mocker.patch("houdini_recent_files_menu.storage.get_storage_backend").return_value
+        mock_invalidate = mocker.patch("houdini_recent_files_menu.file_status.invalidate_directory")
 
         mock_update = mocker.patch.object(api.RecentFileManager, "update_last_access_time")
+        mock_update_index = mocker.patch.object(api.RecentFileManager, "_update_indexes")
         mock_init_from_data = mocker.patch.object(api.RecentFileManager, "_init_from_data")
 
-        recent_data = {"/path/to/file1": {"foo": "bar"}}
+        recent_files = []
 
-        mock_recent = mocker.MagicMock(spec=api.RecentFile)
-        mock_recent.as_json.return_value = recent_data
+        for name in ("file1", "file2"):
+            mock_recent = mocker.MagicMock(spec=api.RecentFile)
+            mock_recent.path = pathlib.Path(f"/path/to/{name}")
+            mock_recent.as_json.return_value = {f"/path/to/{name}": {"foo": name}}
+            recent_files.append(mock_recent)
 
         inst = init_test_manager()
-        inst.add_recent_file(mock_recent)
+        inst.add_recent_files(recent_files)
 
         mock_update.assert_called()
-        mock_write.assert_called_with(recent_data)
-        mock_init_from_data.assert_called_with(recent_data)
+
+        # All the files should be added with a single write.
+        mock_backend.add_entries.assert_called_once_with({
+            "/path/to/file1": {"foo": "file1"},
+            "/path/to/file2": {"foo": "file2"},
+        })
+        mock_update_index.assert_called_once_with(mock_backend.add_entries.call_args[0][0])
+
+        # The shared directory should only be invalidated once.
+        mock_invalidate.assert_called_once_with(pathlib.Path("/path/to"))
+        mock_backend.read_data.assert_called_with(limit=constants.MAX_DISPLAY_FILES)
+        mock_init_from_data.assert_called_with(mock_backend.read_data.return_value)
+
+    def test_add_recent_files__canonical(self, mocker, monkeypatch, init_test_manager):
+        """Test that files are added under their canonical path."""
+        monkeypatch.setenv(constants.PATH_MAP_VAR_NAME, "/net/jobs=/jobs")
+        mock_backend = mocker.patch("houdini_recent_files_menu.storage.get_storage_backend").return_value
+        mock_invalidate = mocker.patch("houdini_recent_files_menu.file_status.invalidate_directory")
+        mocker.patch.object(api.RecentFileManager, "_init_from_data")
+
+        inst = init_test_manager()
+        inst.add_recent_files([
+            api.RecentFile("/net/jobs/show/file1.hip", 1, None),
+            api.RecentFile("/jobs/show/file1.hip", 2, "20.5.1"),
+        ])
+
+        mock_backend.add_entries.assert_called_once_with({
+            "/jobs/show/file1.hip": {
+                constants.DATA_NAME__OPEN_TIMESTAMP: 2,
+                constants.DATA_NAME__SAVE_VERSION: "20.5.1",
+            }
+        })
+        mock_invalidate.assert_called_once_with(pathlib.Path("/jobs/show"))
 
     @pytest.mark.parametrize(
-        "last_modified,last_access,expect_update",
+        "last_modified,last_access,late_listings,expect_update",
         (
-            (10, 100, False),
-            (100, 100, False),
-            (110, 100, True),
+            (10, 100, 0, True),
+            (100, 100, 0, False),
+            (110, 100, 0, True),
+            # Directories which could not be checked in time have been listed since.
+            (100, 100, 1, True),
         ),
     )
-    def test_refresh_data(self, mocker, init_test_manager, last_modified, last_access, expect_update):
+    def test_refresh_data(self, mocker, init_test_manager, last_modified, last_access, late_listings, expect_update):
         """Test RecentFileManager.refresh_data()."""
-        mocker.patch(
-            "houdini_recent_files_menu.filesystem.get_source_file_modification_time", return_value=last_modified
-        )
+        mock_backend = mocker.patch("houdini_recent_files_menu.storage.get_storage_backend").return_value
+        mock_backend.modification_time.return_value = last_modified
+        mocker.patch("houdini_recent_files_menu.file_status.late_listing_count", return_value=late_listings)
 
         mock_init_from_disk = mocker.patch.object(api.RecentFileManager, "_init_from_disk")
 
@@ -157,87 +406,334 @@ class TestRecentFileManager:
 
         assert mock_init_from_disk.call_count == int(expect_update)
 
-    def test_update_last_access_time(self, init_test_manager):
-        """Test RecentFileManager.update_last_access_time()."""
+    @pytest.mark.parametrize("changed", (True, False))
+    def test_refresh_data__watcher(self, mocker, init_test_manager, changed):
+        """Test RecentFileManager.refresh_data() when a watcher is running."""
+        mock_get_backend = mocker.patch("houdini_recent_files_menu.storage.get_storage_backend")
+        mock_init_from_disk = mocker.patch.object(api.RecentFileManager, "_init_from_disk")
+
+        mock_watcher = mocker.MagicMock(spec=watcher.FileWatcher)
+        mock_watcher.check_changed.return_value = changed
+
         inst = init_test_manager()
-        assert inst.last_access_time == 0
+        inst._watcher = mock_watcher
 
-        inst.update_last_access_time()
-        assert inst.last_access_time > 0
+        inst.refresh_data()
 
+        assert mock_init_from_disk.call_count == int(changed)
 
-class Test__reduce_entries:
-    """Test houdini_recent_files_menu.api._reduce_entries()."""
+        # The filesystem should not be accessed to determine whether anything changed.
+        mock_get_backend.assert_not_called()
 
-    def test_less_than(self, mocker):
-        """Test _reduce_entries() with less than the max files."""
-        mocker.patch("houdini_recent_files_menu.constants.MAX_RECENT_FILES", 2)
+    def test_refresh_data__project(self, mocker, monkeypatch, init_test_manager):
+        """Test that the files for the current project are loaded if it has changed."""
+        monkeypatch.setenv(constants.SHARD_VAR_NAME, "job")
+        monkeypatch.setenv("JOB", "/jobs/show")
+        mock_change = mocker.patch.object(api.RecentFileManager, "_change_project")
 
-        mock_data = mocker.MagicMock(spec=dict)
-        mock_data.__len__.return_value = 1
+        inst = init_test_manager()
+        inst.refresh_data()
+
+        mock_change.assert_called_once_with("/jobs/show")
 
-        result = api._reduce_entries(mock_data)
-        assert result == mock_data
+    def test_get_group_files(self, mocker, init_test_manager):
+        """Test RecentFileManager.get_group_files()."""
+        mocker.patch("houdini_recent_files_menu.constants.MAX_DISPLAY_FILES", 1)
+        mocker.patch(
+            "houdini_recent_files_menu.file_status.check_files",
+            side_effect=lambda paths: dict.fromkeys(paths, file_status.FileStatus(True, 10, 20.0)),
+        )
 
-    def test_equal(self, mocker):
-        """Test _reduce_entries() with the max files."""
-        mocker.patch("houdini_recent_files_menu.constants.MAX_RECENT_FILES", 2)
+        inst = init_test_manager()
+        inst._group_index = groups.GroupIndex({
+            "/path/to/file1.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 1},
+            "/path/to/file2.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 2},
+            "/path/other/file3.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 3},
+        })
 
-        mock_data = mocker.MagicMock(spec=dict)
-        mock_data.__len__.return_value = 2
+        result = inst.get_group_files("/path/to")
 
-        result = api._reduce_entries(mock_data)
-        assert result == mock_data
+        assert [recent_file.posix_path for recent_file in result] == ["/path/to/file2.hip"]
+        assert result[0].exists
 
-    def test_greater_than(self, mocker):
-        """Test _reduce_entries() with more than the max files."""
-        mocker.patch("houdini_recent_files_menu.constants.MAX_RECENT_FILES", 2)
+    def test_get_group_index(self, mocker, monkeypatch, init_test_manager):
+        """Test RecentFileManager.get_group_index()."""
+        monkeypatch.setenv(constants.GROUP_DEPTH_VAR_NAME, "1")
 
-        test_data = {
-            "/path/to/file3.hip": {
-                constants.DATA_NAME__OPEN_TIMESTAMP: 25,
-                constants.DATA_NAME__SAVE_VERSION: "20.5.789",
-            },
-            "/path/to/file1.hip": {
-                constants.DATA_NAME__OPEN_TIMESTAMP: 45,
-                constants.DATA_NAME__SAVE_VERSION: "20.5.123",
-            },
-            "/path/to/file2.hip": {
-                constants.DATA_NAME__OPEN_TIMESTAMP: 35,
-                constants.DATA_NAME__SAVE_VERSION: "20.5.456",
-            },
+        mock_backend = mocker.patch("houdini_recent_files_menu.storage.get_storage_backend").return_value
+        mock_backend.read_history.return_value = {
+            "/path/to/file1.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 1},
         }
 
-        result = api._reduce_entries(test_data)
+        inst = init_test_manager()
 
-        assert result == {
-            "/path/to/file1.hip": {
-                constants.DATA_NAME__OPEN_TIMESTAMP: 45,
-                constants.DATA_NAME__SAVE_VERSION: "20.5.123",
-            },
-            "/path/to/file2.hip": {
-                constants.DATA_NAME__OPEN_TIMESTAMP: 35,
-                constants.DATA_NAME__SAVE_VERSION: "20.5.456",
-            },
+        result = inst.get_group_index()
+
+        assert isinstance(result, groups.GroupIndex)
+        assert result.groups() == [("/path", 1)]
+
+        # The index should only be built once.
+        assert inst.get_group_index() is result
+        mock_backend.read_history.assert_called_once()
+
+    def test_get_search_index(self, mocker, init_test_manager):
+        """Test RecentFileManager.get_search_index()."""
+        mock_backend = mocker.patch("houdini_recent_files_menu.storage.get_storage_backend").return_value
+        mock_backend.read_history.return_value = {
+            "/path/to/file1.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 1},
         }
 
+        inst = init_test_manager()
+
+        result = inst.get_search_index()
+
+        assert isinstance(result, search.SearchIndex)
+        assert len(result) == 1
+
+        # The index should only be built once.
+        assert inst.get_search_index() is result
+        mock_backend.read_history.assert_called_once()
+
+    def test_search(self, mocker, init_test_manager):
+        """Test RecentFileManager.search()."""
+        mocker.patch(
+            "houdini_recent_files_menu.file_status.check_files",
+            side_effect=lambda paths: dict.fromkeys(paths, file_status.FileStatus(True, 10, 20.0)),
+        )
+        mock_backend = mocker.patch("houdini_recent_files_menu.storage.get_storage_backend").return_value
+        mock_backend.modification_time.return_value = 0
+
+        inst = init_test_manager()
+        inst._search_index = search.SearchIndex({
+            "/path/to/file1.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 1, constants.DATA_NAME__SAVE_VERSION: "20.5.1"},
+            "/path/to/file2.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 2},
+            "/path/to/other.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 3},
+        })
+
+        result = inst.search("FILE")
+
+        assert [recent_file.posix_path for recent_file in result] == ["/path/to/file2.hip", "/path/to/file1.hip"]
+        assert result[1].save_version == "20.5.1"
+        assert all(recent_file.exists for recent_file in result)
+
+        assert len(inst.search("file", limit=1)) == 1
+
+        # Files opened in other sessions should be found even when the number of matches is limited.
+        mock_backend.modification_time.return_value = 1
+        mock_backend.read_data.return_value = {"/path/to/file3.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 4}}
+
+        assert [recent_file.posix_path for recent_file in inst.search("file", limit=1)] == ["/path/to/file3.hip"]
+
+    def test_remove_recent_files(self, mocker, init_test_manager):
+        """Test RecentFileManager.remove_recent_files()."""
+        mock_backend = mocker.patch("houdini_recent_files_menu.storage.get_storage_backend").return_value
+
+        mock_update = mocker.patch.object(api.RecentFileManager, "update_last_access_time")
+        mock_init_from_data = mocker.patch.object(api.RecentFileManager, "_init_from_data")
+
+        inst = init_test_manager()
+        inst._group_index = groups.GroupIndex()
+        inst._search_index = search.SearchIndex()
+
+        data = {"/path/to/file1.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 1}}
+
+        inst.remove_recent_files(data)
+
+        mock_backend.remove_entries.assert_called_once_with(data)
+
+        # The indexes should be built again when next required.
+        assert inst._group_index is None
+        assert inst._search_index is None
+
+        mock_update.assert_called()
+        mock_backend.read_data.assert_called_with(limit=constants.MAX_DISPLAY_FILES)
+        mock_init_from_data.assert_called_with(mock_backend.read_data.return_value)
+
+    def test_update_last_access_time(self, mocker, init_test_manager):
+        """Test RecentFileManager.update_last_access_time()."""
+        mock_backend = mocker.patch("houdini_recent_files_menu.storage.get_storage_backend").return_value
+        mock_backend.modification_time.return_value = 123
+
+        inst = init_test_manager()
+        assert inst.last_access_time == 0
+
+        inst.update_last_access_time()
+        assert inst.last_access_time == 123
+
+
+# Non-Public Functions
+
 
 @pytest.mark.parametrize("hip_version,expected_version", (("20.5.456", "20.5.456"), ("", None)))
-def test_add_current_hip_to_recent_files(mocker, hip_version, expected_version):
-    """Test houdini_recent_files_menu.api.add_path_to_recent_files()."""
+def test__get_current_hip_recent_file(mocker, hip_version, expected_version):
+    """Test houdini_recent_files_menu.api._get_current_hip_recent_file()."""
     mocker.patch("hou.hipFile.path", return_value="/path/to/file1.hip")
     mocker.patch("time.time", return_value=123456)
     mocker.patch("hou.text.expandString", return_value=hip_version)
+    mock_canonical = mocker.patch("houdini_recent_files_menu.canonical.canonical_path")
+
+    result = api._get_current_hip_recent_file()
+
+    assert result == api.RecentFile("/path/to/file1.hip", 123456, expected_version)
+
+    # The path is made canonical when it is written, rather than on the main thread.
+    mock_canonical.assert_not_called()
+
+
+def test__get_write_queue(mocker, monkeypatch):
+    """Test houdini_recent_files_menu.api._get_write_queue()."""
+    mock_register = mocker.patch("atexit.register")
+    monkeypatch.setenv(constants.WRITE_DELAY_VAR_NAME, "2")
+
+    api._get_write_queue.cache_clear()
+
+    result = api._get_write_queue()
+
+    assert isinstance(result, writer.WriteBehindQueue)
+    assert result.delay == pytest.approx(2.0)
+    assert api._get_write_queue() is result
 
+    # Anything still queued should be written at exit.
+    mock_register.assert_called_once_with(result.flush)
+
+    api._get_write_queue.cache_clear()
+
+
+@pytest.mark.parametrize("order", (constants.ORDER__FRECENCY, constants.ORDER__RECENCY))
+def test__read_display_data(mocker, monkeypatch, order):
+    """Test houdini_recent_files_menu.api._read_display_data()."""
+    monkeypatch.setenv(constants.ORDER_VAR_NAME, order)
+    mocker.patch("houdini_recent_files_menu.constants.MAX_DISPLAY_FILES", 5)
+    mock_backend = mocker.MagicMock(spec=storage.StorageBackend)
+
+    result = api._read_display_data(mock_backend)
+
+    if order == constants.ORDER__FRECENCY:
+        assert result == mock_backend.read_frecent_data.return_value
+        mock_backend.read_frecent_data.assert_called_once_with(limit=5)
+
+    else:
+        assert result == mock_backend.read_data.return_value
+        mock_backend.read_data.assert_called_once_with(limit=5)
+
+
+def test__write_recent_files(mocker):
+    """Test houdini_recent_files_menu.api._write_recent_files()."""
+    mock_mgr = mocker.patch("houdini_recent_files_menu.api.RecentFileManager")
+
+    recent_files = [mocker.MagicMock(spec=api.RecentFile)]
+
+    api._write_recent_files(recent_files)
+
+    mock_mgr.return_value.add_recent_files.assert_called_with(recent_files)
+
+
+# Functions
+
+
+def test_add_current_hip_to_recent_files(mocker):
+    """Test houdini_recent_files_menu.api.add_current_hip_to_recent_files()."""
+    mock_get = mocker.patch("houdini_recent_files_menu.api._get_current_hip_recent_file")
     mock_mgr = mocker.patch("houdini_recent_files_menu.api.RecentFileManager")
-    mock_recent = mocker.patch("houdini_recent_files_menu.api.RecentFile")
 
     api.add_current_hip_to_recent_files()
 
-    mock_recent.assert_called_with(
-        pathlib.Path("/path/to/file1.hip"),
-        123456,
-        expected_version,
+    mock_mgr.return_value.add_recent_file.assert_called_with(mock_get.return_value)
+
+
+def test_get_other_projects(tmp_path, monkeypatch):
+    """Test houdini_recent_files_menu.api.get_other_projects()."""
+    source_path = tmp_path / "recent_houdini_files.json"
+    monkeypatch.setenv(constants.RECENT_FILE_SOURCE_VAR_NAME, source_path.as_posix())
+    monkeypatch.delenv(constants.STORAGE_MODE_VAR_NAME, raising=False)
+    monkeypatch.delenv(constants.SHARD_VAR_NAME, raising=False)
+
+    project_a, project_b, project_c = (filesystem.project_key(root) for root in ("/jobs/a", "/jobs/b", "/jobs/c"))
+
+    for project, modified in ((project_a, 300), (project_b, 100), (project_c, None), (None, 200)):
+        path = filesystem.project_source_file_path(project)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if modified is not None:
+            path.write_text("{}")
+            os.utime(path, (modified, modified))
+
+    # Projects without any history should be left out.
+    assert api.get_other_projects() == [(project_a, 300), (project_b, 100)]
+
+    monkeypatch.setenv(constants.SHARD_VAR_NAME, "job")
+    monkeypatch.setenv("JOB", "/jobs/a")
+
+    assert api.get_other_projects() == [(None, 200), (project_b, 100)]
+
+
+def test_get_project_recent_files(mocker):
+    """Test houdini_recent_files_menu.api.get_project_recent_files()."""
+    mocker.patch("houdini_recent_files_menu.constants.MAX_DISPLAY_FILES", 5)
+    mock_get = mocker.patch("houdini_recent_files_menu.storage.get_project_backend")
+    mock_get.return_value.read_data.return_value = {"/jobs/show/file1.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 1}}
+    mocker.patch("houdini_recent_files_menu.file_status.check_files", side_effect=dict.fromkeys)
+
+    result = api.get_project_recent_files("jobs_show")
+
+    mock_get.assert_called_with("jobs_show")
+    mock_get.return_value.read_data.assert_called_with(limit=5)
+    assert [recent_file.posix_path for recent_file in result] == ["/jobs/show/file1.hip"]
+
+
+def test_get_team_recent_files(mocker):
+    """Test houdini_recent_files_menu.api.get_team_recent_files()."""
+    mocker.patch("houdini_recent_files_menu.constants.MAX_DISPLAY_FILES", 5)
+    mock_get = mocker.patch("houdini_recent_files_menu.team.get_team_history")
+    mock_get.return_value.top.return_value = [
+        team.TeamFile("bob", "/b/file2.hip", {constants.DATA_NAME__OPEN_TIMESTAMP: 2}),
+        team.TeamFile("alice", "/a/file1.hip", {constants.DATA_NAME__OPEN_TIMESTAMP: 1}),
+    ]
+    mocker.patch(
+        "houdini_recent_files_menu.file_status.check_files",
+        side_effect=lambda paths: dict.fromkeys(paths, file_status.FileStatus(True, 10, 20.0)),
     )
 
-    mock_mgr.return_value.add_recent_file.assert_called_with(mock_recent.return_value)
+    result = api.get_team_recent_files()
+
+    mock_get.return_value.top.assert_called_with(5)
+    assert [(user, recent_file.posix_path) for user, recent_file in result] == [
+        ("bob", "/b/file2.hip"),
+        ("alice", "/a/file1.hip"),
+    ]
+    assert all(recent_file.exists for _, recent_file in result)
+
+    mock_get.return_value = None
+    assert api.get_team_recent_files() == []
+
+
+@pytest.mark.parametrize("prunable", ({}, {"/path/to/file1.hip": {constants.DATA_NAME__OPEN_TIMESTAMP: 1}}))
+def test_prune_missing_recent_files(mocker, prunable):
+    """Test houdini_recent_files_menu.api.prune_missing_recent_files()."""
+    mock_backend = mocker.patch("houdini_recent_files_menu.storage.get_storage_backend").return_value
+    mock_find = mocker.patch("houdini_recent_files_menu.prune.find_prunable_entries", return_value=prunable)
+    mock_mgr = mocker.patch("houdini_recent_files_menu.api.RecentFileManager")
+
+    assert api.prune_missing_recent_files() == len(prunable)
+
+    mock_find.assert_called_with(mock_backend.read_data.return_value)
+
+    if prunable:
+        mock_mgr.return_value.remove_recent_files.assert_called_with(prunable)
+
+    else:
+        mock_mgr.assert_not_called()
+
+
+def test_queue_current_hip_for_recent_files(mocker):
+    """Test houdini_recent_files_menu.api.queue_current_hip_for_recent_files()."""
+    mock_get = mocker.patch("houdini_recent_files_menu.api._get_current_hip_recent_file")
+    mock_get_queue = mocker.patch("houdini_recent_files_menu.api._get_write_queue")
+    mock_mgr = mocker.patch("houdini_recent_files_menu.api.RecentFileManager")
+
+    api.queue_current_hip_for_recent_files()
+
+    mock_get_queue.return_value.enqueue.assert_called_with(mock_get.return_value.posix_path, mock_get.return_value)
+
+    # Nothing should be written immediately.
+    mock_mgr.assert_not_called()
@@ -0,0 +1,109 @@
+"""Test the houdini_recent_files_menu.archive module."""
+
+# Standard Library
+import gzip
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import archive, constants
+
+# Tests
+
+
+def _entry(timestamp):
+    return {constants.DATA_NAME__OPEN_TIMESTAMP: timestamp, constants.DATA_NAME__SAVE_VERSION: None}
+
+
+class TestArchive:
+    """Test the houdini_recent_files_menu.archive.Archive object."""
+
+    def test_append_and_read(self, tmp_path):
+        """Test appending entries and reading them back."""
+        inst = archive.Archive(tmp_path / "archive")
+
+        assert inst.segments() == []
+        assert inst.read() == {}
+
+        # Nothing should be created when there is nothing to archive.
+        inst.append({})
+        assert not inst.directory.exists()
+
+        inst.append({"/file1.hip": _entry(1), "/file2.hip": _entry(2)})
+        inst.append({"/file1.hip": _entry(3)})
+
+        # Appends should go to the same segment.
+        assert len(inst.segments()) == 1
+        assert list(inst.iter_entries()) == [
+            ("/file1.hip", _entry(1)),
+            ("/file2.hip", _entry(2)),
+            ("/file1.hip", _entry(3)),
+        ]
+
+        # The most recent entry for each path should be kept.
+        assert inst.read() == {"/file1.hip": _entry(3), "/file2.hip": _entry(2)}
+
+        # An older entry archived later should not replace a newer one.
+        inst.append({"/file1.hip": _entry(0)})
+        assert inst.read()["/file1.hip"] == _entry(3)
+
+    def test_append__new_segment(self, tmp_path):
+        """Test that a new segment is started once the current one is full."""
+        inst = archive.Archive(tmp_path / "archive", segment_size=1)
+
+        inst.append({"/file1.hip": _entry(1)})
+        inst.append({"/file2.hip": _entry(2)})
+        inst.append({"/file3.hip": _entry(3)})
+
+        segments = inst.segments()
+
+        assert len(segments) == 3
+        assert segments == sorted(segments)
+        assert [path for path, _ in inst.iter_entries()] == ["/file1.hip", "/file2.hip", "/file3.hip"]
+
+        # No temporary files should be left behind from sealing segments.
+        assert sorted(path.name for path in inst.directory.iterdir()) == sorted(path.name for path in segments)
+
+    def test_read__damaged(self, tmp_path):
+        """Test that damaged records and segments are skipped."""
+        inst = archive.Archive(tmp_path / "archive")
+        inst.append({"/file1.hip": _entry(1)})
+
+        segment = inst.segments()[0]
+
+        with gzip.open(segment, "at", encoding="utf-8") as handle:
+            handle.write('not json\n[]\n{"/file2.hip": {}}\n{"/file3.hip": "foo"}\n')
+
+        # A truncated member, as if it was still being written.
+        with segment.open("ab") as handle:
+            handle.write(gzip.compress(b'{"/file4.hip": {"open_timestamp": 4}}\n')[:-10])
+
+        # A segment which is not compressed at all.
+        (inst.directory / f"99999999999999999999{constants.ARCHIVE_SEGMENT_SUFFIX}").write_text("foo")
+
+        assert inst.read() == {"/file1.hip": _entry(1)}
+
+
+# Non-Public Functions
+
+
+def test__seal_segment(tmp_path):
+    """Test houdini_recent_files_menu.archive._seal_segment()."""
+    segment = tmp_path / f"1{constants.ARCHIVE_SEGMENT_SUFFIX}"
+    segment.write_bytes(gzip.compress(b"line1\n") + gzip.compress(b"line2\n"))
+
+    archive._seal_segment(segment)
+
+    assert gzip.decompress(segment.read_bytes()) == b"line1\nline2\n"
+
+    # The segment should now be a single member.
+    assert segment.read_bytes().count(b"\x1f\x8b\x08") == 1
+
+
+def test__seal_segment__damaged(tmp_path):
+    """Test houdini_recent_files_menu.archive._seal_segment() with a damaged segment."""
+    segment = tmp_path / f"1{constants.ARCHIVE_SEGMENT_SUFFIX}"
+    segment.write_bytes(b"foo")
+
+    archive._seal_segment(segment)
+
+    assert segment.read_bytes() == b"foo"
+    assert [path.name for path in tmp_path.iterdir()] == [segment.name]
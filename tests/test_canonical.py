@@ -0,0 +1,98 @@
+"""Test the houdini_recent_files_menu.canonical module."""
+
+# Standard Library
+import os
+
+# Third Party
+import pytest
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import canonical, constants
+
+# Fixtures
+
+
+@pytest.fixture(autouse=True)
+def clear_canonical_cache(monkeypatch):
+    """Fixture to automatically clear any remembered canonical paths and settings."""
+    monkeypatch.delenv(constants.PATH_MAP_VAR_NAME, raising=False)
+    monkeypatch.delenv(constants.RESOLVE_PATHS_VAR_NAME, raising=False)
+
+    canonical._canonicalize.cache_clear()
+
+
+def _entry(timestamp):
+    return {constants.DATA_NAME__OPEN_TIMESTAMP: timestamp}
+
+
+# Non-Public Functions
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    (
+        ("/net/jobs/show/file.hip", "/jobs/show/file.hip"),
+        ("/net/jobs", "/jobs"),
+        ("/net/jobsite/file.hip", "/net/jobsite/file.hip"),
+        ("/automount/jobs/show/file.hip", "/jobs/show/file.hip"),
+        ("/home/user/file.hip", "/home/user/file.hip"),
+    ),
+)
+def test__canonicalize(path, expected):
+    """Test houdini_recent_files_menu.canonical._canonicalize()."""
+    path_map = (("/net/jobs/", "/jobs/"), ("/automount/jobs", "/jobs"), ("/automount", "/other"))
+
+    assert canonical._canonicalize(path, path_map, resolve=False) == expected
+
+
+def test__canonicalize__resolve(tmp_path, mocker):
+    """Test resolving symbolic links and ".." segments."""
+    (tmp_path / "jobs" / "show").mkdir(parents=True)
+    (tmp_path / "link").symlink_to(tmp_path / "jobs")
+
+    mock_realpath = mocker.patch("os.path.realpath", wraps=os.path.realpath)
+
+    expected = (tmp_path / "jobs" / "show" / "file.hip").as_posix()
+
+    for path in ("link/show/file.hip", "jobs/other/../show/file.hip", "link/show/file.hip"):
+        assert canonical._canonicalize((tmp_path / path).as_posix(), (), resolve=True) == expected
+
+    # Each path should only be resolved once.
+    assert mock_realpath.call_count == 2
+
+
+# Functions
+
+
+def test_canonical_path(tmp_path, monkeypatch):
+    """Test houdini_recent_files_menu.canonical.canonical_path()."""
+    (tmp_path / "jobs").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "jobs")
+
+    path = (tmp_path / "link" / "file.hip").as_posix()
+
+    assert canonical.canonical_path(path) == path
+
+    monkeypatch.setenv(constants.RESOLVE_PATHS_VAR_NAME, "1")
+    assert canonical.canonical_path(path) == (tmp_path / "jobs" / "file.hip").as_posix()
+
+    monkeypatch.setenv(constants.PATH_MAP_VAR_NAME, f"{tmp_path.as_posix()}/jobs=/jobs")
+    assert canonical.canonical_path(path) == "/jobs/file.hip"
+
+
+def test_collapse_duplicates(monkeypatch):
+    """Test houdini_recent_files_menu.canonical.collapse_duplicates()."""
+    data = {
+        "/net/jobs/file1.hip": _entry(1),
+        "/jobs/file1.hip": _entry(3),
+        "/jobs/file2.hip": _entry(2),
+        "/net/jobs/file2.hip": _entry(1),
+    }
+
+    # Nothing should change unless paths are made canonical.
+    assert canonical.collapse_duplicates(data) is data
+
+    monkeypatch.setenv(constants.PATH_MAP_VAR_NAME, "/net/jobs=/jobs")
+
+    # The most recently opened entry for each file should be kept.
+    assert canonical.collapse_duplicates(data) == {"/jobs/file1.hip": _entry(3), "/jobs/file2.hip": _entry(2)}
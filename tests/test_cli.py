@@ -0,0 +1,170 @@
+"""Test the houdini_recent_files_menu.cli module."""
+
+# Standard Library
+import csv
+import datetime
+import json
+import runpy
+import sys
+
+# Third Party
+import pytest
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import cli, constants, storage
+
+# Fixtures
+
+
+@pytest.fixture(autouse=True)
+def source_path(tmp_path, monkeypatch):
+    """Fixture providing a JSON source file which the storage backend reads."""
+    path = tmp_path / "recent_houdini_files.json"
+    path.write_text(
+        json.dumps({
+            "/proj/shot010/fx/explosion_v001.hip": _entry(1),
+            "/proj/shot020/fx/smoke_v003.hip": _entry(3),
+            "/proj/shot010/lighting/explosion_lgt_v002.hip": _entry(2),
+        })
+    )
+
+    monkeypatch.setenv(constants.RECENT_FILE_SOURCE_VAR_NAME, path.as_posix())
+    monkeypatch.delenv(constants.ARCHIVE_VAR_NAME, raising=False)
+    monkeypatch.delenv(constants.STORAGE_MODE_VAR_NAME, raising=False)
+
+    storage._create_backend.cache_clear()
+
+    yield path
+
+    storage._create_backend.cache_clear()
+
+
+def _entry(timestamp):
+    return {constants.DATA_NAME__OPEN_TIMESTAMP: timestamp, constants.DATA_NAME__SAVE_VERSION: "20.5.1"}
+
+
+# Tests
+
+
+def test___main__(monkeypatch, capsys):
+    """Test running the package as a module."""
+    monkeypatch.setattr(sys, "argv", ["houdini_recent_files_menu", "list", "--limit", "1", "--format", "json"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        runpy.run_module("houdini_recent_files_menu", run_name="__main__")
+
+    assert exc_info.value.code == 0
+    assert json.loads(capsys.readouterr().out) == [{"path": "/proj/shot020/fx/smoke_v003.hip", **_entry(3)}]
+
+
+# Non-Public Functions
+
+
+def test__compact(source_path, mocker, capsys):
+    """Test the compact command."""
+    mocker.patch("houdini_recent_files_menu.constants.MAX_RECENT_FILES", 2)
+
+    assert cli.main(["compact"]) == 0
+    assert capsys.readouterr().out == "Removed 1 entries.\n"
+    assert list(json.loads(source_path.read_text())) == [
+        "/proj/shot020/fx/smoke_v003.hip",
+        "/proj/shot010/lighting/explosion_lgt_v002.hip",
+    ]
+
+
+def test__export(tmp_path, capsys):
+    """Test the export command."""
+    assert cli.main(["export"]) == 0
+
+    assert json.loads(capsys.readouterr().out) == [
+        {"path": "/proj/shot020/fx/smoke_v003.hip", **_entry(3)},
+        {"path": "/proj/shot010/lighting/explosion_lgt_v002.hip", **_entry(2)},
+        {"path": "/proj/shot010/fx/explosion_v001.hip", **_entry(1)},
+    ]
+
+    output_path = tmp_path / "history.csv"
+
+    assert cli.main(["export", "--format", "csv", "--output", output_path.as_posix()]) == 0
+    assert not capsys.readouterr().out
+
+    with output_path.open(encoding="utf-8", newline="") as handle:
+        rows = list(csv.DictReader(handle))
+
+    assert [row["path"] for row in rows] == [
+        "/proj/shot020/fx/smoke_v003.hip",
+        "/proj/shot010/lighting/explosion_lgt_v002.hip",
+        "/proj/shot010/fx/explosion_v001.hip",
+    ]
+    assert rows[0][constants.DATA_NAME__OPEN_TIMESTAMP] == "3"
+    assert rows[0][constants.DATA_NAME__SAVE_VERSION] == "20.5.1"
+
+
+def test__export__empty(source_path, capsys):
+    """Test the export command with no history."""
+    source_path.unlink()
+
+    assert cli.main(["export"]) == 0
+    assert json.loads(capsys.readouterr().out) == []
+
+
+def test__list(capsys):
+    """Test the list command."""
+    assert cli.main(["list", "--limit", "2"]) == 0
+
+    # All the entries were opened within the same minute.
+    opened = datetime.datetime.fromtimestamp(1).strftime(constants.TIMESTAMP_FORMAT)
+
+    assert capsys.readouterr().out.splitlines() == [
+        f"/proj/shot020/fx/smoke_v003.hip                (20.5.1)  {opened}",
+        f"/proj/shot010/lighting/explosion_lgt_v002.hip  (20.5.1)  {opened}",
+    ]
+
+    assert cli.main(["list", "--format", "json"]) == 0
+    assert len(json.loads(capsys.readouterr().out)) == 3
+
+
+def test__prune(source_path, mocker, capsys):
+    """Test the prune command."""
+    mocker.patch(
+        "houdini_recent_files_menu.prune.find_prunable_entries",
+        return_value={"/proj/shot020/fx/smoke_v003.hip": _entry(3)},
+    )
+
+    assert cli.main(["prune"]) == 0
+    assert capsys.readouterr().out == "Removed 1 entries.\n"
+    assert "/proj/shot020/fx/smoke_v003.hip" not in json.loads(source_path.read_text())
+
+    mocker.patch("houdini_recent_files_menu.prune.find_prunable_entries", return_value={})
+
+    assert cli.main(["prune"]) == 0
+    assert capsys.readouterr().out == "Removed 0 entries.\n"
+
+
+def test__search(capsys):
+    """Test the search command."""
+    assert cli.main(["search", "EXPLOSION", "shot010", "--format", "csv"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "path,open_timestamp,save_version",
+        "/proj/shot010/lighting/explosion_lgt_v002.hip,2,20.5.1",
+        "/proj/shot010/fx/explosion_v001.hip,1,20.5.1",
+    ]
+
+    assert cli.main(["search", "explosion", "--limit", "1", "--format", "json"]) == 0
+    assert json.loads(capsys.readouterr().out) == [
+        {"path": "/proj/shot010/lighting/explosion_lgt_v002.hip", **_entry(2)}
+    ]
+
+    # Nothing matching should be reported with the exit code.
+    assert cli.main(["search", "missing"]) == 1
+    assert not capsys.readouterr().out
+
+
+# Functions
+
+
+def test_main(capsys):
+    """Test houdini_recent_files_menu.cli.main()."""
+    with pytest.raises(SystemExit):
+        cli.main([])
+
+    assert "usage: houdini_recent_files_menu" in capsys.readouterr().err
@@ -0,0 +1,372 @@
+"""Test the houdini_recent_files_menu.file_status module."""
+
+# Standard Library
+import concurrent.futures
+import json
+import os
+import pathlib
+import threading
+import time
+
+# Third Party
+import pytest
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, file_status
+
+# Fixtures
+
+
+@pytest.fixture(autouse=True)
+def clear_cached_state():
+    """Fixture to automatically clear any outstanding scans and loaded caches."""
+    file_status._PENDING_SCANS.clear()
+    file_status._get_stat_cache.cache_clear()
+
+
+@pytest.fixture
+def cache_file(tmp_path, mocker):
+    """Fixture to redirect the stat cache file into a temp directory."""
+    path = tmp_path / "stat_cache.json"
+    mocker.patch("houdini_recent_files_menu.filesystem.stat_cache_file_path", return_value=path)
+
+    return path
+
+
+@pytest.fixture
+def hip_dir(tmp_path):
+    """Fixture providing a directory containing some hip files."""
+    path = tmp_path / "shot"
+    path.mkdir()
+
+    (path / "a.hip").write_text("a")
+    (path / "b.hip").write_text("bb")
+    (path / "other.txt").touch()
+
+    return path
+
+
+# Tests
+
+
+class TestFileStatus:
+    """Test the houdini_recent_files_menu.file_status.FileStatus object."""
+
+    def test_as_json(self):
+        """Test FileStatus.as_json()."""
+        inst = file_status.FileStatus(exists=True, size=12, modified=34.5)
+
+        assert inst.as_json() == [True, 12, 34.5]
+
+
+class TestDirectoryListing:
+    """Test the houdini_recent_files_menu.file_status.DirectoryListing object."""
+
+    def test_as_json(self):
+        """Test DirectoryListing.as_json()."""
+        inst = file_status.DirectoryListing(123.0, {"a.hip": file_status.FileStatus(exists=False)})
+
+        assert inst.as_json() == {
+            constants.DATA_NAME__MODIFIED: 123.0,
+            constants.DATA_NAME__FILES: {"a.hip": [False, None, None]},
+        }
+
+
+class TestStatCache:
+    """Test the houdini_recent_files_menu.file_status.StatCache object."""
+
+    def test_round_trip(self, tmp_path):
+        """Test updating, saving and reloading the cache."""
+        path = tmp_path / "cache.json"
+        listing = file_status.DirectoryListing(123.0, {"a.hip": file_status.FileStatus(True, 1, 2.0)})
+
+        inst = file_status.StatCache(path)
+        assert inst.get(tmp_path) is None
+
+        assert inst.update({tmp_path: listing})
+        assert not inst.update({tmp_path: listing})
+
+        inst.save()
+
+        # Saving happens in the background, so wait for the file to appear.
+        deadline = time.monotonic() + 5
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert file_status.StatCache(path).get(tmp_path) == listing
+
+    def test_add_late_listing(self, tmp_path, mocker):
+        """Test StatCache.add_late_listing()."""
+        mock_save = mocker.patch.object(file_status.StatCache, "save")
+        listing = file_status.DirectoryListing(123.0, {"a.hip": file_status.FileStatus(True, 1, 2.0)})
+
+        inst = file_status.StatCache(tmp_path / "cache.json")
+
+        inst.add_late_listing(tmp_path, listing)
+        inst.add_late_listing(tmp_path, listing)
+
+        assert inst.get(tmp_path) == listing
+
+        # Only listings which changed anything should be counted and saved.
+        assert inst.late_listing_count == 1
+        mock_save.assert_called_once()
+
+    def test_invalidate(self, tmp_path):
+        """Test StatCache.invalidate()."""
+        inst = file_status.StatCache(tmp_path / "cache.json")
+        inst.update({tmp_path: file_status.DirectoryListing(123.0, {})})
+
+        inst.invalidate(tmp_path)
+        inst.invalidate(tmp_path)
+
+        assert inst.get(tmp_path) is None
+
+
+# Non-Public Functions
+
+
+def test__get_probe_pool():
+    """Test houdini_recent_files_menu.file_status._get_probe_pool()."""
+    result = file_status._get_probe_pool()
+
+    assert result.max_workers == constants.PROBE_MAX_WORKERS
+    assert file_status._get_probe_pool() is result
+
+
+class Test__read_cache_file:
+    """Test houdini_recent_files_menu.file_status._read_cache_file()."""
+
+    def test(self, tmp_path):
+        """Test reading a valid cache file."""
+        path = tmp_path / "cache.json"
+        path.write_text(
+            json.dumps({
+                "/shot": {constants.DATA_NAME__MODIFIED: 1.0, constants.DATA_NAME__FILES: {"a.hip": [True, 2, 3.0]}}
+            })
+        )
+
+        result = file_status._read_cache_file(path)
+
+        assert result == {
+            pathlib.Path("/shot"): file_status.DirectoryListing(1.0, {"a.hip": file_status.FileStatus(True, 2, 3.0)})
+        }
+
+    @pytest.mark.parametrize("contents", (None, "not json", "[]", '{"/shot": {}}'))
+    def test_invalid(self, tmp_path, contents):
+        """Test that missing or invalid cache files result in an empty cache."""
+        path = tmp_path / "cache.json"
+
+        if contents is not None:
+            path.write_text(contents)
+
+        assert file_status._read_cache_file(path) == {}
+
+
+class Test__scan_directory:
+    """Test houdini_recent_files_menu.file_status._scan_directory()."""
+
+    def test(self, hip_dir):
+        """Test scanning a directory."""
+        result = file_status._scan_directory(hip_dir, frozenset(("a.hip", "b.hip", "missing.hip")), None)
+
+        assert result.modified == hip_dir.stat().st_mtime
+        assert result.files == {
+            "a.hip": file_status.FileStatus(True, 1, (hip_dir / "a.hip").stat().st_mtime),
+            "b.hip": file_status.FileStatus(True, 2, (hip_dir / "b.hip").stat().st_mtime),
+            "missing.hip": file_status.FileStatus(exists=False),
+        }
+
+    def test_missing_directory(self, tmp_path):
+        """Test scanning a directory which does not exist."""
+        result = file_status._scan_directory(tmp_path / "missing", frozenset(("a.hip",)), None)
+
+        assert result.files == {"a.hip": file_status.FileStatus(exists=False)}
+
+    def test_cached(self, hip_dir, mocker):
+        """Test that a cached listing is used when the directory is unchanged."""
+        mock_scandir = mocker.patch("os.scandir")
+
+        cached = file_status.DirectoryListing(hip_dir.stat().st_mtime, {"a.hip": file_status.FileStatus(True, 1, 2.0)})
+
+        assert file_status._scan_directory(hip_dir, frozenset(("a.hip",)), cached) is cached
+
+        mock_scandir.assert_not_called()
+
+    @pytest.mark.parametrize("names", (("a.hip",), ("a.hip", "b.hip")))
+    def test_stale_cache(self, hip_dir, names):
+        """Test that a cached listing is not used if it is out of date or incomplete."""
+        modified = hip_dir.stat().st_mtime if len(names) > 1 else 0
+        cached = file_status.DirectoryListing(modified, {"a.hip": file_status.FileStatus(True, 100, 2.0)})
+
+        result = file_status._scan_directory(hip_dir, frozenset(names), cached)
+
+        assert result.files["a.hip"].size == 1
+
+    def test_removed_during_scan(self, hip_dir, mocker):
+        """Test a file which is removed between being listed and being checked."""
+        original_scandir = os.scandir
+
+        def _scandir(path):
+            entries = list(original_scandir(path))
+            (hip_dir / "a.hip").unlink()
+            return mocker.MagicMock(__enter__=mocker.MagicMock(return_value=entries))
+
+        mocker.patch("os.scandir", side_effect=_scandir)
+
+        result = file_status._scan_directory(hip_dir, frozenset(("a.hip",)), None)
+
+        assert result.files == {"a.hip": file_status.FileStatus(exists=False)}
+
+
+class Test__submit_scan:
+    """Test houdini_recent_files_menu.file_status._submit_scan()."""
+
+    def test_completed(self, hip_dir):
+        """Test that completed scans are not kept around."""
+        future = file_status._submit_scan(hip_dir, frozenset(("a.hip",)), None)
+
+        assert future.result(timeout=5).files["a.hip"].exists
+
+        concurrent.futures.wait([future])
+        assert hip_dir not in file_status._PENDING_SCANS
+
+    def test_pending(self, hip_dir, mocker):
+        """Test that an outstanding scan is reused if it covers the required files."""
+        release = threading.Event()
+
+        mock_scan = mocker.patch(
+            "houdini_recent_files_menu.file_status._scan_directory", side_effect=lambda *_: release.wait(5)
+        )
+
+        future = file_status._submit_scan(hip_dir, frozenset(("a.hip", "b.hip")), None)
+
+        assert file_status._submit_scan(hip_dir, frozenset(("a.hip",)), None) is future
+
+        other = file_status._submit_scan(hip_dir, frozenset(("c.hip",)), None)
+        assert other is not future
+
+        release.set()
+        concurrent.futures.wait([future, other], timeout=5)
+
+        assert mock_scan.call_count == 2
+        assert hip_dir not in file_status._PENDING_SCANS
+
+
+def test__write_cache_file(tmp_path):
+    """Test houdini_recent_files_menu.file_status._write_cache_file()."""
+    path = tmp_path / "cache.json"
+
+    file_status._write_cache_file(path, {"foo": "bar"})
+
+    assert json.loads(path.read_text()) == {"foo": "bar"}
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test__write_cache_file__concurrent(tmp_path):
+    """Test that saves running at the same time on different threads do not interfere."""
+    path = tmp_path / "cache.json"
+
+    with concurrent.futures.ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(file_status._write_cache_file, path, {"idx": idx}) for idx in range(40)]
+
+    for future in futures:
+        future.result()
+
+    assert json.loads(path.read_text())["idx"] in range(40)
+    assert list(tmp_path.iterdir()) == [path]
+
+
+# Functions
+
+
+class Test_check_files:
+    """Test houdini_recent_files_menu.file_status.check_files()."""
+
+    def test(self, cache_file, hip_dir, tmp_path, mocker):
+        """Test checking files across multiple directories."""
+        mock_save = mocker.patch.object(file_status.StatCache, "save")
+
+        paths = [hip_dir / "a.hip", hip_dir / "missing.hip", tmp_path / "missing" / "c.hip"]
+
+        result = file_status.check_files(paths, timeout=5)
+
+        assert result == {
+            paths[0]: file_status.FileStatus(True, 1, paths[0].stat().st_mtime),
+            paths[1]: file_status.FileStatus(exists=False),
+            paths[2]: file_status.FileStatus(exists=False),
+        }
+
+        mock_save.assert_called_once()
+
+        # Checking again should use the cached data and not need saving.
+        mock_scandir = mocker.patch("os.scandir")
+        assert file_status.check_files(paths, timeout=5) == result
+
+        mock_scandir.assert_not_called()
+        mock_save.assert_called_once()
+
+    def test_unknown(self, cache_file, mocker):
+        """Test that directories which hang or fail result in unknown file status."""
+        release = threading.Event()
+
+        def _scan(directory, names, cached):
+            if directory.name == "hung":
+                release.wait(5)
+
+            raise PermissionError
+
+        mocker.patch("houdini_recent_files_menu.file_status._scan_directory", side_effect=_scan)
+        mocker.patch("houdini_recent_files_menu.settings.probe_timeout", return_value=0.1)
+
+        paths = [pathlib.Path("/hung/a.hip"), pathlib.Path("/error/b.hip")]
+
+        result = file_status.check_files(paths)
+
+        release.set()
+
+        assert result == {paths[0]: None, paths[1]: None}
+
+    def test_late(self, cache_file, hip_dir, mocker):
+        """Test that a directory which is always slower than the timeout is known once it has been listed."""
+        release = threading.Event()
+        original_scan = file_status._scan_directory
+
+        def _scan(directory, names, cached):
+            release.wait(5)
+            return original_scan(directory, names, cached)
+
+        mocker.patch("houdini_recent_files_menu.file_status._scan_directory", side_effect=_scan)
+        mocker.patch("houdini_recent_files_menu.settings.probe_timeout", return_value=0.1)
+
+        paths = [hip_dir / "a.hip", hip_dir / "missing.hip"]
+
+        assert file_status.check_files(paths) == dict.fromkeys(paths)
+        assert file_status.late_listing_count() == 0
+
+        # The scan finishes after the timeout and is still added to the cache.
+        release.set()
+
+        deadline = time.monotonic() + 5
+        while file_status.late_listing_count() == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert file_status.late_listing_count() == 1
+
+        # The cached listing is used while the directory is still too slow to check.
+        release.clear()
+
+        assert file_status.check_files(paths) == {
+            paths[0]: file_status.FileStatus(True, 1, paths[0].stat().st_mtime),
+            paths[1]: file_status.FileStatus(exists=False),
+        }
+
+        release.set()
+
+
+def test_invalidate_directory(cache_file, mocker):
+    """Test houdini_recent_files_menu.file_status.invalidate_directory()."""
+    mock_invalidate = mocker.patch.object(file_status.StatCache, "invalidate")
+
+    file_status.invalidate_directory(pathlib.Path("/shot"))
+
+    mock_invalidate.assert_called_with(pathlib.Path("/shot"))
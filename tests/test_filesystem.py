@@ -1,16 +1,152 @@
 """Test the houdini_recent_files_menu.filesystem module."""
 
 # Standard Library
+import fcntl
 import json
 import os
 import pathlib
 
+# Third Party
+import pytest
+
 # Houdini Recent Files Menu
 from houdini_recent_files_menu import constants, filesystem
 
 # Tests
 
 
+def test_archive_directory_path(tmp_path, mocker):
+    """Test houdini_recent_files_menu.filesystem.archive_directory_path()."""
+    mocker.patch(
+        "houdini_recent_files_menu.filesystem.source_file_path", return_value=tmp_path / "recent_houdini_files.json"
+    )
+
+    assert filesystem.archive_directory_path() == tmp_path / "recent_houdini_files_archive"
+
+
+class Test_decode_data:
+    """Test houdini_recent_files_menu.filesystem.decode_data()."""
+
+    @pytest.mark.parametrize("use_orjson", (False, True))
+    def test(self, monkeypatch, use_orjson):
+        """Test decoding data, with and without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+
+        else:
+            monkeypatch.setattr(filesystem, "orjson", None)
+
+        content = json.dumps({"/file.hip": {"open_timestamp": 1, "save_version": "20.5.123"}}, indent=4).encode()
+
+        assert filesystem.decode_data(content) == {"/file.hip": {"open_timestamp": 1, "save_version": "20.5.123"}}
+
+    def test_columnar(self):
+        """Test that columnar data is converted back to recent file data."""
+        content = json.dumps({
+            "format": "columnar",
+            "paths": ["/file2.hip", "/file1.hip"],
+            "open_timestamps": [2, 1],
+            "save_versions": ["20.5.123", None],
+        }).encode()
+
+        result = filesystem.decode_data(content)
+
+        assert result == {
+            "/file2.hip": {"open_timestamp": 2, "save_version": "20.5.123"},
+            "/file1.hip": {"open_timestamp": 1, "save_version": None},
+        }
+        assert list(result) == ["/file2.hip", "/file1.hip"]
+
+    def test_columnar__frecencies(self):
+        """Test that frecency scores are added to the entries which have one."""
+        content = json.dumps({
+            "format": "columnar",
+            "paths": ["/file2.hip", "/file1.hip"],
+            "open_timestamps": [2, 1],
+            "save_versions": ["20.5.123", None],
+            "frecencies": [3.5, None],
+        }).encode()
+
+        assert filesystem.decode_data(content) == {
+            "/file2.hip": {"open_timestamp": 2, "save_version": "20.5.123", "frecency": 3.5},
+            "/file1.hip": {"open_timestamp": 1, "save_version": None},
+        }
+
+    def test_columnar__mismatched(self):
+        """Test that columnar data with lists of different lengths is invalid."""
+        content = json.dumps({
+            "format": "columnar",
+            "paths": ["/file2.hip", "/file1.hip"],
+            "open_timestamps": [2],
+            "save_versions": ["20.5.123", None],
+        }).encode()
+
+        with pytest.raises(ValueError, match="shorter"):
+            filesystem.decode_data(content)
+
+    def test_invalid(self):
+        """Test that invalid JSON raises a ValueError."""
+        with pytest.raises(ValueError, match="line 1"):
+            filesystem.decode_data(b"{")
+
+
+class Test_encode_data:
+    """Test houdini_recent_files_menu.filesystem.encode_data()."""
+
+    @pytest.mark.parametrize("use_orjson", (False, True))
+    def test_compact(self, monkeypatch, use_orjson):
+        """Test compact encoding, with and without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+
+        else:
+            monkeypatch.setattr(filesystem, "orjson", None)
+
+        result = filesystem.encode_data({"/file.hip": {"open_timestamp": 1, "save_version": "20.5.123"}})
+
+        assert result == b'{"/file.hip":{"open_timestamp":1,"save_version":"20.5.123"}}'
+
+    def test_indented(self):
+        """Test indented encoding."""
+        data = {"/file.hip": {"open_timestamp": 1, "save_version": "20.5.123"}}
+
+        result = filesystem.encode_data(data, constants.FILE_ENCODING__INDENTED)
+
+        assert result == json.dumps(data, indent=4).encode()
+
+    def test_columnar(self):
+        """Test columnar encoding."""
+        data = {
+            "/file2.hip": {"open_timestamp": 2, "save_version": "20.5.123"},
+            "/file1.hip": {"open_timestamp": 1},
+        }
+
+        result = filesystem.encode_data(data, constants.FILE_ENCODING__COLUMNAR)
+
+        assert json.loads(result) == {
+            "format": "columnar",
+            "paths": ["/file2.hip", "/file1.hip"],
+            "open_timestamps": [2, 1],
+            "save_versions": ["20.5.123", None],
+        }
+        assert filesystem.decode_data(result) == {
+            "/file2.hip": {"open_timestamp": 2, "save_version": "20.5.123"},
+            "/file1.hip": {"open_timestamp": 1, "save_version": None},
+        }
+
+    def test_columnar__frecencies(self):
+        """Test that frecency scores are stored if any entry has one."""
+        data = {
+            "/file2.hip": {"open_timestamp": 2, "save_version": "20.5.123"},
+            "/file1.hip": {"open_timestamp": 1, "save_version": None, "frecency": 3.5},
+        }
+
+        result = filesystem.encode_data(data, constants.FILE_ENCODING__COLUMNAR)
+
+        assert json.loads(result)["frecencies"] == [None, 3.5]
+        assert filesystem.decode_data(result) == data
+
+
 def test_get_source_file_modification_time(mocker):
     """Test houdini_recent_files_menu.filesystem.get_source_file_modification_time()."""
     expected_time = 1234567.890
@@ -30,6 +166,79 @@ def test_get_source_file_modification_time(mocker):
     assert result == expected_time
 
 
+def test_lock_file(tmp_path, mocker):
+    """Test houdini_recent_files_menu.filesystem.lock_file()."""
+    mock_flock = mocker.patch("fcntl.flock")
+
+    test_path = tmp_path / "recent_houdini_files.jsonl"
+
+    with filesystem.lock_file(test_path):
+        assert mock_flock.call_args[0][1] == fcntl.LOCK_EX
+
+    assert mock_flock.call_args[0][1] == fcntl.LOCK_UN
+
+    # The lock should be held on a separate file so the file itself can be replaced.
+    assert (tmp_path / ".recent_houdini_files.jsonl.lock").exists()
+    assert not test_path.exists()
+
+
+@pytest.mark.parametrize(
+    "root,expected",
+    (
+        ("/jobs/show", "jobs_show-f5b000d2"),
+        ("C:/jobs/my show/", "C_jobs_my_show-e1749cc9"),
+        ("C:/jobs/my show", "C_jobs_my_show-e1749cc9"),
+        ("/jobs/show-1.2", "jobs_show-1.2-f622640b"),
+        ("/", "8a5edab2"),
+    ),
+)
+def test_project_key(root, expected):
+    """Test houdini_recent_files_menu.filesystem.project_key()."""
+    assert filesystem.project_key(root) == expected
+
+
+def test_project_key__collision():
+    """Test that roots which only differ by characters which cannot be used in a name get different keys."""
+    roots = ("/jobs/a_b", "/jobs/a/b", "/jobs/a b", "/jobs/a__b", "jobs/a/b")
+
+    assert len({filesystem.project_key(root) for root in roots}) == len(roots)
+
+
+def test_project_names(tmp_path, mocker):
+    """Test houdini_recent_files_menu.filesystem.project_names()."""
+    projects_path = tmp_path / "recent_houdini_files_projects"
+    mocker.patch("houdini_recent_files_menu.filesystem.projects_directory_path", return_value=projects_path)
+
+    assert filesystem.project_names() == []
+
+    (projects_path / "show_b").mkdir(parents=True)
+    (projects_path / "show_a").mkdir()
+    (projects_path / "file.txt").touch()
+
+    assert filesystem.project_names() == ["show_a", "show_b"]
+
+
+def test_project_source_file_path(tmp_path, monkeypatch):
+    """Test houdini_recent_files_menu.filesystem.project_source_file_path()."""
+    source_path = tmp_path / "recent_houdini_files.json"
+    monkeypatch.setenv(constants.RECENT_FILE_SOURCE_VAR_NAME, source_path.as_posix())
+
+    assert filesystem.project_source_file_path(None) == source_path
+    assert filesystem.project_source_file_path("jobs_show") == (
+        tmp_path / "recent_houdini_files_projects" / "jobs_show" / "recent_houdini_files.json"
+    )
+
+
+def test_projects_directory_path(tmp_path, monkeypatch):
+    """Test houdini_recent_files_menu.filesystem.projects_directory_path()."""
+    monkeypatch.setenv(constants.RECENT_FILE_SOURCE_VAR_NAME, (tmp_path / "recent_houdini_files.json").as_posix())
+    monkeypatch.setenv(constants.SHARD_VAR_NAME, "job")
+    monkeypatch.setenv("JOB", "/jobs/show")
+
+    # The projects directory should not depend on the current project.
+    assert filesystem.projects_directory_path() == tmp_path / "recent_houdini_files_projects"
+
+
 def test_read_file_data(mocker, shared_datadir):
     """Test houdini_recent_files_menu.filesystem.read_file_data()."""
     data_file = shared_datadir / "test_read_file_data.json"
@@ -41,6 +250,13 @@ def test_read_file_data(mocker, shared_datadir):
     assert result == {"this": ["is", "a", "test"]}
 
 
+def test_read_file_data__path(shared_datadir):
+    """Test houdini_recent_files_menu.filesystem.read_file_data() with an explicit path."""
+    result = filesystem.read_file_data(shared_datadir / "test_read_file_data.json")
+
+    assert result == {"this": ["is", "a", "test"]}
+
+
 class Test_source_file_path:
     """Test houdini_recent_files_menu.filesystem.source_file_path()."""
 
@@ -62,6 +278,35 @@ class Test_source_file_path:
 
         assert filesystem.source_file_path() == home_path / constants.RECENT_FILE_SOURCE_FILE_NAME
 
+    def test_project(self, tmp_path, monkeypatch):
+        """Test the path for the current project."""
+        monkeypatch.setenv(constants.RECENT_FILE_SOURCE_VAR_NAME, (tmp_path / "recent_houdini_files.json").as_posix())
+        monkeypatch.setenv(constants.SHARD_VAR_NAME, "/jobs")
+        monkeypatch.setenv("JOB", "/jobs/show/seq010")
+
+        assert (
+            filesystem.source_file_path()
+            == tmp_path / "recent_houdini_files_projects/jobs_show-f5b000d2/recent_houdini_files.json"
+        )
+
+
+def test_missing_files_file_path(tmp_path, mocker):
+    """Test houdini_recent_files_menu.filesystem.missing_files_file_path()."""
+    mocker.patch(
+        "houdini_recent_files_menu.filesystem.source_file_path", return_value=tmp_path / "recent_houdini_files.json"
+    )
+
+    assert filesystem.missing_files_file_path() == tmp_path / "recent_houdini_files_missing.json"
+
+
+def test_stat_cache_file_path(tmp_path, mocker):
+    """Test houdini_recent_files_menu.filesystem.stat_cache_file_path()."""
+    mocker.patch(
+        "houdini_recent_files_menu.filesystem.source_file_path", return_value=tmp_path / "recent_houdini_files.json"
+    )
+
+    assert filesystem.stat_cache_file_path() == tmp_path / "recent_houdini_files_stat_cache.json"
+
 
 def test_write_file_data(tmp_path, mocker):
     """Test houdini_recent_files_menu.filesystem.write_file_data()."""
@@ -75,3 +320,30 @@ def test_write_file_data(tmp_path, mocker):
         result = json.load(fp)
 
     assert result == test_data
+
+
+def test_write_file_data__path(tmp_path):
+    """Test houdini_recent_files_menu.filesystem.write_file_data() with an explicit path."""
+    data_file = tmp_path / "test_write_file_data.json"
+
+    test_data = {"this": ["is", "a", "test"]}
+    filesystem.write_file_data(test_data, data_file)
+
+    assert json.loads(data_file.read_text()) == test_data
+
+    # The file should be replaced, leaving no temporary file behind.
+    filesystem.write_file_data({}, data_file)
+
+    assert json.loads(data_file.read_text()) == {}
+    assert list(tmp_path.iterdir()) == [data_file]
+
+
+def test_write_file_data__encoding(tmp_path):
+    """Test houdini_recent_files_menu.filesystem.write_file_data() with a different encoding."""
+    data_file = tmp_path / "test_write_file_data.json"
+
+    test_data = {"/file.hip": {"open_timestamp": 1, "save_version": "20.5.123"}}
+    filesystem.write_file_data(test_data, data_file, constants.FILE_ENCODING__COLUMNAR)
+
+    assert json.loads(data_file.read_text())["format"] == "columnar"
+    assert filesystem.read_file_data(data_file) == test_data
@@ -0,0 +1,118 @@
+"""Test the houdini_recent_files_menu.frecency module."""
+
+# Standard Library
+import math
+
+# Third Party
+import pytest
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, frecency
+
+# Fixtures
+
+
+@pytest.fixture
+def daily_half_life(monkeypatch):
+    """Fixture to make the contribution of each open halve every day."""
+    monkeypatch.setenv(constants.FRECENCY_HALF_LIFE_DAYS_VAR_NAME, "1")
+
+
+def _entry(days, score=None):
+    entry = {constants.DATA_NAME__OPEN_TIMESTAMP: days * 86400}
+
+    if score is not None:
+        entry[constants.DATA_NAME__FRECENCY] = score
+
+    return entry
+
+
+# Non-Public Functions
+
+
+@pytest.mark.parametrize(
+    "first,second,expected",
+    (
+        (0, 0, math.log(2)),
+        (math.log(2), math.log(5), math.log(7)),
+        # Scores are large enough that converting them back would overflow.
+        (1000, 1000, 1000 + math.log(2)),
+        (1000, 1, 1000),
+    ),
+)
+def test__log_add(first, second, expected):
+    """Test houdini_recent_files_menu.frecency._log_add()."""
+    assert frecency._log_add(first, second) == pytest.approx(expected)
+    assert frecency._log_add(second, first) == pytest.approx(expected)
+
+
+# Functions
+
+
+class Test_add_scores:
+    """Test houdini_recent_files_menu.frecency.add_scores()."""
+
+    def test(self, daily_half_life, monkeypatch):
+        """Test adding scores to the entries."""
+        monkeypatch.setenv(constants.ORDER_VAR_NAME, constants.ORDER__FRECENCY)
+
+        current = {
+            "/file1.hip": _entry(1, math.log(3)),
+            # Entries stored without a score are treated as having been opened once.
+            "/file2.hip": _entry(1),
+            "/file3.hip": _entry(1, math.log(3)),
+        }
+        data = {"/file1.hip": _entry(2), "/file2.hip": _entry(2), "/file3.hip": _entry(1), "/file4.hip": _entry(2)}
+
+        result = frecency.add_scores(data, current.get)
+
+        assert result == {
+            "/file1.hip": _entry(2, pytest.approx(math.log(3 + 4))),
+            "/file2.hip": _entry(2, pytest.approx(math.log(2 + 4))),
+            # The open has already been counted.
+            "/file3.hip": _entry(1, pytest.approx(math.log(3))),
+            "/file4.hip": _entry(2, pytest.approx(math.log(4))),
+        }
+
+        # The data being added is not modified.
+        assert data["/file1.hip"] == _entry(2)
+
+    def test_recency(self, monkeypatch):
+        """Test that the data is unchanged when files are ordered by recency."""
+        monkeypatch.delenv(constants.ORDER_VAR_NAME, raising=False)
+
+        data = {"/file1.hip": _entry(2)}
+
+        assert frecency.add_scores(data, {"/file1.hip": _entry(1, 5.0)}.get) is data
+
+
+def test_decay_rate(daily_half_life):
+    """Test houdini_recent_files_menu.frecency.decay_rate()."""
+    assert math.exp(frecency.decay_rate() * 86400) == pytest.approx(2)
+
+
+@pytest.mark.parametrize(
+    "entry,expected",
+    (
+        (_entry(2), 2),
+        (_entry(2, 3.5), 3.5),
+        # A score which does not include the latest open is outdated.
+        (_entry(2, 1.5), 2),
+    ),
+)
+def test_get_score(entry, expected):
+    """Test houdini_recent_files_menu.frecency.get_score()."""
+    assert frecency.get_score(entry, 1 / 86400) == expected
+
+
+def test_top(daily_half_life):
+    """Test houdini_recent_files_menu.frecency.top()."""
+    data = {
+        "/file3.hip": _entry(2.5),
+        "/file2.hip": _entry(2, math.log(6)),
+        "/file1.hip": _entry(1, math.log(7)),
+    }
+
+    assert list(frecency.top(data)) == ["/file1.hip", "/file2.hip", "/file3.hip"]
+    assert frecency.top(data, 2) == {"/file1.hip": data["/file1.hip"], "/file2.hip": data["/file2.hip"]}
+    assert frecency.top(data, 0) == {}
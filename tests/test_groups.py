@@ -0,0 +1,77 @@
+"""Test the houdini_recent_files_menu.groups module."""
+
+# Third Party
+import pytest
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, groups
+
+# Tests
+
+
+def _entry(timestamp):
+    return {constants.DATA_NAME__OPEN_TIMESTAMP: timestamp}
+
+
+class TestGroupIndex:
+    """Test the houdini_recent_files_menu.groups.GroupIndex object."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        inst = groups.GroupIndex({"/proj/a/file1.hip": _entry(1), "/proj/b/file2.hip": _entry(2)}, depth=1)
+
+        assert inst.depth == 1
+        assert len(inst) == 1
+
+        assert len(groups.GroupIndex()) == 0
+
+    def test_files(self):
+        """Test GroupIndex.files()."""
+        inst = groups.GroupIndex({
+            "/proj/a/file1.hip": _entry(1),
+            "/proj/a/file2.hip": _entry(3),
+            "/proj/b/file3.hip": _entry(2),
+        })
+
+        assert inst.files("/proj/a") == {"/proj/a/file2.hip": _entry(3), "/proj/a/file1.hip": _entry(1)}
+        assert inst.files("/proj/a", limit=1) == {"/proj/a/file2.hip": _entry(3)}
+        assert inst.files("/proj/c") == {}
+
+    def test_groups(self):
+        """Test GroupIndex.groups()."""
+        inst = groups.GroupIndex({
+            "/proj/a/file1.hip": _entry(1),
+            "/proj/a/file2.hip": _entry(2),
+            "/proj/b/file3.hip": _entry(3),
+        })
+
+        assert inst.groups() == [("/proj/b", 1), ("/proj/a", 2)]
+
+    def test_update(self):
+        """Test GroupIndex.update()."""
+        inst = groups.GroupIndex({"/proj/a/file1.hip": _entry(1), "/proj/b/file2.hip": _entry(2)})
+
+        inst.update({"/proj/a/file1.hip": _entry(3), "/proj/c/file3.hip": _entry(0), "/proj/b/file4.hip": _entry(1)})
+
+        assert inst.groups() == [("/proj/a", 1), ("/proj/b", 2), ("/proj/c", 1)]
+        assert inst.files("/proj/a") == {"/proj/a/file1.hip": _entry(3)}
+
+
+# Non-Public Functions
+
+
+@pytest.mark.parametrize(
+    "path,depth,expected",
+    (
+        ("/proj/show/shot/file.hip", 0, "/proj/show/shot"),
+        ("/proj/show/shot/file.hip", -1, "/proj/show/shot"),
+        ("/proj/show/shot/file.hip", 1, "/proj"),
+        ("/proj/show/shot/file.hip", 2, "/proj/show"),
+        ("/proj/show/shot/file.hip", 5, "/proj/show/shot"),
+        ("C:/proj/show/file.hip", 1, "C:/proj"),
+        ("/file.hip", 1, "/"),
+    ),
+)
+def test__get_group(path, depth, expected):
+    """Test houdini_recent_files_menu.groups._get_group()."""
+    assert groups._get_group(path, depth) == expected
@@ -0,0 +1,68 @@
+"""Test the houdini_recent_files_menu.index module."""
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, index
+
+# Tests
+
+
+def _entry(timestamp):
+    return {constants.DATA_NAME__OPEN_TIMESTAMP: timestamp}
+
+
+class TestRecencyIndex:
+    """Test the houdini_recent_files_menu.index.RecencyIndex object."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        inst = index.RecencyIndex({"/file1.hip": _entry(1), "/file3.hip": _entry(3), "/file2.hip": _entry(2)})
+
+        assert len(inst) == 3
+        assert list(inst.top()) == ["/file3.hip", "/file2.hip", "/file1.hip"]
+
+        assert len(index.RecencyIndex()) == 0
+
+    def test_get(self):
+        """Test RecencyIndex.get()."""
+        inst = index.RecencyIndex({"/file1.hip": _entry(1)})
+
+        assert inst.get("/file1.hip") == _entry(1)
+        assert inst.get("/file2.hip") is None
+
+    def test_top(self):
+        """Test RecencyIndex.top()."""
+        inst = index.RecencyIndex({"/file1.hip": _entry(1), "/file3.hip": _entry(3), "/file2.hip": _entry(2)})
+
+        assert inst.top(2) == {"/file3.hip": _entry(3), "/file2.hip": _entry(2)}
+        assert inst.top(10) == inst.top()
+        assert inst.top(0) == {}
+
+    def test_trim(self):
+        """Test RecencyIndex.trim()."""
+        inst = index.RecencyIndex({"/file1.hip": _entry(1), "/file3.hip": _entry(3), "/file2.hip": _entry(2)})
+
+        assert inst.trim(5) == {}
+        assert len(inst) == 3
+
+        assert inst.trim(2) == {"/file1.hip": _entry(1)}
+        assert inst.top() == {"/file3.hip": _entry(3), "/file2.hip": _entry(2)}
+
+        assert inst.trim(-1) == {"/file3.hip": _entry(3), "/file2.hip": _entry(2)}
+        assert inst.top() == {}
+
+    def test_update(self):
+        """Test RecencyIndex.update()."""
+        inst = index.RecencyIndex({"/file1.hip": _entry(1), "/file2.hip": _entry(2)})
+
+        # Updating an existing entry should move it rather than adding another.
+        inst.update({"/file1.hip": _entry(3), "/file4.hip": _entry(0)})
+
+        assert len(inst) == 3
+        assert list(inst.top()) == ["/file1.hip", "/file2.hip", "/file4.hip"]
+        assert inst._order == [(0, "/file4.hip"), (2, "/file2.hip"), (3, "/file1.hip")]
+
+        # Entries with the same timestamp should be handled.
+        inst.update({"/file5.hip": _entry(2)})
+        inst.update({"/file2.hip": _entry(4)})
+
+        assert list(inst.top()) == ["/file2.hip", "/file1.hip", "/file5.hip", "/file4.hip"]
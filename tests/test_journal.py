@@ -0,0 +1,169 @@
+"""Test the houdini_recent_files_menu.journal module."""
+
+# Standard Library
+import json
+import threading
+
+# Third Party
+import pytest
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import journal
+
+# Fixtures
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    """Fixture providing the path to a journal file."""
+    return tmp_path / "recent_houdini_files.jsonl"
+
+
+# Tests
+
+
+class TestJournal:
+    """Test the houdini_recent_files_menu.journal.Journal object."""
+
+    def test_append_and_read(self, journal_path):
+        """Test appending records and reading them back."""
+        inst = journal.Journal(journal_path)
+
+        assert not inst.exists()
+        assert inst.read() == {}
+        assert inst.size() == 0
+
+        inst.append({"/path/to/file1.hip": {"open_timestamp": 1}})
+        inst.append({"/path/to/file2.hip": {"open_timestamp": 2}})
+
+        assert inst.exists()
+        assert inst.read() == {"/path/to/file1.hip": {"open_timestamp": 1}, "/path/to/file2.hip": {"open_timestamp": 2}}
+
+        # Later records should replace earlier ones.
+        inst.append({"/path/to/file1.hip": {"open_timestamp": 3}})
+
+        assert inst.read() == {"/path/to/file1.hip": {"open_timestamp": 3}, "/path/to/file2.hip": {"open_timestamp": 2}}
+        assert inst.size() == journal_path.stat().st_size
+
+        # The most recently opened entries should come first.
+        assert inst.read(limit=1) == {"/path/to/file1.hip": {"open_timestamp": 3}}
+
+    def test_read_incremental(self, journal_path, mocker):
+        """Test that only new records are parsed on subsequent reads."""
+        inst = journal.Journal(journal_path)
+        inst.append({"/path/to/file1.hip": {"open_timestamp": 1}})
+        inst.read()
+
+        # Records written by another session.
+        with journal_path.open("a") as handle:
+            handle.write(json.dumps({"/path/to/file2.hip": {"open_timestamp": 2}}) + "\n")
+
+        mock_loads = mocker.patch("json.loads", side_effect=json.loads)
+
+        assert inst.read() == {"/path/to/file1.hip": {"open_timestamp": 1}, "/path/to/file2.hip": {"open_timestamp": 2}}
+        mock_loads.assert_called_once()
+
+        # Nothing new has been written so nothing should be parsed.
+        inst.read()
+        mock_loads.assert_called_once()
+
+    def test_read_partial_and_damaged(self, journal_path):
+        """Test that damaged records are skipped and partial records are left for later."""
+        journal_path.write_text(
+            '{"/path/to/file1.hip": {"open_timestamp": 1}}\nnot json\n[]\n{"/path/to/bad.hip": {}}\n'
+            '{"/path/to/file2.hip": '
+        )
+
+        inst = journal.Journal(journal_path)
+
+        assert inst.read() == {"/path/to/file1.hip": {"open_timestamp": 1}}
+
+        with journal_path.open("a") as handle:
+            handle.write('{"open_timestamp": 2}}\n')
+
+        assert inst.read() == {"/path/to/file1.hip": {"open_timestamp": 1}, "/path/to/file2.hip": {"open_timestamp": 2}}
+
+    def test_read_replaced(self, journal_path):
+        """Test reading after the journal has been replaced or removed by another session."""
+        inst = journal.Journal(journal_path)
+        inst.append({"/path/to/file1.hip": {"open_timestamp": 1}})
+        inst.append({"/path/to/file2.hip": {"open_timestamp": 2}})
+        inst.read()
+
+        other = journal.Journal(journal_path)
+        other.compact({"/path/to/file3.hip": {"open_timestamp": 3}})
+
+        assert inst.read() == {"/path/to/file3.hip": {"open_timestamp": 3}}
+
+        journal_path.unlink()
+
+        assert inst.read() == {}
+
+    def test_compact(self, journal_path, mocker):
+        """Test Journal.compact()."""
+        inst = journal.Journal(journal_path)
+        inst.append({"/path/to/file1.hip": {"open_timestamp": 1}})
+        inst.append({"/path/to/file1.hip": {"open_timestamp": 2}})
+
+        data = {"/path/to/file1.hip": {"open_timestamp": 2}, "/path/to/file2.hip": {"open_timestamp": 3}}
+        inst.compact(data)
+
+        assert journal_path.read_text().splitlines() == [
+            '{"/path/to/file1.hip":{"open_timestamp":2}}',
+            '{"/path/to/file2.hip":{"open_timestamp":3}}',
+        ]
+
+        # No temp files should be left behind.
+        assert sorted(path.name for path in journal_path.parent.iterdir()) == [
+            ".recent_houdini_files.jsonl.lock",
+            "recent_houdini_files.jsonl",
+        ]
+
+        # The compacted data is already known so it should not need to be parsed.
+        mock_loads = mocker.patch("json.loads")
+        assert inst.read() == data
+        mock_loads.assert_not_called()
+
+    def test_get(self, journal_path):
+        """Test getting the current entry for a path."""
+        inst = journal.Journal(journal_path)
+
+        assert inst.get("/path/to/file1.hip") is None
+
+        inst.append({"/path/to/file1.hip": {"open_timestamp": 1}})
+        inst.append({"/path/to/file1.hip": {"open_timestamp": 2}})
+
+        assert inst.get("/path/to/file1.hip") == {"open_timestamp": 2}
+
+    def test_rewrite(self, journal_path):
+        """Test that records appended by another session are kept when rewriting."""
+        inst = journal.Journal(journal_path)
+        other = journal.Journal(journal_path)
+
+        inst.append({"/path/to/file1.hip": {"open_timestamp": 1}})
+        assert inst.read() == {"/path/to/file1.hip": {"open_timestamp": 1}}
+
+        # Appended after the last read, so only picked up by reading under the lock.
+        other.append({"/path/to/file2.hip": {"open_timestamp": 2}})
+
+        threads = []
+
+        def _update(data):
+            thread = threading.Thread(target=other.append, args=({"/path/to/file3.hip": {"open_timestamp": 3}},))
+            thread.start()
+
+            # The journal is locked until it has been replaced so the append has to wait.
+            thread.join(0.2)
+            assert thread.is_alive()
+            threads.append(thread)
+
+            return {**data, "/path/to/file1.hip": {"open_timestamp": 4}}
+
+        inst.rewrite(_update)
+        threads[0].join()
+
+        assert inst.read() == {
+            "/path/to/file2.hip": {"open_timestamp": 2},
+            "/path/to/file3.hip": {"open_timestamp": 3},
+            "/path/to/file1.hip": {"open_timestamp": 4},
+        }
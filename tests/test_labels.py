@@ -0,0 +1,44 @@
+"""Test the houdini_recent_files_menu.labels module."""
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import labels
+
+# Tests
+
+
+class TestLabelTable:
+    """Test the houdini_recent_files_menu.labels.LabelTable object."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        inst = labels.LabelTable()
+
+        assert len(inst) == 0
+        assert inst.render() == []
+
+    def test_add_row(self):
+        """Test LabelTable.add_row()."""
+        inst = labels.LabelTable()
+
+        inst.add_row("1. /path/file.hip", "(20.5.178)", "2024-03-19 15:21")
+        inst.add_row(" 2. /path/longer_file.hip ", "(None)", "2025-01-28 07:55")
+
+        assert len(inst) == 2
+        assert inst._widths == [24, 10, 16]
+
+    def test_render(self):
+        """Test LabelTable.render().
+
+        The expected values are those produced by tabulate(rows, tablefmt="plain").
+        """
+        inst = labels.LabelTable()
+
+        inst.add_row("a", "bb", "c")
+        inst.add_row("aaa ", "", " cccc")
+        inst.add_row("a", "b", "")
+
+        assert inst.render() == [
+            "a    bb  c",
+            "aaa      cccc",
+            "a    b",
+        ]
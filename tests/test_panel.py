@@ -0,0 +1,282 @@
+"""Test the houdini_recent_files_menu.panel module."""
+
+# Standard Library
+from datetime import datetime
+
+# Third Party
+import pytest
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import api, constants, panel
+
+# Fixtures
+
+
+@pytest.fixture
+def mock_manager(mocker):
+    """Fixture providing a mock recent file manager with some files."""
+    mocker.patch("hou.text.expandString", side_effect=lambda value: value)
+    mocker.patch("hou.text.collapseCommonVars", side_effect=lambda value, **_: value.replace("/home", "$HOME"))
+
+    manager = mocker.patch("houdini_recent_files_menu.api.RecentFileManager").return_value
+    manager.generation = 1
+    manager.files = [
+        api.RecentFile("/home/b/file1.hipnc", 1738076128.0, "20.5.99"),
+        api.RecentFile("/test/A/file2.hipnc", 1724442855.0, "20.5.332"),
+        api.RecentFile("/test/c/file3.hipnc", 1722337846.0, None),
+        api.RecentFile("/home/d/file4.hipnc", 1710886869.0, "20.5.178"),
+    ]
+
+    manager.files[0].exists = True
+    manager.files[1].exists = False
+    manager.files[3].exists = True
+
+    return manager
+
+
+@pytest.fixture
+def qapp(monkeypatch):
+    """Fixture providing a Qt application, which widgets require."""
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+
+    return panel.QtWidgets.QApplication.instance() or panel.QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def model(mock_manager):
+    """Fixture providing a model of the mock manager's files."""
+    inst = panel.RecentFilesModel()
+    inst.refresh()
+
+    return inst
+
+
+def _file_number(path):
+    return int(path[-7])
+
+
+def _paths(model):
+    return [model.file_path(row) for row in range(model.rowCount())]
+
+
+# Tests
+
+
+class TestRecentFilesModel:
+    """Test the houdini_recent_files_menu.panel.RecentFilesModel object."""
+
+    def test_data(self, model):
+        """Test RecentFilesModel.data()."""
+        display_role = panel.QtCore.Qt.ItemDataRole.DisplayRole
+
+        assert model.rowCount() == 4
+        assert model.columnCount() == 4
+
+        assert [model.data(model.index(0, column), display_role) for column in range(4)] == [
+            "$HOME/b/file1.hipnc",
+            "20.5.99",
+            datetime.fromtimestamp(1738076128.0).strftime(constants.TIMESTAMP_FORMAT),
+            "Yes",
+        ]
+        assert model.data(model.index(1, 3), display_role) == "No"
+        assert not model.data(model.index(2, 1), display_role)
+        assert model.data(model.index(2, 3), display_role) == "Unknown"
+
+        assert model.data(model.index(0, 2), panel.QtCore.Qt.ItemDataRole.ToolTipRole) == "/home/b/file1.hipnc"
+        assert model.data(model.index(0, 2), panel.QtCore.Qt.ItemDataRole.DecorationRole) is None
+        assert model.data(panel.QtCore.QModelIndex()) is None
+
+    def test_data__formatted_paths(self, model, mocker):
+        """Test that paths are only formatted once, and only a limited number are kept."""
+        mocker.patch("houdini_recent_files_menu.constants.PANEL_DISPLAY_CACHE_SIZE", 2)
+        mock_collapse = mocker.patch("hou.text.collapseCommonVars", side_effect=lambda value, **_: value)
+
+        for row in (0, 1, 0, 1):
+            model.data(model.index(row, 0))
+
+        assert mock_collapse.call_count == 2
+
+        # The kept paths are discarded to make room for another.
+        model.data(model.index(2, 0))
+        model.data(model.index(0, 0))
+
+        assert mock_collapse.call_count == 4
+
+    def test_headerData(self, model):
+        """Test RecentFilesModel.headerData()."""
+        horizontal = panel.QtCore.Qt.Orientation.Horizontal
+
+        assert [model.headerData(column, horizontal) for column in range(4)] == ["Path", "Version", "Opened", "Exists"]
+        assert model.headerData(0, panel.QtCore.Qt.Orientation.Vertical) is None
+        assert model.headerData(0, horizontal, panel.QtCore.Qt.ItemDataRole.ToolTipRole) is None
+
+    def test_refresh(self, model, mock_manager, mocker):
+        """Test RecentFilesModel.refresh()."""
+        mock_reset = mocker.patch.object(model, "beginResetModel")
+
+        # Nothing has changed.
+        model.refresh()
+        mock_reset.assert_not_called()
+
+        mock_manager.generation = 2
+        mock_manager.files = mock_manager.files[2:]
+
+        model.refresh()
+
+        mock_reset.assert_called_once()
+        assert _paths(model) == ["/test/c/file3.hipnc", "/home/d/file4.hipnc"]
+
+    def test_refresh__display_key(self, model, mocker):
+        """Test that paths are formatted again when the collapsed variables change."""
+        model.data(model.index(0, 0))
+
+        mocker.patch("hou.text.expandString", side_effect=lambda value: f"/other{value}")
+        mock_collapse = mocker.patch("hou.text.collapseCommonVars", return_value="$HIP/file1.hipnc")
+
+        model.refresh()
+
+        assert model.data(model.index(0, 0)) == "$HIP/file1.hipnc"
+        mock_collapse.assert_called_once()
+
+    def test_set_filter(self, model):
+        """Test RecentFilesModel.set_filter()."""
+        model.set_filter("test")
+        assert _paths(model) == ["/test/A/file2.hipnc", "/test/c/file3.hipnc"]
+
+        model.set_filter("FILE2 a")
+        assert _paths(model) == ["/test/A/file2.hipnc"]
+
+        model.set_filter("missing")
+        assert model.rowCount() == 0
+
+        model.set_filter("  ")
+        assert model.rowCount() == 4
+
+    def test_set_filter__narrowed(self, model, mocker):
+        """Test that only the files which already matched are checked when words are added to."""
+        model.set_filter("file")
+        model.set_filter("file test")
+
+        previous = model._rows
+        mock_filter = mocker.patch.object(model, "_filter_rows", wraps=model._filter_rows)
+
+        model.set_filter("file2 test")
+        mock_filter.assert_called_once_with(previous)
+
+        assert _paths(model) == ["/test/A/file2.hipnc"]
+
+    def test_set_filter__unchanged(self, model, mocker):
+        """Test that the model is not reset when the filter words are unchanged."""
+        model.set_filter("test")
+
+        mock_reset = mocker.patch.object(model, "beginResetModel")
+        model.set_filter(" TEST ")
+
+        mock_reset.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "column,ascending,descending",
+        (
+            (0, [1, 4, 2, 3], [3, 2, 4, 1]),
+            (1, [3, 1, 4, 2], [2, 4, 1, 3]),
+            (2, [4, 3, 2, 1], [1, 2, 3, 4]),
+            # Files with the same value stay in order of when they were opened.
+            (3, [3, 2, 1, 4], [1, 4, 2, 3]),
+        ),
+    )
+    def test_sort(self, model, column, ascending, descending):
+        """Test RecentFilesModel.sort()."""
+        model.sort(column, panel.QtCore.Qt.SortOrder.AscendingOrder)
+        assert [_file_number(path) for path in _paths(model)] == ascending
+
+        model.sort(column, panel.QtCore.Qt.SortOrder.DescendingOrder)
+        assert [_file_number(path) for path in _paths(model)] == descending
+
+    def test_sort__filtered(self, model):
+        """Test that sorting keeps the filter."""
+        model.set_filter("home")
+        model.sort(2, panel.QtCore.Qt.SortOrder.AscendingOrder)
+
+        assert _paths(model) == ["/home/d/file4.hipnc", "/home/b/file1.hipnc"]
+
+    def test_sort__persistent_indexes(self, model):
+        """Test that persistent indexes, such as the selection, keep referring to the same file."""
+        persistent = panel.QtCore.QPersistentModelIndex(model.index(1, 2))
+
+        model.sort(0, panel.QtCore.Qt.SortOrder.AscendingOrder)
+
+        assert persistent.row() == 2
+        assert persistent.column() == 2
+        assert model.file_path(persistent.row()) == "/test/A/file2.hipnc"
+
+
+class TestRecentFilesPanel:
+    """Test the houdini_recent_files_menu.panel.RecentFilesPanel object."""
+
+    def test_filter(self, qapp, mock_manager):
+        """Test filtering the files by the entered text."""
+        inst = panel.RecentFilesPanel()
+        inst.model.refresh()
+
+        inst._filter_edit.setText("home")
+        inst._apply_filter()
+
+        assert _paths(inst.model) == ["/home/b/file1.hipnc", "/home/d/file4.hipnc"]
+
+    def test_open_file(self, qapp, mock_manager, mocker):
+        """Test opening the file which was double-clicked."""
+        mock_load = mocker.patch("hou.hipFile.load")
+
+        inst = panel.RecentFilesPanel()
+        inst.model.refresh()
+
+        inst._open_file(inst.model.index(1, 2))
+
+        mock_load.assert_called_once_with("/test/A/file2.hipnc")
+
+    def test_show_hide(self, qapp, mock_manager, mocker):
+        """Test that the files are only refreshed while the panel is visible."""
+        inst = panel.RecentFilesPanel()
+        mock_refresh = mocker.patch.object(inst.model, "refresh")
+
+        inst.show()
+
+        mock_refresh.assert_called_once()
+        assert inst._refresh_timer.isActive()
+
+        inst.hide()
+
+        assert not inst._refresh_timer.isActive()
+
+
+@pytest.mark.parametrize(
+    "version,expected",
+    (
+        (None, ()),
+        ("", ()),
+        ("20.5.99", (20, 5, 99)),
+        ("21.0.123-py3.11", (21, 0)),
+    ),
+)
+def test__get_version_key(version, expected):
+    """Test houdini_recent_files_menu.panel._get_version_key()."""
+    assert panel._get_version_key(version) == expected
+
+
+def test_create_panel(mocker):
+    """Test houdini_recent_files_menu.panel.create_panel()."""
+    mock_panel = mocker.patch("houdini_recent_files_menu.panel.RecentFilesPanel")
+
+    assert panel.create_panel() == mock_panel.return_value
+
+
+def test_show_panel(mocker):
+    """Test houdini_recent_files_menu.panel.show_panel()."""
+    mock_desktop = mocker.patch("hou.ui.curDesktop")
+    mock_interface = mocker.patch("hou.pypanel.interfaceByName")
+
+    panel.show_panel()
+
+    mock_pane_tab = mock_desktop.return_value.createFloatingPaneTab.return_value
+    mock_pane_tab.setActiveInterface.assert_called_once_with(mock_interface.return_value)
+    mock_interface.assert_called_once_with(constants.PANEL_INTERFACE_NAME)
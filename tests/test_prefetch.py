@@ -0,0 +1,182 @@
+"""Test the houdini_recent_files_menu.prefetch module."""
+
+# Standard Library
+import concurrent.futures
+import dataclasses
+import os
+import pathlib
+
+# Third Party
+import pytest
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, prefetch
+
+# Fixtures
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Fixture providing recent files which exist on disk."""
+    recent_files = []
+
+    for idx, size in enumerate((100, 200, 300, 400)):
+        path = tmp_path / f"file{idx + 1}.hip"
+        path.write_bytes(b"x" * size)
+
+        recent_files.append(_RecentFile(path, exists=True, size=size, modified=path.stat().st_mtime))
+
+    return recent_files
+
+
+@dataclasses.dataclass
+class _RecentFile:
+    path: pathlib.Path
+    exists: bool | None = None
+    size: int | None = None
+    modified: float | None = None
+
+    @property
+    def posix_path(self):
+        return self.path.as_posix()
+
+
+def _read(futures):
+    return [future.result(timeout=5) for future in futures]
+
+
+# Tests
+
+
+class TestPrefetcher:
+    """Test the houdini_recent_files_menu.prefetch.Prefetcher object."""
+
+    def test_prefetch(self, files, monkeypatch):
+        """Test Prefetcher.prefetch()."""
+        monkeypatch.setenv(constants.PREFETCH_COUNT_VAR_NAME, "2")
+
+        inst = prefetch.Prefetcher(1000, 2)
+
+        assert _read(inst.prefetch(files, constants.PREFETCH_MODE__READ)) == [100, 200]
+        assert inst.budget == 700
+
+        # Files which have already been read are not read again until they change.
+        assert not inst.prefetch(files, constants.PREFETCH_MODE__READ)
+
+        files[1].size = 250
+        files[1].path.write_bytes(b"x" * 250)
+
+        assert _read(inst.prefetch(files, constants.PREFETCH_MODE__READ)) == [250]
+        assert inst.budget == 450
+
+    def test_prefetch__skipped(self, files, monkeypatch):
+        """Test that only files which exist and are small enough are read."""
+        monkeypatch.setenv(constants.PREFETCH_COUNT_VAR_NAME, "2")
+        monkeypatch.setenv(constants.PREFETCH_MAX_SIZE_MB_VAR_NAME, str(350 / 1024 / 1024))
+
+        files[0].exists = False
+        files[1].size = None
+        files[2].exists = None
+
+        inst = prefetch.Prefetcher(1000, 2)
+
+        # The only file which exists with a known size is too large.
+        assert not inst.prefetch(files, constants.PREFETCH_MODE__READ)
+
+        files[2].exists = True
+
+        assert _read(inst.prefetch(files, constants.PREFETCH_MODE__READ)) == [300]
+
+    def test_prefetch__budget(self, files, monkeypatch):
+        """Test that nothing more is read once the budget has been used up."""
+        monkeypatch.setenv(constants.PREFETCH_COUNT_VAR_NAME, "4")
+
+        inst = prefetch.Prefetcher(450, 2)
+
+        # Files which do not fit in the remaining budget are skipped.
+        assert _read(inst.prefetch(files, constants.PREFETCH_MODE__READ)) == [100, 200]
+        assert inst.budget == 150
+
+        assert not inst.prefetch(files[2:], constants.PREFETCH_MODE__READ)
+
+
+# Non-Public Functions
+
+
+def test__get_prefetcher(monkeypatch):
+    """Test houdini_recent_files_menu.prefetch._get_prefetcher()."""
+    monkeypatch.setenv(constants.PREFETCH_BUDGET_MB_VAR_NAME, "1")
+    prefetch._get_prefetcher.cache_clear()
+
+    result = prefetch._get_prefetcher()
+
+    assert result.budget == 1048576
+    assert prefetch._get_prefetcher() is result
+
+    prefetch._get_prefetcher.cache_clear()
+
+
+class Test__read_ahead:
+    """Test houdini_recent_files_menu.prefetch._read_ahead()."""
+
+    def test_advise(self, tmp_path, mocker):
+        """Test asking the operating system to read the file."""
+        path = tmp_path / "file.hip"
+        path.write_bytes(b"x" * 100)
+
+        mock_advise = mocker.patch("os.posix_fadvise")
+
+        assert prefetch._read_ahead(path, constants.PREFETCH_MODE__ADVISE) == 100
+
+        mock_advise.assert_called_once_with(mocker.ANY, 0, 100, os.POSIX_FADV_WILLNEED)
+
+    def test_advise__unsupported(self, tmp_path, monkeypatch):
+        """Test that the file is read if the operating system cannot be asked to read it."""
+        path = tmp_path / "file.hip"
+        path.write_bytes(b"x" * 100)
+
+        monkeypatch.delattr(os, "posix_fadvise", raising=False)
+
+        assert prefetch._read_ahead(path, constants.PREFETCH_MODE__ADVISE) == 100
+
+    def test_read(self, tmp_path, mocker):
+        """Test reading the file in chunks."""
+        mocker.patch("houdini_recent_files_menu.constants.PREFETCH_CHUNK_SIZE", 64)
+
+        path = tmp_path / "file.hip"
+        path.write_bytes(b"x" * 200)
+
+        mock_advise = mocker.patch("os.posix_fadvise")
+
+        assert prefetch._read_ahead(path, constants.PREFETCH_MODE__READ) == 200
+
+        mock_advise.assert_not_called()
+
+    def test_missing(self, tmp_path):
+        """Test that a file which cannot be read is skipped."""
+        assert prefetch._read_ahead(tmp_path / "missing.hip", constants.PREFETCH_MODE__READ) == 0
+
+
+# Functions
+
+
+@pytest.mark.parametrize("mode", (None, constants.PREFETCH_MODE__READ))
+def test_prefetch_files(monkeypatch, mocker, mode):
+    """Test houdini_recent_files_menu.prefetch.prefetch_files()."""
+    monkeypatch.delenv(constants.PREFETCH_VAR_NAME, raising=False)
+
+    if mode is not None:
+        monkeypatch.setenv(constants.PREFETCH_VAR_NAME, mode)
+
+    mock_prefetcher = mocker.patch("houdini_recent_files_menu.prefetch._get_prefetcher").return_value
+    mock_prefetcher.prefetch.return_value = [concurrent.futures.Future()]
+
+    result = prefetch.prefetch_files(["file"])
+
+    if mode is None:
+        assert result == []
+        mock_prefetcher.prefetch.assert_not_called()
+
+    else:
+        assert result == mock_prefetcher.prefetch.return_value
+        mock_prefetcher.prefetch.assert_called_once_with(["file"], mode)
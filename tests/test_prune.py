@@ -0,0 +1,135 @@
+"""Test the houdini_recent_files_menu.prune module."""
+
+# Standard Library
+import concurrent.futures
+import json
+
+# Third Party
+import pytest
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, prune
+
+# Fixtures
+
+
+@pytest.fixture
+def record_path(tmp_path, mocker):
+    """Fixture providing the file which records when files went missing."""
+    path = tmp_path / "recent_houdini_files_missing.json"
+    mocker.patch("houdini_recent_files_menu.filesystem.missing_files_file_path", return_value=path)
+
+    return path
+
+
+def _entry(timestamp):
+    return {constants.DATA_NAME__OPEN_TIMESTAMP: timestamp}
+
+
+# Non-Public Functions
+
+
+def test__find_missing(tmp_path):
+    """Test houdini_recent_files_menu.prune._find_missing()."""
+    (tmp_path / "file1.hip").touch()
+
+    assert prune._find_missing(tmp_path, frozenset({"file1.hip", "file2.hip"})) == {"file2.hip"}
+
+    # Everything in a directory which no longer exists is missing.
+    assert prune._find_missing(tmp_path / "missing", frozenset({"file1.hip"})) == {"file1.hip"}
+    assert prune._find_missing(tmp_path / "file1.hip", frozenset({"file1.hip"})) == {"file1.hip"}
+
+
+def test__get_prune_pool(monkeypatch):
+    """Test houdini_recent_files_menu.prune._get_prune_pool()."""
+    monkeypatch.setenv(constants.PRUNE_MAX_WORKERS_VAR_NAME, "2")
+    prune._get_prune_pool.cache_clear()
+
+    result = prune._get_prune_pool()
+
+    assert result.max_workers == 2
+    assert prune._get_prune_pool() is result
+
+    prune._get_prune_pool.cache_clear()
+
+
+def test__read_missing_since(tmp_path):
+    """Test houdini_recent_files_menu.prune._read_missing_since()."""
+    path = tmp_path / "missing.json"
+
+    assert prune._read_missing_since(path) == {}
+
+    path.write_text("not json")
+    assert prune._read_missing_since(path) == {}
+
+    path.write_text("[]")
+    assert prune._read_missing_since(path) == {}
+
+    path.write_text(json.dumps({"/file1.hip": 1, "/file2.hip": 2.5, "/file3.hip": "bad"}))
+    assert prune._read_missing_since(path) == {"/file1.hip": 1, "/file2.hip": 2.5}
+
+
+# Functions
+
+
+def test_check_missing(tmp_path):
+    """Test houdini_recent_files_menu.prune.check_missing()."""
+    (tmp_path / "file1.hip").touch()
+
+    paths = [(tmp_path / name).as_posix() for name in ("file1.hip", "file2.hip")]
+    other_path = (tmp_path / "missing" / "file3.hip").as_posix()
+
+    assert prune.check_missing([*paths, other_path]) == {paths[0]: False, paths[1]: True, other_path: True}
+
+
+def test_check_missing__unknown(mocker):
+    """Test that files in directories which could not be listed are left out."""
+    failed: concurrent.futures.Future = concurrent.futures.Future()
+    failed.set_exception(PermissionError())
+
+    mock_pool = mocker.patch("houdini_recent_files_menu.prune._get_prune_pool").return_value
+    mock_pool.submit.side_effect = [failed, concurrent.futures.Future()]
+
+    assert prune.check_missing(["/locked/file1.hip", "/hung/file2.hip"], timeout=0) == {}
+
+
+def test_find_prunable_entries(tmp_path, record_path, monkeypatch):
+    """Test houdini_recent_files_menu.prune.find_prunable_entries()."""
+    monkeypatch.setenv(constants.PRUNE_GRACE_DAYS_VAR_NAME, "1")
+
+    (tmp_path / "file1.hip").touch()
+
+    path1, path2, path3 = (tmp_path / f"file{idx}.hip" for idx in range(1, 4))
+    data = {path1.as_posix(): _entry(1), path2.as_posix(): _entry(2), path3.as_posix(): _entry(3)}
+
+    # Missing files should be recorded but not removed until the grace period has passed.
+    assert prune.find_prunable_entries(data, now=1000) == {}
+    assert json.loads(record_path.read_text()) == {path2.as_posix(): 1000, path3.as_posix(): 1000}
+
+    # Files which are found again should be forgotten.
+    path3.touch()
+
+    assert prune.find_prunable_entries(data, now=2000) == {}
+    assert json.loads(record_path.read_text()) == {path2.as_posix(): 1000}
+
+    assert prune.find_prunable_entries(data, now=1000 + 86400) == {path2.as_posix(): _entry(2)}
+    assert json.loads(record_path.read_text()) == {}
+
+
+def test_find_prunable_entries__unknown(record_path, mocker, monkeypatch):
+    """Test that files which could not be checked keep their previous record."""
+    monkeypatch.setenv(constants.PRUNE_GRACE_DAYS_VAR_NAME, "1")
+    mocker.patch("houdini_recent_files_menu.prune.check_missing", return_value={})
+    mock_time = mocker.patch("time.time", return_value=100)
+
+    record_path.write_text(json.dumps({"/hung/file1.hip": 50, "/other/file2.hip": 50}))
+
+    assert prune.find_prunable_entries({"/hung/file1.hip": _entry(1)}) == {}
+    assert json.loads(record_path.read_text()) == {"/hung/file1.hip": 50}
+
+    # Nothing should be written if nothing changed.
+    mock_write = mocker.patch("houdini_recent_files_menu.filesystem.write_file_data")
+
+    assert prune.find_prunable_entries({"/hung/file1.hip": _entry(1)}) == {}
+    mock_write.assert_not_called()
+    mock_time.assert_called()
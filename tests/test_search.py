@@ -0,0 +1,134 @@
+"""Test the houdini_recent_files_menu.search module."""
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, search
+
+# Tests
+
+
+def _entry(timestamp):
+    return {constants.DATA_NAME__OPEN_TIMESTAMP: timestamp}
+
+
+def _make_index():
+    return search.SearchIndex({
+        "/proj/Shot010/fx/explosion_v001.hip": _entry(1),
+        "/proj/shot020/fx/smoke_v003.hip": _entry(4),
+        "/proj/shot010/lighting/explosion_lgt_v002.hip": _entry(3),
+        "/home/user/test.hip": _entry(2),
+    })
+
+
+class TestSearchIndex:
+    """Test the houdini_recent_files_menu.search.SearchIndex object."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        assert len(_make_index()) == 4
+        assert len(search.SearchIndex()) == 0
+
+    def test_search(self):
+        """Test SearchIndex.search()."""
+        inst = _make_index()
+
+        # Matches should be ordered by most recently opened, ignoring case.
+        assert list(inst.search("shot010")) == [
+            "/proj/shot010/lighting/explosion_lgt_v002.hip",
+            "/proj/Shot010/fx/explosion_v001.hip",
+        ]
+
+        # Every word should match, in any order.
+        assert list(inst.search("explosion FX")) == ["/proj/Shot010/fx/explosion_v001.hip"]
+        assert inst.search("fx lighting") == {}
+
+        # Words which are too short to be indexed should still match.
+        assert list(inst.search("fx")) == ["/proj/shot020/fx/smoke_v003.hip", "/proj/Shot010/fx/explosion_v001.hip"]
+        assert list(inst.search("fx lgt")) == []
+        assert list(inst.search("fx v0 smoke")) == ["/proj/shot020/fx/smoke_v003.hip"]
+
+        assert inst.search("explosion") == {
+            "/proj/shot010/lighting/explosion_lgt_v002.hip": _entry(3),
+            "/proj/Shot010/fx/explosion_v001.hip": _entry(1),
+        }
+
+        assert inst.search("missing") == {}
+        assert inst.search("  ") == {}
+
+    def test_search__limit(self):
+        """Test SearchIndex.search() with a limit."""
+        inst = search.SearchIndex({f"/proj/file{idx:04}.hip": _entry(idx) for idx in range(1000)})
+
+        assert list(inst.search("file", limit=3)) == ["/proj/file0999.hip", "/proj/file0998.hip", "/proj/file0997.hip"]
+        assert list(inst.search("file00", limit=2)) == ["/proj/file0099.hip", "/proj/file0098.hip"]
+        assert len(inst.search("file")) == 1000
+        assert inst.search("file", limit=0) == {}
+
+        # An entry from another session which was opened earlier is added after the newer ones.
+        inst.update({"/proj/other.hip": _entry(500.5)})
+        assert list(inst.search("proj", limit=1)) == ["/proj/file0999.hip"]
+
+    def test_update(self):
+        """Test SearchIndex.update()."""
+        inst = _make_index()
+
+        inst.update({"/proj/Shot010/fx/explosion_v001.hip": _entry(5), "/proj/shot030/fx/fire_v001.hip": _entry(0)})
+
+        assert len(inst) == 5
+        assert list(inst.search("fx")) == [
+            "/proj/Shot010/fx/explosion_v001.hip",
+            "/proj/shot020/fx/smoke_v003.hip",
+            "/proj/shot030/fx/fire_v001.hip",
+        ]
+
+        # Older data for an existing entry should be ignored.
+        inst.update({"/proj/Shot010/fx/explosion_v001.hip": _entry(1)})
+        assert inst.search("explosion_v001") == {"/proj/Shot010/fx/explosion_v001.hip": _entry(5)}
+
+    def test_update__rebuild(self):
+        """Test that the index is rebuilt once enough entries have been updated."""
+        inst = search.SearchIndex({"/proj/file1.hip": _entry(1), "/proj/file2.hip": _entry(2)})
+
+        inst.update({"/proj/file1.hip": _entry(3)})
+        assert len(inst._paths) == 3
+
+        inst.update({"/proj/file2.hip": _entry(4)})
+        inst.update({"/proj/file1.hip": _entry(5)})
+
+        assert len(inst._paths) == 2
+        assert inst.search("file") == {"/proj/file1.hip": _entry(5), "/proj/file2.hip": _entry(4)}
+
+
+# Non-Public Functions
+
+
+def test__get_ngrams():
+    """Test houdini_recent_files_menu.search._get_ngrams()."""
+    assert search._get_ngrams("abcab") == {"abc", "bca", "cab"}
+    assert search._get_ngrams("ab") == set()
+
+
+def test__get_terms():
+    """Test houdini_recent_files_menu.search._get_terms()."""
+    assert search._get_terms(" Shot010  FX ") == ["shot010", "fx"]
+    assert search._get_terms("") == []
+
+
+# Functions
+
+
+def test_search_data():
+    """Test houdini_recent_files_menu.search.search_data()."""
+    data = {
+        "/proj/shot020/fx/smoke_v003.hip": _entry(4),
+        "/proj/shot010/lighting/explosion_lgt_v002.hip": _entry(3),
+        "/proj/Shot010/fx/explosion_v001.hip": _entry(1),
+    }
+
+    assert list(search.search_data(data, "SHOT010")) == [
+        "/proj/shot010/lighting/explosion_lgt_v002.hip",
+        "/proj/Shot010/fx/explosion_v001.hip",
+    ]
+    assert search.search_data(data, "fx explosion") == {"/proj/Shot010/fx/explosion_v001.hip": _entry(1)}
+    assert list(search.search_data(data, "hip", limit=1)) == ["/proj/shot020/fx/smoke_v003.hip"]
+    assert search.search_data(data, "missing") == {}
+    assert search.search_data(data, " ") == {}
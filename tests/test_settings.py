@@ -0,0 +1,420 @@
+"""Test the houdini_recent_files_menu.settings module."""
+
+# Standard Library
+import logging
+import os
+import pathlib
+
+# Third Party
+import pytest
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, settings
+
+# Non-Public Functions
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    ((None, False), ("", False), ("0", False), ("OFF", False), ("1", True), ("on", True)),
+)
+def test__get_env_bool(monkeypatch, value, expected):
+    """Test houdini_recent_files_menu.settings._get_env_bool()."""
+    if value is None:
+        monkeypatch.delenv("TEST_SETTING", raising=False)
+
+    else:
+        monkeypatch.setenv("TEST_SETTING", value)
+
+    assert settings._get_env_bool("TEST_SETTING") == expected
+
+
+class Test__get_env_float:
+    """Test houdini_recent_files_menu.settings._get_env_float()."""
+
+    def test_set(self, monkeypatch):
+        """Test when the variable is set to a valid value."""
+        monkeypatch.setenv("TEST_SETTING", "1.5")
+
+        assert settings._get_env_float("TEST_SETTING", 3.0) == pytest.approx(1.5)
+
+    @pytest.mark.parametrize("value", (None, "", "foo"))
+    def test_default(self, monkeypatch, value):
+        """Test when the variable is unset or invalid."""
+        if value is None:
+            monkeypatch.delenv("TEST_SETTING", raising=False)
+
+        else:
+            monkeypatch.setenv("TEST_SETTING", value)
+
+        assert settings._get_env_float("TEST_SETTING", 3.0) == pytest.approx(3.0)
+
+
+class Test__get_env_int:
+    """Test houdini_recent_files_menu.settings._get_env_int()."""
+
+    def test_set(self, monkeypatch):
+        """Test when the variable is set to a valid value."""
+        monkeypatch.setenv("TEST_SETTING", "15")
+
+        assert settings._get_env_int("TEST_SETTING", 3) == 15
+
+    @pytest.mark.parametrize("value", (None, "", "1.5"))
+    def test_default(self, monkeypatch, value):
+        """Test when the variable is unset or invalid."""
+        if value is None:
+            monkeypatch.delenv("TEST_SETTING", raising=False)
+
+        else:
+            monkeypatch.setenv("TEST_SETTING", value)
+
+        assert settings._get_env_int("TEST_SETTING", 3) == 3
+
+
+# Functions
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    ((None, False), ("", False), ("0", False), ("OFF", False), ("1", True), ("on", True)),
+)
+def test_archive_enabled(monkeypatch, value, expected):
+    """Test houdini_recent_files_menu.settings.archive_enabled()."""
+    if value is None:
+        monkeypatch.delenv(constants.ARCHIVE_VAR_NAME, raising=False)
+
+    else:
+        monkeypatch.setenv(constants.ARCHIVE_VAR_NAME, value)
+
+    assert settings.archive_enabled() == expected
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        (None, constants.FILE_ENCODING__COMPACT),
+        ("columnar", constants.FILE_ENCODING__COLUMNAR),
+        ("COLUMNAR", constants.FILE_ENCODING__COLUMNAR),
+        ("compact", constants.FILE_ENCODING__COMPACT),
+        ("indented", constants.FILE_ENCODING__INDENTED),
+        ("foo", constants.FILE_ENCODING__COMPACT),
+    ),
+)
+def test_file_encoding(monkeypatch, value, expected):
+    """Test houdini_recent_files_menu.settings.file_encoding()."""
+    if value is None:
+        monkeypatch.delenv(constants.FILE_ENCODING_VAR_NAME, raising=False)
+
+    else:
+        monkeypatch.setenv(constants.FILE_ENCODING_VAR_NAME, value)
+
+    assert settings.file_encoding() == expected
+
+
+def test_frecency_half_life(monkeypatch):
+    """Test houdini_recent_files_menu.settings.frecency_half_life()."""
+    monkeypatch.delenv(constants.FRECENCY_HALF_LIFE_DAYS_VAR_NAME, raising=False)
+    assert settings.frecency_half_life() == constants.FRECENCY_HALF_LIFE_DAYS * 86400
+
+    monkeypatch.setenv(constants.FRECENCY_HALF_LIFE_DAYS_VAR_NAME, "0.5")
+    assert settings.frecency_half_life() == pytest.approx(43200)
+
+
+@pytest.mark.parametrize("value", ("0", "-7", "nan"))
+def test_frecency_half_life__invalid(caplog, monkeypatch, value):
+    """Test that the default is used when the half-life is not positive."""
+    monkeypatch.setenv(constants.FRECENCY_HALF_LIFE_DAYS_VAR_NAME, value)
+
+    with caplog.at_level(logging.WARNING, logger=settings.__name__):
+        assert settings.frecency_half_life() == pytest.approx(constants.FRECENCY_HALF_LIFE_DAYS * 86400)
+
+    assert constants.FRECENCY_HALF_LIFE_DAYS_VAR_NAME in caplog.text
+
+
+def test_group_depth(monkeypatch):
+    """Test houdini_recent_files_menu.settings.group_depth()."""
+    monkeypatch.delenv(constants.GROUP_DEPTH_VAR_NAME, raising=False)
+    assert settings.group_depth() == constants.GROUP_DEPTH
+
+    monkeypatch.setenv(constants.GROUP_DEPTH_VAR_NAME, "2")
+    assert settings.group_depth() == 2
+
+
+def test_journal_compact_size(monkeypatch):
+    """Test houdini_recent_files_menu.settings.journal_compact_size()."""
+    monkeypatch.delenv(constants.JOURNAL_COMPACT_SIZE_VAR_NAME, raising=False)
+    assert settings.journal_compact_size() == constants.JOURNAL_COMPACT_SIZE
+
+    monkeypatch.setenv(constants.JOURNAL_COMPACT_SIZE_VAR_NAME, "1024")
+    assert settings.journal_compact_size() == 1024
+
+
+def test_max_display_files(monkeypatch):
+    """Test houdini_recent_files_menu.settings.max_display_files()."""
+    monkeypatch.delenv(constants.MAX_DISPLAY_FILES_VAR_NAME, raising=False)
+    assert settings.max_display_files() == constants.MAX_DISPLAY_FILES
+
+    monkeypatch.setenv(constants.MAX_DISPLAY_FILES_VAR_NAME, "20")
+    assert settings.max_display_files() == 20
+
+
+def test_max_recent_files(monkeypatch):
+    """Test houdini_recent_files_menu.settings.max_recent_files()."""
+    monkeypatch.delenv(constants.MAX_RECENT_FILES_VAR_NAME, raising=False)
+    assert settings.max_recent_files() == constants.MAX_RECENT_FILES
+
+    monkeypatch.setenv(constants.MAX_RECENT_FILES_VAR_NAME, "50000")
+    assert settings.max_recent_files() == 50000
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        (None, constants.ORDER__RECENCY),
+        ("frecency", constants.ORDER__FRECENCY),
+        ("FRECENCY", constants.ORDER__FRECENCY),
+        ("recency", constants.ORDER__RECENCY),
+        ("foo", constants.ORDER__RECENCY),
+    ),
+)
+def test_order(monkeypatch, value, expected):
+    """Test houdini_recent_files_menu.settings.order()."""
+    if value is None:
+        monkeypatch.delenv(constants.ORDER_VAR_NAME, raising=False)
+
+    else:
+        monkeypatch.setenv(constants.ORDER_VAR_NAME, value)
+
+    assert settings.order() == expected
+
+
+def test_path_map(monkeypatch):
+    """Test houdini_recent_files_menu.settings.path_map()."""
+    monkeypatch.delenv(constants.PATH_MAP_VAR_NAME, raising=False)
+    assert settings.path_map() == ()
+
+    # Pairs which are not valid should be ignored.
+    value = os.pathsep.join(("/net/jobs=/jobs", "invalid", "=/jobs", "/mnt/jobs=", "/auto/jobs=/jobs"))
+    monkeypatch.setenv(constants.PATH_MAP_VAR_NAME, value)
+
+    assert settings.path_map() == (("/net/jobs", "/jobs"), ("/auto/jobs", "/jobs"))
+
+
+def test_poll_interval(monkeypatch):
+    """Test houdini_recent_files_menu.settings.poll_interval()."""
+    monkeypatch.delenv(constants.POLL_INTERVAL_VAR_NAME, raising=False)
+    assert settings.poll_interval() == constants.POLL_INTERVAL
+
+    monkeypatch.setenv(constants.POLL_INTERVAL_VAR_NAME, "5")
+    assert settings.poll_interval() == pytest.approx(5.0)
+
+
+def test_probe_timeout(monkeypatch):
+    """Test houdini_recent_files_menu.settings.probe_timeout()."""
+    monkeypatch.delenv(constants.PROBE_TIMEOUT_VAR_NAME, raising=False)
+    assert settings.probe_timeout() == constants.PROBE_TIMEOUT
+
+    monkeypatch.setenv(constants.PROBE_TIMEOUT_VAR_NAME, "2")
+    assert settings.probe_timeout() == pytest.approx(2.0)
+
+
+@pytest.mark.parametrize(
+    "shard,job,expected",
+    (
+        (None, "/jobs/show", None),
+        ("off", "/jobs/show", None),
+        ("job", None, None),
+        ("job", "/jobs/show/", "/jobs/show"),
+        ("1", "/jobs/show", "/jobs/show"),
+        ("/jobs", "/jobs/show/seq010/shot020", "/jobs/show"),
+        ("/jobs/", "/jobs/show", "/jobs/show"),
+        ("/jobs", "/other/show", None),
+        ("/jobs", "/jobsite/show", None),
+    ),
+)
+def test_project_root(monkeypatch, shard, job, expected):
+    """Test houdini_recent_files_menu.settings.project_root()."""
+    for name, value in ((constants.SHARD_VAR_NAME, shard), ("JOB", job)):
+        if value is None:
+            monkeypatch.delenv(name, raising=False)
+
+        else:
+            monkeypatch.setenv(name, value)
+
+    assert settings.project_root() == expected
+
+
+def test_prefetch_budget(monkeypatch):
+    """Test houdini_recent_files_menu.settings.prefetch_budget()."""
+    monkeypatch.delenv(constants.PREFETCH_BUDGET_MB_VAR_NAME, raising=False)
+    assert settings.prefetch_budget() == constants.PREFETCH_BUDGET_MB * 1024 * 1024
+
+    monkeypatch.setenv(constants.PREFETCH_BUDGET_MB_VAR_NAME, "0.5")
+    assert settings.prefetch_budget() == 524288
+
+
+def test_prefetch_count(monkeypatch):
+    """Test houdini_recent_files_menu.settings.prefetch_count()."""
+    monkeypatch.delenv(constants.PREFETCH_COUNT_VAR_NAME, raising=False)
+    assert settings.prefetch_count() == constants.PREFETCH_COUNT
+
+    monkeypatch.setenv(constants.PREFETCH_COUNT_VAR_NAME, "5")
+    assert settings.prefetch_count() == 5
+
+
+def test_prefetch_max_size(monkeypatch):
+    """Test houdini_recent_files_menu.settings.prefetch_max_size()."""
+    monkeypatch.delenv(constants.PREFETCH_MAX_SIZE_MB_VAR_NAME, raising=False)
+    assert settings.prefetch_max_size() == constants.PREFETCH_MAX_SIZE_MB * 1024 * 1024
+
+    monkeypatch.setenv(constants.PREFETCH_MAX_SIZE_MB_VAR_NAME, "2")
+    assert settings.prefetch_max_size() == 2097152
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        (None, None),
+        ("", None),
+        ("0", None),
+        ("OFF", None),
+        ("1", constants.PREFETCH_MODE__ADVISE),
+        ("advise", constants.PREFETCH_MODE__ADVISE),
+        ("read", constants.PREFETCH_MODE__READ),
+        ("READ", constants.PREFETCH_MODE__READ),
+    ),
+)
+def test_prefetch_mode(monkeypatch, value, expected):
+    """Test houdini_recent_files_menu.settings.prefetch_mode()."""
+    if value is None:
+        monkeypatch.delenv(constants.PREFETCH_VAR_NAME, raising=False)
+
+    else:
+        monkeypatch.setenv(constants.PREFETCH_VAR_NAME, value)
+
+    assert settings.prefetch_mode() == expected
+
+
+@pytest.mark.parametrize("value,expected", ((None, False), ("", False), ("off", False), ("1", True)))
+def test_prune_enabled(monkeypatch, value, expected):
+    """Test houdini_recent_files_menu.settings.prune_enabled()."""
+    monkeypatch.delenv(constants.PRUNE_VAR_NAME, raising=False)
+
+    if value is not None:
+        monkeypatch.setenv(constants.PRUNE_VAR_NAME, value)
+
+    assert settings.prune_enabled() is expected
+
+
+def test_prune_grace_period(monkeypatch):
+    """Test houdini_recent_files_menu.settings.prune_grace_period()."""
+    monkeypatch.delenv(constants.PRUNE_GRACE_DAYS_VAR_NAME, raising=False)
+    assert settings.prune_grace_period() == constants.PRUNE_GRACE_DAYS * 86400
+
+    monkeypatch.setenv(constants.PRUNE_GRACE_DAYS_VAR_NAME, "0.5")
+    assert settings.prune_grace_period() == 43200
+
+
+def test_prune_max_workers(monkeypatch):
+    """Test houdini_recent_files_menu.settings.prune_max_workers()."""
+    monkeypatch.delenv(constants.PRUNE_MAX_WORKERS_VAR_NAME, raising=False)
+    assert settings.prune_max_workers() == constants.PRUNE_MAX_WORKERS
+
+    monkeypatch.setenv(constants.PRUNE_MAX_WORKERS_VAR_NAME, "2")
+    assert settings.prune_max_workers() == 2
+
+
+@pytest.mark.parametrize("value,expected", ((None, False), ("0", False), ("on", True)))
+def test_resolve_paths(monkeypatch, value, expected):
+    """Test houdini_recent_files_menu.settings.resolve_paths()."""
+    monkeypatch.delenv(constants.RESOLVE_PATHS_VAR_NAME, raising=False)
+
+    if value is not None:
+        monkeypatch.setenv(constants.RESOLVE_PATHS_VAR_NAME, value)
+
+    assert settings.resolve_paths() is expected
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        (None, constants.STORAGE_MODE__JSON),
+        ("journal", constants.STORAGE_MODE__JOURNAL),
+        ("JOURNAL", constants.STORAGE_MODE__JOURNAL),
+        ("json", constants.STORAGE_MODE__JSON),
+        ("sqlite", constants.STORAGE_MODE__SQLITE),
+        ("foo", constants.STORAGE_MODE__JSON),
+    ),
+)
+def test_storage_mode(monkeypatch, value, expected):
+    """Test houdini_recent_files_menu.settings.storage_mode()."""
+    if value is None:
+        monkeypatch.delenv(constants.STORAGE_MODE_VAR_NAME, raising=False)
+
+    else:
+        monkeypatch.setenv(constants.STORAGE_MODE_VAR_NAME, value)
+
+    assert settings.storage_mode() == expected
+
+
+def test_team_directory(monkeypatch):
+    """Test houdini_recent_files_menu.settings.team_directory()."""
+    monkeypatch.delenv(constants.TEAM_DIRECTORY_VAR_NAME, raising=False)
+    assert settings.team_directory() is None
+
+    monkeypatch.setenv(constants.TEAM_DIRECTORY_VAR_NAME, "")
+    assert settings.team_directory() is None
+
+    monkeypatch.setenv(constants.TEAM_DIRECTORY_VAR_NAME, "/mnt/team")
+    assert settings.team_directory() == pathlib.Path("/mnt/team")
+
+
+def test_timing_buffer_size(monkeypatch):
+    """Test houdini_recent_files_menu.settings.timing_buffer_size()."""
+    monkeypatch.delenv(constants.TIMING_BUFFER_SIZE_VAR_NAME, raising=False)
+    assert settings.timing_buffer_size() == constants.TIMING_BUFFER_SIZE
+
+    monkeypatch.setenv(constants.TIMING_BUFFER_SIZE_VAR_NAME, "10")
+    assert settings.timing_buffer_size() == 10
+
+
+def test_timing_enabled(monkeypatch):
+    """Test houdini_recent_files_menu.settings.timing_enabled()."""
+    monkeypatch.delenv(constants.TIMING_VAR_NAME, raising=False)
+    assert not settings.timing_enabled()
+
+    monkeypatch.setenv(constants.TIMING_VAR_NAME, "1")
+    assert settings.timing_enabled()
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        (None, None),
+        ("", None),
+        ("0", None),
+        ("OFF", None),
+        ("1", constants.WATCH_MODE__INOTIFY),
+        ("inotify", constants.WATCH_MODE__INOTIFY),
+        ("poll", constants.WATCH_MODE__POLL),
+        ("POLL", constants.WATCH_MODE__POLL),
+    ),
+)
+def test_watch_mode(monkeypatch, value, expected):
+    """Test houdini_recent_files_menu.settings.watch_mode()."""
+    if value is None:
+        monkeypatch.delenv(constants.WATCH_MODE_VAR_NAME, raising=False)
+
+    else:
+        monkeypatch.setenv(constants.WATCH_MODE_VAR_NAME, value)
+
+    assert settings.watch_mode() == expected
+
+
+def test_write_delay(monkeypatch):
+    """Test houdini_recent_files_menu.settings.write_delay()."""
+    monkeypatch.delenv(constants.WRITE_DELAY_VAR_NAME, raising=False)
+    assert settings.write_delay() == constants.WRITE_DELAY
+
+    monkeypatch.setenv(constants.WRITE_DELAY_VAR_NAME, "0.25")
+    assert settings.write_delay() == pytest.approx(0.25)
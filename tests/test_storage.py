@@ -0,0 +1,657 @@
+"""Test the houdini_recent_files_menu.storage module."""
+
+# Standard Library
+import json
+import math
+import os
+import sqlite3
+import threading
+
+# Third Party
+import pytest
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import archive, constants, storage
+
+# Fixtures
+
+
+@pytest.fixture(autouse=True)
+def clear_cached_backends():
+    """Fixture to automatically clear any cached storage backends."""
+    storage._create_backend.cache_clear()
+
+
+@pytest.fixture
+def source_path(tmp_path):
+    """Fixture providing the path to a standard JSON source file."""
+    return tmp_path / "recent_houdini_files.json"
+
+
+@pytest.fixture
+def entry_archive(tmp_path):
+    """Fixture providing an archive for entries which no longer fit."""
+    return archive.Archive(tmp_path / "recent_houdini_files_archive")
+
+
+def _entry(timestamp, version=None):
+    return {constants.DATA_NAME__OPEN_TIMESTAMP: timestamp, constants.DATA_NAME__SAVE_VERSION: version}
+
+
+# Tests
+
+
+class TestStorageBackend:
+    """Test the houdini_recent_files_menu.storage.StorageBackend object."""
+
+    def test_compact(self, source_path, entry_archive, mocker):
+        """Test StorageBackend.compact()."""
+        source_path.write_text(json.dumps({"/file1.hip": _entry(1), "/file2.hip": _entry(2), "/file3.hip": _entry(3)}))
+
+        inst = storage.JsonStorageBackend(source_path, entry_archive)
+        mocker.patch("houdini_recent_files_menu.constants.MAX_RECENT_FILES", 2)
+
+        assert inst.compact() == 1
+        assert json.loads(source_path.read_text()) == {"/file3.hip": _entry(3), "/file2.hip": _entry(2)}
+        assert entry_archive.read() == {"/file1.hip": _entry(1)}
+
+        assert inst.compact() == 0
+
+    @pytest.mark.parametrize(
+        "mode", (constants.STORAGE_MODE__JOURNAL, constants.STORAGE_MODE__JSON, constants.STORAGE_MODE__SQLITE)
+    )
+    def test_add_entries__frecency(self, source_path, monkeypatch, mode):
+        """Test that frecency scores are updated from the stored entries when files are ordered by frecency."""
+        monkeypatch.setenv(constants.ORDER_VAR_NAME, constants.ORDER__FRECENCY)
+        monkeypatch.setenv(constants.FRECENCY_HALF_LIFE_DAYS_VAR_NAME, "1")
+
+        inst = storage._create_backend(mode, source_path)
+
+        for day in (0, 1, 2):
+            inst.add_entries({"/file1.hip": _entry(day * 86400)})
+
+        inst.add_entries({"/file2.hip": _entry(2.5 * 86400)})
+
+        # The file opened every day should rank above the one opened once since.
+        assert list(inst.read_data()) == ["/file2.hip", "/file1.hip"]
+        assert list(inst.read_frecent_data()) == ["/file1.hip", "/file2.hip"]
+
+        # Each open contributes twice as much as one a day earlier.
+        result = inst.read_frecent_data(limit=1)
+
+        assert list(result) == ["/file1.hip"]
+        assert result["/file1.hip"][constants.DATA_NAME__FRECENCY] == pytest.approx(math.log(1 + 2 + 4))
+
+        if mode == constants.STORAGE_MODE__SQLITE:
+            inst.close()
+
+    @pytest.mark.parametrize(
+        "mode", (constants.STORAGE_MODE__JOURNAL, constants.STORAGE_MODE__JSON, constants.STORAGE_MODE__SQLITE)
+    )
+    def test_add_entries__threads(self, source_path, mode):
+        """Test that entries added from several threads at once are all kept."""
+        inst = storage._create_backend(mode, source_path)
+
+        def _add(start):
+            for timestamp in range(start, start + 20):
+                inst.add_entries({f"/file{timestamp}.hip": _entry(timestamp)})
+                inst.read_data(limit=5)
+
+        threads = [threading.Thread(target=_add, args=(start,)) for start in range(0, 80, 20)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert inst.read_data() == {f"/file{timestamp}.hip": _entry(timestamp) for timestamp in range(79, -1, -1)}
+
+    @pytest.mark.parametrize(
+        "mode", (constants.STORAGE_MODE__JOURNAL, constants.STORAGE_MODE__JSON, constants.STORAGE_MODE__SQLITE)
+    )
+    def test_remove_entries__sessions(self, source_path, mode):
+        """Test that entries added by another session while entries are being removed are kept."""
+        inst = storage._create_backend(mode, source_path)
+        inst.add_entries({f"/old{timestamp}.hip": _entry(timestamp) for timestamp in range(20)})
+
+        # A separate backend for the same file, as another session would have.
+        storage._create_backend.cache_clear()
+        other = storage._create_backend(mode, source_path)
+
+        def _add():
+            for timestamp in range(100, 140):
+                other.add_entries({f"/file{timestamp}.hip": _entry(timestamp)})
+
+        thread = threading.Thread(target=_add)
+        thread.start()
+
+        for timestamp in range(20):
+            inst.remove_entries({f"/old{timestamp}.hip": _entry(timestamp)})
+
+        thread.join()
+
+        assert inst.read_data() == {f"/file{timestamp}.hip": _entry(timestamp) for timestamp in range(100, 140)}
+
+    def test_modification_time(self, source_path):
+        """Test StorageBackend.modification_time()."""
+        inst = storage.JsonStorageBackend(source_path)
+
+        assert inst.modification_time() == 0
+
+        source_path.write_text("{}")
+        os.utime(source_path, (123, 123))
+
+        assert inst.modification_time() == 123
+
+    def test_read_history(self, source_path, entry_archive):
+        """Test StorageBackend.read_history()."""
+        source_path.write_text(json.dumps({"/file2.hip": _entry(2), "/file3.hip": _entry(3)}))
+        entry_archive.append({"/file1.hip": _entry(1), "/file2.hip": _entry(0)})
+
+        inst = storage.JsonStorageBackend(source_path, entry_archive)
+
+        # The current entries should take precedence over archived ones.
+        assert inst.read_history() == {"/file3.hip": _entry(3), "/file2.hip": _entry(2), "/file1.hip": _entry(1)}
+        assert list(inst.read_history()) == ["/file3.hip", "/file2.hip", "/file1.hip"]
+
+        assert storage.JsonStorageBackend(source_path).read_history() == {
+            "/file3.hip": _entry(3),
+            "/file2.hip": _entry(2),
+        }
+
+    def test_remove_entries(self, source_path):
+        """Test StorageBackend.remove_entries()."""
+        source_path.write_text(json.dumps({"/file1.hip": _entry(1), "/file2.hip": _entry(2), "/file3.hip": _entry(3)}))
+
+        inst = storage.JsonStorageBackend(source_path)
+
+        # Entries opened again since should be kept.
+        inst.remove_entries({"/file1.hip": _entry(1), "/file2.hip": _entry(1), "/file4.hip": _entry(4)})
+
+        assert json.loads(source_path.read_text()) == {"/file3.hip": _entry(3), "/file2.hip": _entry(2)}
+
+    def test_watch_paths(self, source_path):
+        """Test StorageBackend.watch_paths()."""
+        inst = storage.JsonStorageBackend(source_path)
+
+        assert inst.watch_paths() == (source_path,)
+
+
+class TestJsonStorageBackend:
+    """Test the houdini_recent_files_menu.storage.JsonStorageBackend object."""
+
+    def test_read_data(self, source_path):
+        """Test JsonStorageBackend.read_data()."""
+        inst = storage.JsonStorageBackend(source_path)
+
+        assert inst.read_data() == {}
+
+        source_path.write_text(json.dumps({"/file1.hip": _entry(1), "/file2.hip": _entry(3), "/file3.hip": _entry(2)}))
+
+        assert inst.read_data() == {"/file1.hip": _entry(1), "/file2.hip": _entry(3), "/file3.hip": _entry(2)}
+        assert list(inst.read_data(limit=2)) == ["/file2.hip", "/file3.hip"]
+
+    def test_read_data__cached(self, source_path, mocker):
+        """Test that the file is only read again once it has changed."""
+        source_path.write_text(json.dumps({"/file1.hip": _entry(1)}))
+
+        inst = storage.JsonStorageBackend(source_path)
+        inst.read_data()
+
+        mock_read = mocker.patch("houdini_recent_files_menu.filesystem.read_file_data", return_value={})
+
+        assert inst.read_data() == {"/file1.hip": _entry(1)}
+        mock_read.assert_not_called()
+
+        source_path.write_text(json.dumps({"/file2.hip": _entry(2)}))
+
+        assert inst.read_data() == {}
+        mock_read.assert_called_with(source_path)
+
+    def test_add_entries(self, source_path, mocker):
+        """Test JsonStorageBackend.add_entries()."""
+        mocker.patch("houdini_recent_files_menu.constants.MAX_RECENT_FILES", 2)
+
+        inst = storage.JsonStorageBackend(source_path)
+        inst.add_entries({"/file1.hip": _entry(1)})
+        inst.add_entries({"/file2.hip": _entry(2)})
+        inst.add_entries({"/file3.hip": _entry(3, "20.5.123")})
+
+        expected = {"/file3.hip": _entry(3, "20.5.123"), "/file2.hip": _entry(2)}
+
+        assert json.loads(source_path.read_text()) == expected
+
+        # The written data should be reused rather than read back in.
+        mock_read = mocker.patch("houdini_recent_files_menu.filesystem.read_file_data")
+        assert inst.read_data() == expected
+        mock_read.assert_not_called()
+
+    def test_add_entries__columnar(self, source_path, monkeypatch):
+        """Test that the file is written with the configured encoding."""
+        monkeypatch.setenv(constants.FILE_ENCODING_VAR_NAME, constants.FILE_ENCODING__COLUMNAR)
+
+        inst = storage.JsonStorageBackend(source_path)
+        inst.add_entries({"/file1.hip": _entry(1), "/file2.hip": _entry(2)})
+
+        assert json.loads(source_path.read_text())["paths"] == ["/file2.hip", "/file1.hip"]
+        assert storage.JsonStorageBackend(source_path).read_data() == {"/file2.hip": _entry(2), "/file1.hip": _entry(1)}
+
+    def test_add_entries__archive(self, source_path, entry_archive, mocker):
+        """Test that entries which no longer fit are archived."""
+        mocker.patch("houdini_recent_files_menu.constants.MAX_RECENT_FILES", 2)
+
+        inst = storage.JsonStorageBackend(source_path, entry_archive)
+
+        for timestamp in range(1, 5):
+            inst.add_entries({f"/file{timestamp}.hip": _entry(timestamp)})
+
+        assert inst.read_data() == {"/file4.hip": _entry(4), "/file3.hip": _entry(3)}
+        assert entry_archive.read() == {"/file1.hip": _entry(1), "/file2.hip": _entry(2)}
+
+    def test_add_entries__write_failure(self, source_path, mocker):
+        """Test that the file is read again after it fails to be written."""
+        source_path.write_text(json.dumps({"/file1.hip": _entry(1)}))
+
+        inst = storage.JsonStorageBackend(source_path)
+
+        mocker.patch("houdini_recent_files_menu.filesystem.write_file_data", side_effect=OSError("Disk full"))
+
+        with pytest.raises(OSError, match="Disk full"):
+            inst.add_entries({"/file2.hip": _entry(2)})
+
+        # The entry which was not written should not be returned.
+        assert inst.read_data() == {"/file1.hip": _entry(1)}
+
+    def test_write_data(self, source_path):
+        """Test JsonStorageBackend.write_data()."""
+        inst = storage.JsonStorageBackend(source_path)
+        inst.add_entries({"/file1.hip": _entry(1)})
+        inst.write_data({"/file2.hip": _entry(2), "/file3.hip": _entry(3)})
+
+        assert inst.read_data() == {"/file3.hip": _entry(3), "/file2.hip": _entry(2)}
+        assert json.loads(source_path.read_text()) == {"/file3.hip": _entry(3), "/file2.hip": _entry(2)}
+
+
+class TestJournalStorageBackend:
+    """Test the houdini_recent_files_menu.storage.JournalStorageBackend object."""
+
+    @pytest.fixture
+    def backend(self, source_path):
+        """Fixture providing a journal backend."""
+        return storage.JournalStorageBackend(source_path.with_suffix(".jsonl"), source_path)
+
+    def test_read_data__source_file(self, backend, source_path):
+        """Test that the source file is read until the journal exists."""
+        assert backend.read_data() == {}
+        assert backend.modification_time() == 0
+
+        source_path.write_text(json.dumps({"/file1.hip": _entry(1), "/file2.hip": _entry(2)}))
+        os.utime(source_path, (123, 123))
+
+        assert backend.read_data(limit=1) == {"/file2.hip": _entry(2)}
+        assert backend.modification_time() == 123
+
+    def test_add_entries(self, backend, source_path):
+        """Test JournalStorageBackend.add_entries()."""
+        source_path.write_text(json.dumps({"/file1.hip": _entry(1)}))
+
+        backend.add_entries({"/file2.hip": _entry(2)})
+        backend.add_entries({"/file3.hip": _entry(3)})
+
+        assert backend.read_data() == {"/file1.hip": _entry(1), "/file2.hip": _entry(2), "/file3.hip": _entry(3)}
+        assert list(backend.read_data(limit=2)) == ["/file3.hip", "/file2.hip"]
+        assert len(backend.path.read_text().splitlines()) == 3
+
+        os.utime(backend.path, (456, 456))
+        assert backend.modification_time() == 456
+
+    def test_add_entries__compaction(self, backend, mocker, monkeypatch):
+        """Test that the journal is compacted once it grows too large."""
+        mocker.patch("houdini_recent_files_menu.constants.MAX_RECENT_FILES", 2)
+        monkeypatch.setenv(constants.JOURNAL_COMPACT_SIZE_VAR_NAME, "150")
+
+        for timestamp in range(1, 5):
+            backend.add_entries({f"/file{timestamp}.hip": _entry(timestamp)})
+
+        assert backend.read_data() == {"/file4.hip": _entry(4), "/file3.hip": _entry(3)}
+        assert len(backend.path.read_text().splitlines()) == 2
+
+    def test_add_entries__archive(self, source_path, entry_archive, mocker, monkeypatch):
+        """Test that entries which no longer fit are archived when the journal is created or compacted."""
+        mocker.patch("houdini_recent_files_menu.constants.MAX_RECENT_FILES", 2)
+        monkeypatch.setenv(constants.JOURNAL_COMPACT_SIZE_VAR_NAME, "150")
+
+        source_path.write_text(json.dumps({"/file1.hip": _entry(1), "/file2.hip": _entry(2)}))
+
+        backend = storage.JournalStorageBackend(source_path.with_suffix(".jsonl"), source_path, entry_archive)
+
+        backend.add_entries({"/file3.hip": _entry(3)})
+        assert entry_archive.read() == {"/file1.hip": _entry(1)}
+
+        backend.add_entries({"/file4.hip": _entry(4)})
+        backend.add_entries({"/file5.hip": _entry(5)})
+
+        assert backend.read_data() == {"/file5.hip": _entry(5), "/file4.hip": _entry(4)}
+        assert entry_archive.read() == {"/file1.hip": _entry(1), "/file2.hip": _entry(2), "/file3.hip": _entry(3)}
+
+    def test_compact(self, backend, source_path, mocker):
+        """Test that records appended by another session since the last read are kept when compacting."""
+        backend.add_entries({"/file1.hip": _entry(1), "/file2.hip": _entry(2)})
+        assert backend.read_data() == {"/file2.hip": _entry(2), "/file1.hip": _entry(1)}
+
+        other = storage.JournalStorageBackend(backend.path, source_path)
+        other.add_entries({"/file3.hip": _entry(3)})
+
+        mocker.patch("houdini_recent_files_menu.constants.MAX_RECENT_FILES", 2)
+
+        assert backend.compact() == 1
+        assert backend.read_data() == {"/file3.hip": _entry(3), "/file2.hip": _entry(2)}
+        assert len(backend.path.read_text().splitlines()) == 2
+
+    def test_remove_entries(self, backend, source_path):
+        """Test removing entries before and after the journal is created."""
+        source_path.write_text(json.dumps({"/file1.hip": _entry(1), "/file2.hip": _entry(2)}))
+
+        backend.remove_entries({"/file1.hip": _entry(1)})
+        assert backend.read_data() == {"/file2.hip": _entry(2)}
+
+        backend.add_entries({"/file3.hip": _entry(3)})
+        backend.remove_entries({"/file2.hip": _entry(2)})
+        assert backend.read_data() == {"/file3.hip": _entry(3)}
+
+    def test_write_data(self, backend):
+        """Test JournalStorageBackend.write_data()."""
+        backend.add_entries({"/file1.hip": _entry(1)})
+        backend.write_data({"/file2.hip": _entry(2)})
+
+        assert backend.read_data() == {"/file2.hip": _entry(2)}
+
+    def test_watch_paths(self, backend, source_path):
+        """Test JournalStorageBackend.watch_paths()."""
+        assert backend.watch_paths() == (backend.path, source_path)
+
+
+class TestSqliteStorageBackend:
+    """Test the houdini_recent_files_menu.storage.SqliteStorageBackend object."""
+
+    @pytest.fixture
+    def backend(self, source_path):
+        """Fixture providing a SQLite backend."""
+        inst = storage.SqliteStorageBackend(source_path.with_suffix(".db"), source_path)
+
+        yield inst
+
+        inst.close()
+
+    def test_create(self, backend, source_path):
+        """Test that a new database is created from the source file."""
+        source_path.write_text(json.dumps({"/file1.hip": _entry(1, "20.5.123")}))
+
+        assert backend.read_data() == {"/file1.hip": _entry(1, "20.5.123")}
+
+        with sqlite3.connect(backend.path) as connection:
+            assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+            assert connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'recent_files_open_timestamp'"
+            ).fetchone()
+
+        connection.close()
+
+        # Connecting to the existing database should not import the source file again.
+        source_path.write_text(json.dumps({"/file2.hip": _entry(2)}))
+        backend.close()
+
+        assert backend.read_data() == {"/file1.hip": _entry(1, "20.5.123")}
+
+    def test_create__without_frecency(self, backend):
+        """Test that a column is added for frecency scores to a database which was created without one."""
+        with sqlite3.connect(backend.path) as connection:
+            connection.execute(
+                "CREATE TABLE recent_files (path TEXT PRIMARY KEY, open_timestamp REAL NOT NULL, save_version TEXT)"
+            )
+            connection.execute("INSERT INTO recent_files VALUES ('/file1.hip', 1, NULL)")
+
+        connection.close()
+
+        backend.write_data({"/file2.hip": {**_entry(2), constants.DATA_NAME__FRECENCY: 3.5}})
+
+        assert backend.read_data() == {"/file2.hip": {**_entry(2), constants.DATA_NAME__FRECENCY: 3.5}}
+
+        with sqlite3.connect(backend.path) as connection:
+            assert connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'recent_files_frecency'").fetchone()
+
+        connection.close()
+
+    def test_add_entries(self, backend, mocker):
+        """Test SqliteStorageBackend.add_entries()."""
+        mocker.patch("houdini_recent_files_menu.constants.MAX_RECENT_FILES", 2)
+
+        backend.add_entries({"/file1.hip": _entry(1)})
+        backend.add_entries({"/file2.hip": _entry(2)})
+
+        assert backend.read_data() == {"/file2.hip": _entry(2), "/file1.hip": _entry(1)}
+
+        backend.add_entries({"/file1.hip": _entry(3, "20.5.123")})
+        backend.add_entries({"/file4.hip": _entry(4)})
+
+        assert backend.read_data() == {"/file4.hip": _entry(4), "/file1.hip": _entry(3, "20.5.123")}
+        assert backend.read_data(limit=1) == {"/file4.hip": _entry(4)}
+
+    def test_add_entries__archive(self, source_path, entry_archive, mocker):
+        """Test that rows which no longer fit are archived."""
+        mocker.patch("houdini_recent_files_menu.constants.MAX_RECENT_FILES", 2)
+
+        backend = storage.SqliteStorageBackend(source_path.with_suffix(".db"), source_path, entry_archive)
+
+        try:
+            for timestamp in range(1, 5):
+                backend.add_entries({f"/file{timestamp}.hip": _entry(timestamp)})
+
+            assert backend.read_data() == {"/file4.hip": _entry(4), "/file3.hip": _entry(3)}
+            assert entry_archive.read() == {"/file1.hip": _entry(1), "/file2.hip": _entry(2)}
+
+        finally:
+            backend.close()
+
+    def test_add_entries__archive_failure(self, source_path, entry_archive, mocker):
+        """Test that rows are kept if they cannot be archived."""
+        mocker.patch("houdini_recent_files_menu.constants.MAX_RECENT_FILES", 1)
+        mocker.patch.object(entry_archive, "append", side_effect=OSError("Disk full"))
+
+        backend = storage.SqliteStorageBackend(source_path.with_suffix(".db"), source_path, entry_archive)
+
+        try:
+            backend.add_entries({"/file1.hip": _entry(1)})
+
+            with pytest.raises(OSError, match="Disk full"):
+                backend.add_entries({"/file2.hip": _entry(2)})
+
+            assert backend.read_data() == {"/file1.hip": _entry(1)}
+
+        finally:
+            backend.close()
+
+    def test_compact(self, backend, mocker):
+        """Test SqliteStorageBackend.compact()."""
+        backend.add_entries({f"/file{idx}.hip": _entry(idx) for idx in range(100)})
+        mocker.patch("houdini_recent_files_menu.constants.MAX_RECENT_FILES", 2)
+
+        assert backend.compact() == 98
+        assert backend.read_data() == {"/file99.hip": _entry(99), "/file98.hip": _entry(98)}
+
+    def test_close(self, backend):
+        """Test SqliteStorageBackend.close()."""
+        backend.close()
+        backend.read_data()
+        backend.close()
+
+        assert backend._connection is None
+
+    def test_modification_time(self, backend, mocker):
+        """Test SqliteStorageBackend.modification_time()."""
+        assert backend.modification_time() == 0
+
+        backend.add_entries({"/file1.hip": _entry(1)})
+
+        wal_path = backend.path.with_name(f"{backend.path.name}-wal")
+        os.utime(backend.path, (123, 123))
+        os.utime(wal_path, (456, 456))
+
+        assert backend.modification_time() == 456
+
+    def test_read_scored_data(self, backend, monkeypatch):
+        """Test SqliteStorageBackend.read_scored_data()."""
+        monkeypatch.setenv(constants.FRECENCY_HALF_LIFE_DAYS_VAR_NAME, "1")
+
+        backend.write_data({
+            "/file1.hip": {**_entry(86400), constants.DATA_NAME__FRECENCY: math.log(7)},
+            # An entry with an outdated score is ranked by its latest open.
+            "/file2.hip": {**_entry(3 * 86400), constants.DATA_NAME__FRECENCY: 0.0},
+            "/file3.hip": _entry(2.5 * 86400),
+        })
+
+        assert list(backend.read_frecent_data()) == ["/file2.hip", "/file1.hip", "/file3.hip"]
+        assert list(backend.read_frecent_data(limit=2)) == ["/file2.hip", "/file1.hip"]
+
+        # Only the entries with stored scores are ranked by the database, using its index.
+        assert list(backend.read_scored_data()) == ["/file1.hip", "/file2.hip"]
+        assert list(backend.read_scored_data(limit=1)) == ["/file1.hip"]
+
+        with backend._connect() as connection:
+            plan = connection.execute(
+                "EXPLAIN QUERY PLAN SELECT path FROM recent_files WHERE frecency IS NOT NULL ORDER BY frecency DESC"
+            ).fetchall()
+
+        assert "recent_files_frecency" in str(plan)
+
+    def test_remove_entries(self, backend):
+        """Test SqliteStorageBackend.remove_entries()."""
+        backend.add_entries({"/file1.hip": _entry(1), "/file2.hip": _entry(2), "/file3.hip": _entry(3)})
+
+        # Entries opened again since should be kept.
+        backend.remove_entries({"/file1.hip": _entry(1), "/file2.hip": _entry(1), "/file4.hip": _entry(4)})
+
+        assert backend.read_data() == {"/file3.hip": _entry(3), "/file2.hip": _entry(2)}
+
+    def test_write_data(self, backend):
+        """Test SqliteStorageBackend.write_data()."""
+        backend.add_entries({"/file1.hip": _entry(1)})
+        backend.write_data({"/file2.hip": _entry(2)})
+
+        assert backend.read_data() == {"/file2.hip": _entry(2)}
+
+    def test_watch_paths(self, backend):
+        """Test SqliteStorageBackend.watch_paths()."""
+        assert backend.watch_paths() == (backend.path, backend.path.with_name(f"{backend.path.name}-wal"))
+
+
+# Non-Public Functions
+
+
+@pytest.mark.parametrize(
+    "mode,expected_type,expected_suffix",
+    (
+        (constants.STORAGE_MODE__JSON, storage.JsonStorageBackend, ".json"),
+        (constants.STORAGE_MODE__JOURNAL, storage.JournalStorageBackend, ".jsonl"),
+        (constants.STORAGE_MODE__SQLITE, storage.SqliteStorageBackend, ".db"),
+    ),
+)
+def test__create_backend(source_path, mode, expected_type, expected_suffix):
+    """Test houdini_recent_files_menu.storage._create_backend()."""
+    result = storage._create_backend(mode, source_path)
+
+    assert isinstance(result, expected_type)
+    assert result.path == source_path.with_suffix(expected_suffix)
+    assert storage._create_backend(mode, source_path) is result
+    assert result.archive is None
+
+    result = storage._create_backend(mode, source_path, source_path.parent / "archive")
+    assert result.archive.directory == source_path.parent / "archive"
+
+
+def test__entries_as_rows():
+    """Test houdini_recent_files_menu.storage._entries_as_rows()."""
+    result = storage._entries_as_rows({
+        "/file1.hip": _entry(1, "20.5.123"),
+        "/file2.hip": {"open_timestamp": 2, "frecency": 3.5},
+    })
+
+    assert result == [("/file1.hip", 1, "20.5.123", None), ("/file2.hip", 2, None, 3.5)]
+
+
+def test__remove_entries():
+    """Test houdini_recent_files_menu.storage._remove_entries()."""
+    current = {"/file3.hip": _entry(3), "/file2.hip": _entry(2), "/file1.hip": _entry(1)}
+
+    assert storage._remove_entries(current, {"/file1.hip": _entry(1), "/file3.hip": _entry(2)}) == {
+        "/file3.hip": _entry(3),
+        "/file2.hip": _entry(2),
+    }
+
+
+def test__rows_as_entries():
+    """Test houdini_recent_files_menu.storage._rows_as_entries()."""
+    result = storage._rows_as_entries([("/file1.hip", 1, "20.5.123", None), ("/file2.hip", 2, None, 3.5)])
+
+    assert result == {"/file1.hip": _entry(1, "20.5.123"), "/file2.hip": {**_entry(2), "frecency": 3.5}}
+
+
+def test__select_entry(tmp_path):
+    """Test houdini_recent_files_menu.storage._select_entry()."""
+    inst = storage.SqliteStorageBackend(tmp_path / "recent_houdini_files.db", tmp_path / "recent_houdini_files.json")
+    inst.write_data({"/file1.hip": _entry(1, "20.5.123")})
+
+    with inst._connect() as connection:
+        assert storage._select_entry(connection, "/file1.hip") == _entry(1, "20.5.123")
+        assert storage._select_entry(connection, "/file2.hip") is None
+
+    inst.close()
+
+
+def test__split_entries():
+    """Test houdini_recent_files_menu.storage._split_entries()."""
+    kept, removed = storage._split_entries(
+        {"/file1.hip": _entry(1), "/file3.hip": _entry(3), "/file2.hip": _entry(2)}, 2
+    )
+
+    assert list(kept) == ["/file3.hip", "/file2.hip"]
+    assert removed == {"/file1.hip": _entry(1)}
+
+
+# Functions
+
+
+def test_get_project_backend(tmp_path, monkeypatch):
+    """Test houdini_recent_files_menu.storage.get_project_backend()."""
+    monkeypatch.setenv(constants.RECENT_FILE_SOURCE_VAR_NAME, (tmp_path / "recent_houdini_files.json").as_posix())
+    monkeypatch.setenv(constants.ARCHIVE_VAR_NAME, "1")
+    monkeypatch.delenv(constants.STORAGE_MODE_VAR_NAME, raising=False)
+
+    result = storage.get_project_backend("jobs_show")
+
+    assert isinstance(result, storage.JsonStorageBackend)
+    assert result.path == tmp_path / "recent_houdini_files_projects" / "jobs_show" / "recent_houdini_files.json"
+    assert result.archive is None
+
+    # The project directory should be created so the history can be written.
+    assert result.path.parent.is_dir()
+
+    assert storage.get_project_backend(None).path == tmp_path / "recent_houdini_files.json"
+
+
+def test_get_storage_backend(source_path, monkeypatch):
+    """Test houdini_recent_files_menu.storage.get_storage_backend()."""
+    monkeypatch.setenv(constants.RECENT_FILE_SOURCE_VAR_NAME, source_path.as_posix())
+    monkeypatch.setenv(constants.STORAGE_MODE_VAR_NAME, constants.STORAGE_MODE__JOURNAL)
+
+    result = storage.get_storage_backend()
+
+    assert isinstance(result, storage.JournalStorageBackend)
+    assert result.path == source_path.with_suffix(".jsonl")
+    assert result.archive is None
+
+    monkeypatch.setenv(constants.ARCHIVE_VAR_NAME, "1")
+
+    result = storage.get_storage_backend()
+    assert result.archive.directory == source_path.with_name("recent_houdini_files_archive")
@@ -0,0 +1,155 @@
+"""Test the houdini_recent_files_menu.team module."""
+
+# Standard Library
+import json
+import os
+
+# Third Party
+import pytest
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, team
+
+# Fixtures
+
+
+@pytest.fixture(autouse=True)
+def clear_team_history_cache():
+    """Fixture to automatically clear any cached team histories."""
+    team._get_team_history.cache_clear()
+
+
+def _entry(timestamp):
+    return {constants.DATA_NAME__OPEN_TIMESTAMP: timestamp, constants.DATA_NAME__SAVE_VERSION: "20.5.1"}
+
+
+def _write_history(directory, user, data, mtime=None):
+    path = directory / user / constants.RECENT_FILE_SOURCE_FILE_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+    return path
+
+
+# Classes
+
+
+class TestTeamHistory:
+    """Test the houdini_recent_files_menu.team.TeamHistory object."""
+
+    def test_top(self, tmp_path):
+        """Test TeamHistory.top()."""
+        _write_history(tmp_path, "alice", {"/a/file1.hip": _entry(1), "/a/file4.hip": _entry(4)})
+        _write_history(tmp_path, "bob", {"/b/file2.hip": _entry(2), "/b/file5.hip": _entry(5)})
+        _write_history(tmp_path, "carol", {"/c/file3.hip": _entry(3)})
+
+        # Things which are not user histories should be ignored.
+        (tmp_path / "empty").mkdir()
+        (tmp_path / "file.txt").write_text("")
+
+        inst = team.TeamHistory(tmp_path)
+
+        result = inst.top(3)
+
+        assert result == [
+            team.TeamFile("bob", "/b/file5.hip", _entry(5)),
+            team.TeamFile("alice", "/a/file4.hip", _entry(4)),
+            team.TeamFile("carol", "/c/file3.hip", _entry(3)),
+        ]
+
+        # Only the entries which could be needed should be kept.
+        assert {user: len(history.files) for user, history in inst._histories.items()} == {
+            "alice": 2,
+            "bob": 2,
+            "carol": 1,
+        }
+        assert len(inst.top(1)) == 1
+
+    def test_top__cached(self, mocker, tmp_path):
+        """Test that histories are only read again when they change."""
+        _write_history(tmp_path, "alice", {"/a/file1.hip": _entry(1)}, mtime=100)
+        _write_history(tmp_path, "bob", {"/b/file2.hip": _entry(2)}, mtime=100)
+
+        inst = team.TeamHistory(tmp_path)
+        inst.top(10)
+
+        mock_read = mocker.patch(
+            "houdini_recent_files_menu.team._read_user_history", side_effect=team._read_user_history
+        )
+
+        assert [team_file.path for team_file in inst.top(10)] == ["/b/file2.hip", "/a/file1.hip"]
+        mock_read.assert_not_called()
+
+        _write_history(tmp_path, "alice", {"/a/file1.hip": _entry(1), "/a/file3.hip": _entry(3)}, mtime=200)
+
+        assert [team_file.path for team_file in inst.top(10)] == ["/a/file3.hip", "/b/file2.hip", "/a/file1.hip"]
+        assert [call.args[0] for call in mock_read.call_args_list] == ["alice"]
+
+        # Asking for more entries than were kept should read the histories again.
+        inst.top(20)
+        assert mock_read.call_count == 3
+
+    def test_top__unreadable(self, tmp_path):
+        """Test that unreadable histories are skipped, or their previous entries used."""
+        path = _write_history(tmp_path, "alice", {"/a/file1.hip": _entry(1)}, mtime=100)
+        _write_history(tmp_path, "bob", {"/b/file2.hip": _entry(2)})
+
+        inst = team.TeamHistory(tmp_path)
+        inst.top(10)
+
+        # A partially written file should use the previous entries.
+        path.write_text('{"/a/file1.hip": ', encoding="utf-8")
+        (tmp_path / "carol").mkdir()
+        (tmp_path / "carol" / constants.RECENT_FILE_SOURCE_FILE_NAME).write_text("[]", encoding="utf-8")
+
+        assert [team_file.path for team_file in inst.top(10)] == ["/b/file2.hip", "/a/file1.hip"]
+
+        # Removed histories should no longer be included.
+        path.unlink()
+        assert [team_file.path for team_file in inst.top(10)] == ["/b/file2.hip"]
+
+    def test_top__missing_directory(self, tmp_path):
+        """Test when the team directory does not exist."""
+        assert team.TeamHistory(tmp_path / "missing").top(10) == []
+
+
+# Non-Public Functions
+
+
+def test__read_user_history(tmp_path):
+    """Test houdini_recent_files_menu.team._read_user_history()."""
+    path = _write_history(
+        tmp_path,
+        "alice",
+        {"/a/file1.hip": _entry(1), "/a/file2.hip": _entry(2), "/a/bad.hip": "foo", "/a/bad2.hip": {}},
+    )
+
+    result = team._read_user_history("alice", path, (1, 2), 5)
+
+    assert result.signature == (1, 2)
+    assert result.limit == 5
+    assert result.files == [
+        team.TeamFile("alice", "/a/file2.hip", _entry(2)),
+        team.TeamFile("alice", "/a/file1.hip", _entry(1)),
+    ]
+
+    assert team._read_user_history("alice", tmp_path / "missing.json", (1, 2), 5) is None
+
+
+# Functions
+
+
+def test_get_team_history(monkeypatch, tmp_path):
+    """Test houdini_recent_files_menu.team.get_team_history()."""
+    monkeypatch.delenv(constants.TEAM_DIRECTORY_VAR_NAME, raising=False)
+    assert team.get_team_history() is None
+
+    monkeypatch.setenv(constants.TEAM_DIRECTORY_VAR_NAME, tmp_path.as_posix())
+
+    result = team.get_team_history()
+
+    assert result.directory == tmp_path
+    assert team.get_team_history() is result
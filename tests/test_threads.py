@@ -0,0 +1,60 @@
+"""Test the houdini_recent_files_menu.threads module."""
+
+# Standard Library
+import threading
+
+# Third Party
+import pytest
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import threads
+
+# Tests
+
+
+class TestDaemonThreadPool:
+    """Test the houdini_recent_files_menu.threads.DaemonThreadPool object."""
+
+    def test___init__(self):
+        """Test object initialization."""
+        inst = threads.DaemonThreadPool(0, "test")
+
+        assert inst.max_workers == 1
+
+    def test_submit(self):
+        """Test DaemonThreadPool.submit()."""
+        inst = threads.DaemonThreadPool(2, "test_submit")
+
+        futures = [inst.submit(pow, value, 2) for value in range(5)]
+
+        assert [future.result(timeout=5) for future in futures] == [0, 1, 4, 9, 16]
+
+        # Only the maximum number of workers should be created, and they should be daemons.
+        assert len(inst._threads) == 2
+        assert all(thread.daemon for thread in inst._threads)
+
+    def test_submit__exception(self):
+        """Test DaemonThreadPool.submit() when the function raises an exception."""
+        inst = threads.DaemonThreadPool(1, "test_exception")
+
+        future = inst.submit(int, "not a number")
+
+        with pytest.raises(ValueError, match="invalid literal"):
+            future.result(timeout=5)
+
+    def test_submit__cancelled(self):
+        """Test that cancelled work is skipped."""
+        inst = threads.DaemonThreadPool(1, "test_cancelled")
+
+        release = threading.Event()
+        blocker = inst.submit(release.wait, 5)
+
+        cancelled = inst.submit(pow, 2, 2)
+        assert cancelled.cancel()
+
+        release.set()
+        after = inst.submit(pow, 3, 2)
+
+        assert blocker.result(timeout=5)
+        assert after.result(timeout=5) == 9
+        assert cancelled.cancelled()
@@ -0,0 +1,142 @@
+"""Test the houdini_recent_files_menu.timing module."""
+
+# Standard Library
+import collections
+import json
+import sys
+
+# Third Party
+import pytest
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, timing
+
+# Fixtures
+
+
+@pytest.fixture
+def timings(monkeypatch):
+    """Enable timing with an empty buffer."""
+    monkeypatch.setenv(constants.TIMING_VAR_NAME, "1")
+    monkeypatch.setattr(timing, "_TIMINGS", collections.deque(maxlen=3))
+
+    return timing._TIMINGS
+
+
+def _add_timing(phase, duration):
+    timing._TIMINGS.append(timing.PhaseTiming(phase, 1.0, duration, "MainThread"))
+
+
+# Classes
+
+
+class TestPhaseTiming:
+    """Test the houdini_recent_files_menu.timing.PhaseTiming object."""
+
+    def test_as_json(self):
+        """Test PhaseTiming.as_json()."""
+        inst = timing.PhaseTiming("phase", 1.0, 0.5, "MainThread")
+
+        assert inst.as_json() == {"phase": "phase", "started": 1.0, "duration": 0.5, "thread": "MainThread"}
+
+
+# Functions
+
+
+@pytest.mark.usefixtures("timings")
+def test_clear():
+    """Test houdini_recent_files_menu.timing.clear()."""
+    _add_timing("phase", 0.5)
+
+    timing.clear()
+
+    assert timing.get_timings() == []
+
+
+@pytest.mark.usefixtures("timings")
+def test_dump(tmp_path):
+    """Test houdini_recent_files_menu.timing.dump()."""
+    _add_timing("phase", 0.5)
+
+    output_path = tmp_path / "timings.json"
+    result = timing.dump(output_path)
+
+    assert json.loads(result) == {
+        "summary": {"phase": {"count": 1, "total": 0.5, "max": 0.5}},
+        "timings": [{"phase": "phase", "started": 1.0, "duration": 0.5, "thread": "MainThread"}],
+    }
+    assert output_path.read_text(encoding="utf-8") == result
+
+    assert timing.dump() == result
+
+
+@pytest.mark.usefixtures("timings")
+def test_log_timings(mocker, monkeypatch):
+    """Test houdini_recent_files_menu.timing.log_timings()."""
+    mock_hou = mocker.MagicMock()
+    monkeypatch.setitem(sys.modules, "hou", mock_hou)
+
+    _add_timing("phase", 0.5)
+
+    timing.log_timings()
+
+    mock_hou.logging.LogEntry.assert_called_once_with(
+        message="phase: 1 calls, 500.00ms total, 500.00ms max", source_context=timing.__name__
+    )
+    mock_hou.logging.log.assert_called_once_with(mock_hou.logging.LogEntry.return_value)
+
+
+@pytest.mark.usefixtures("timings")
+def test_summarize():
+    """Test houdini_recent_files_menu.timing.summarize()."""
+    _add_timing("phase1", 0.5)
+    _add_timing("phase2", 0.25)
+    _add_timing("phase1", 1.5)
+
+    assert timing.summarize() == {
+        "phase1": {"count": 2, "total": 2.0, "max": 1.5},
+        "phase2": {"count": 1, "total": 0.25, "max": 0.25},
+    }
+
+
+class Test_timed:
+    """Test houdini_recent_files_menu.timing.timed()."""
+
+    def test(self, timings):
+        """Test recording timings."""
+        with timing.timed("phase1"):
+            pass
+
+        @timing.timed("phase2")
+        def func():
+            return "result"
+
+        assert func() == "result"
+
+        assert [record.phase for record in timings] == ["phase1", "phase2"]
+        assert all(record.duration >= 0 for record in timings)
+        assert timings[0].thread == "MainThread"
+
+    def test_exception(self, timings):
+        """Test that a phase which fails is still recorded."""
+        with pytest.raises(RuntimeError, match="failed"), timing.timed("phase"):
+            raise RuntimeError("failed")
+
+        assert len(timings) == 1
+
+    def test_buffer_full(self, timings):
+        """Test that the oldest timings are discarded once the buffer is full."""
+        for idx in range(5):
+            with timing.timed(f"phase{idx}"):
+                pass
+
+        assert [record.phase for record in timings] == ["phase2", "phase3", "phase4"]
+
+    def test_disabled(self, monkeypatch, timings):
+        """Test that nothing is recorded when timing is disabled."""
+        monkeypatch.delenv(constants.TIMING_VAR_NAME)
+
+        with timing.timed("phase"):
+            pass
+
+        assert not timings
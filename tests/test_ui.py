@@ -1,11 +1,25 @@
 """Test the houdini_saved_file_menu.ui module."""
 
 # Standard Library
+import json
 import pathlib
+import threading
 from datetime import datetime
 
+# Third Party
+import pytest
+
 # Houdini Recent Files Menu
-from houdini_recent_files_menu import api, constants, ui
+from houdini_recent_files_menu import api, constants, file_status, storage, ui
+
+# Fixtures
+
+
+@pytest.fixture(autouse=True)
+def clear_render_cache(monkeypatch):
+    """Fixture to automatically clear any previously rendered menu data."""
+    monkeypatch.setattr(ui, "_RENDER_CACHE", ui._RenderCache())
+
 
 # Tests
 
@@ -14,26 +28,172 @@ def test__build_display_table(mocker):
     """Test houdini_saved_file_menu.ui._build_display_table()."""
     mock_manager = mocker.patch("houdini_recent_files_menu.api.RecentFileManager")
     mock_manager.files = [
-        api.RecentFile(pathlib.Path.cwd() / "file1.hipnc", 1710886869.0176835, "20.5.178"),
-        api.RecentFile(pathlib.Path.home() / "file2.hipnc", 1738076128.2437088, None),
-        api.RecentFile(pathlib.Path("/test/path/file3.hipnc"), 1722337846.0559487, "20.5.310"),
+        api.RecentFile((pathlib.Path.cwd() / "file1.hipnc").as_posix(), 1710886869.0176835, "20.5.178"),
+        api.RecentFile((pathlib.Path.home() / "file2.hipnc").as_posix(), 1738076128.2437088, None),
+        api.RecentFile("/test/path/file3.hipnc", 1722337846.0559487, "20.5.310"),
+        api.RecentFile("/test/path/file4.hipnc", 1724442855.1663203, "20.5.332"),
     ]
 
     mock_manager.files[0].exists = True
     mock_manager.files[1].exists = False
     mock_manager.files[2].exists = True
+    mock_manager.files[3].exists = None
 
     expected = [
-        f"1. $HIP/file1.hipnc                      (20.5.178)  {datetime.fromtimestamp(1710886869.0176835).strftime(constants.TIMESTAMP_FORMAT)}",
-        f"2. $HOME/file2.hipnc (no longer exists)  (None)      {datetime.fromtimestamp(1738076128.2437088).strftime(constants.TIMESTAMP_FORMAT)}",
-        f"3. /test/path/file3.hipnc                (20.5.310)  {datetime.fromtimestamp(1722337846.0559487).strftime(constants.TIMESTAMP_FORMAT)}",
+        f"1. $HIP/file1.hipnc                            (20.5.178)  {datetime.fromtimestamp(1710886869.0176835).strftime(constants.TIMESTAMP_FORMAT)}",
+        f"2. $HOME/file2.hipnc (no longer exists)        (None)      {datetime.fromtimestamp(1738076128.2437088).strftime(constants.TIMESTAMP_FORMAT)}",
+        f"3. /test/path/file3.hipnc                      (20.5.310)  {datetime.fromtimestamp(1722337846.0559487).strftime(constants.TIMESTAMP_FORMAT)}",
+        f"4. /test/path/file4.hipnc (existence unknown)  (20.5.332)  {datetime.fromtimestamp(1724442855.1663203).strftime(constants.TIMESTAMP_FORMAT)}",
     ]
 
-    result = ui._build_display_table(mock_manager)
+    result = ui._build_display_table(mock_manager.files)
 
     assert result == expected
 
 
+def test__build_display_table__cached(mocker):
+    """Test that only changed files are rendered again."""
+    mock_manager = mocker.patch("houdini_recent_files_menu.api.RecentFileManager")
+    mock_manager.files = [
+        api.RecentFile("/test/path/file1.hipnc", 1710886869.0176835, "20.5.178"),
+        api.RecentFile("/test/path/file2.hipnc", 1722337846.0559487, "20.5.310"),
+    ]
+
+    first = ui._build_display_table(mock_manager.files)
+
+    mock_render = mocker.patch("houdini_recent_files_menu.ui._render_cells", side_effect=ui._render_cells)
+
+    # Nothing has changed so nothing should be rendered.
+    assert ui._build_display_table(mock_manager.files) == first
+    mock_render.assert_not_called()
+
+    # Only the file which changed should be rendered.
+    mock_manager.files[1].exists = False
+    ui._build_display_table(mock_manager.files)
+
+    mock_render.assert_called_once_with(mock_manager.files[1])
+
+    # Changing the display settings should cause everything to be rendered again.
+    mocker.patch("houdini_recent_files_menu.constants.TIMESTAMP_FORMAT", "%Y")
+    ui._build_display_table(mock_manager.files)
+
+    assert mock_render.call_count == 3
+
+
+def test__load_in_background(mocker, monkeypatch):
+    """Test houdini_saved_file_menu.ui._load_in_background()."""
+    monkeypatch.delenv(constants.PRUNE_VAR_NAME, raising=False)
+    mock_manager = mocker.patch("houdini_recent_files_menu.api.RecentFileManager")
+    mock_execute = mocker.patch("hdefereval.executeDeferred")
+    mock_prune = mocker.patch("houdini_recent_files_menu.api.prune_missing_recent_files")
+    mock_prefetch = mocker.patch("houdini_recent_files_menu.prefetch.prefetch_files")
+
+    ui._load_in_background()
+
+    mock_manager.assert_called()
+    mock_execute.assert_called_once_with(ui.build_recent_files_menu)
+    mock_prefetch.assert_called_once_with(mock_manager.return_value.files)
+    mock_manager.return_value.get_group_index.assert_not_called()
+    mock_manager.return_value.get_search_index.assert_not_called()
+    mock_prune.assert_not_called()
+
+
+def test__load_in_background__concurrent(mocker, monkeypatch, tmp_path):
+    """Test that the menu can be built while the data is loaded in the background."""
+    source_path = tmp_path / "recent_houdini_files.json"
+    monkeypatch.setenv(constants.RECENT_FILE_SOURCE_VAR_NAME, source_path.as_posix())
+
+    for name in (constants.PRUNE_VAR_NAME, constants.SHARD_VAR_NAME, constants.STORAGE_MODE_VAR_NAME):
+        monkeypatch.delenv(name, raising=False)
+
+    data = {}
+
+    for idx in range(20):
+        path = tmp_path / f"shot{idx % 5}" / f"file{idx}.hip"
+        path.parent.mkdir(exist_ok=True)
+        path.touch()
+        data[path.as_posix()] = {constants.DATA_NAME__OPEN_TIMESTAMP: idx}
+
+    source_path.write_text(json.dumps(data))
+
+    # Nothing should be left over from other tests.
+    api.RecentFileManager._instances.pop(api.RecentFileManager, None)
+    storage._create_backend.cache_clear()
+    file_status._PENDING_SCANS.clear()
+    file_status._get_stat_cache.cache_clear()
+
+    # The menu is built straight away in the background thread as well.
+    mocker.patch("hdefereval.executeDeferred", side_effect=lambda func: func())
+    mocker.patch("houdini_recent_files_menu.prefetch.prefetch_files")
+    mocker.patch(
+        "houdini_recent_files_menu.ui._build_display_table",
+        side_effect=lambda recent_files: [str(recent_file.exists) for recent_file in recent_files],
+    )
+
+    thread = threading.Thread(target=ui._load_in_background)
+    thread.start()
+
+    menus = [ui.build_recent_files_menu() for _ in range(5)]
+
+    thread.join()
+
+    api.RecentFileManager._instances.pop(api.RecentFileManager, None)
+
+    expected = [
+        token
+        for idx in range(19, -1, -1)
+        for token in ((tmp_path / f"shot{idx % 5}" / f"file{idx}.hip").as_posix(), "True")
+    ]
+
+    assert all(menu == expected for menu in menus)
+
+
+@pytest.mark.parametrize("removed", (0, 2))
+def test__load_in_background__prune(mocker, monkeypatch, removed):
+    """Test that missing files are removed in the background, if enabled."""
+    monkeypatch.setenv(constants.PRUNE_VAR_NAME, "1")
+    mocker.patch("houdini_recent_files_menu.api.RecentFileManager")
+    mock_execute = mocker.patch("hdefereval.executeDeferred")
+    mocker.patch("houdini_recent_files_menu.api.prune_missing_recent_files", return_value=removed)
+
+    ui._load_in_background()
+
+    # The menu should be rendered again if anything was removed.
+    assert mock_execute.call_count == 1 + bool(removed)
+
+
+def test__get_display_key(mocker):
+    """Test houdini_saved_file_menu.ui._get_display_key()."""
+    mocker.patch("houdini_recent_files_menu.constants.VARS_TO_COLLAPSE", ("$HIP", "$JOB"))
+    mocker.patch("hou.text.expandString", side_effect=lambda value: value.lower())
+
+    assert ui._get_display_key() == (("$hip", "$job"), constants.TIMESTAMP_FORMAT)
+
+
+def test_build_groups_menu(mocker):
+    """Test houdini_saved_file_menu.ui.build_groups_menu()."""
+    mocker.patch("houdini_recent_files_menu.constants.MAX_DISPLAY_FILES", 2)
+    mocker.patch("hou.text.collapseCommonVars", side_effect=lambda value, **_: value.replace("/home", "$HOME"))
+
+    mock_manager = mocker.patch("houdini_recent_files_menu.api.RecentFileManager")
+    mock_manager.return_value.get_group_index.return_value.groups.return_value = [
+        ("/home/shots", 3),
+        ("/proj", 1),
+        ("/other", 1),
+    ]
+
+    result = ui.build_groups_menu()
+
+    mock_manager.return_value.refresh_data.assert_called()
+
+    assert result == [
+        "/home/shots",
+        "$HOME/shots  (3 files)",
+        "/proj",
+        "/proj        (1 file)",
+    ]
+
+
 def test_build_recent_files_menu(mocker):
     """Test houdini_saved_file_menu.ui.build_recent_files_menu()."""
     rows = [
@@ -54,8 +214,171 @@ def test_build_recent_files_menu(mocker):
     mock_manager.return_value.refresh_data.assert_called()
 
     assert result == [
-        mock_file1.path.as_posix.return_value,
+        mock_file1.posix_path,
         "row1",
-        mock_file2.path.as_posix.return_value,
+        mock_file2.posix_path,
         "row2",
     ]
+
+
+def test_build_recent_files_menu__cached(mocker):
+    """Test that the menu is only rebuilt when the files or display settings change."""
+    mock_build = mocker.patch("houdini_recent_files_menu.ui._build_display_table", return_value=["row1"])
+    mock_key = mocker.patch("houdini_recent_files_menu.ui._get_display_key", return_value=("$HIP",))
+    mock_prefetch = mocker.patch("houdini_recent_files_menu.prefetch.prefetch_files")
+
+    mock_manager = mocker.patch("houdini_recent_files_menu.api.RecentFileManager").return_value
+    mock_manager.files = [mocker.MagicMock()]
+    mock_manager.generation = 1
+
+    first = ui.build_recent_files_menu()
+
+    # Modifying the result should not affect the cached menu.
+    first.append("foo")
+
+    assert ui.build_recent_files_menu() == first[:-1]
+    mock_build.assert_called_once()
+
+    # The files are only read ahead of time when they change.
+    mock_prefetch.assert_called_once_with(mock_manager.files)
+
+    mock_manager.generation = 2
+    ui.build_recent_files_menu()
+    assert mock_build.call_count == 2
+
+    mock_key.return_value = ("$HOME",)
+    ui.build_recent_files_menu()
+    assert mock_build.call_count == 3
+
+
+def test_build_team_menu(mocker):
+    """Test houdini_saved_file_menu.ui.build_team_menu()."""
+    mocker.patch(
+        "houdini_recent_files_menu.api.get_team_recent_files",
+        return_value=[
+            ("bob", api.RecentFile("/test/path/file2.hipnc", 1722337846.0559487, "20.5.310")),
+            ("alice", api.RecentFile("/test/file1.hipnc", 1710886869.0176835, "20.5.178")),
+        ],
+    )
+    mocker.patch("houdini_recent_files_menu.ui._render_cells", side_effect=lambda f: (f.posix_path, "(v)", "time"))
+
+    result = ui.build_team_menu()
+
+    assert result == [
+        "/test/path/file2.hipnc",
+        "1. /test/path/file2.hipnc  bob    (v)  time",
+        "/test/file1.hipnc",
+        "2. /test/file1.hipnc       alice  (v)  time",
+    ]
+
+
+def test_build_projects_menu(mocker):
+    """Test houdini_saved_file_menu.ui.build_projects_menu()."""
+    mocker.patch("houdini_recent_files_menu.constants.MAX_DISPLAY_FILES", 2)
+    mocker.patch("houdini_recent_files_menu.constants.TIMESTAMP_FORMAT", "%Y")
+    mocker.patch(
+        "houdini_recent_files_menu.api.get_other_projects",
+        return_value=[("jobs_show", 1722337846.0), (None, 1710886869.0), ("jobs_other", 1.0)],
+    )
+
+    assert ui.build_projects_menu() == ["jobs_show", "jobs_show     2024", "-", "(No project)  2024"]
+
+
+@pytest.mark.parametrize("project,expected", (("jobs_show", "jobs_show"), ("-", None)))
+@pytest.mark.parametrize("files", ([], ["file"]))
+def test_open_project(mocker, project, expected, files):
+    """Test houdini_saved_file_menu.ui.open_project()."""
+    mock_get = mocker.patch("houdini_recent_files_menu.api.get_project_recent_files", return_value=files)
+    mock_choose = mocker.patch("houdini_recent_files_menu.ui._choose_file_to_open")
+
+    ui.open_project(project)
+
+    mock_get.assert_called_with(expected)
+
+    if files:
+        mock_choose.assert_called_with(files, f"Recent files in {expected or 'no project'}:", "Open Recent Files")
+
+    else:
+        mock_choose.assert_not_called()
+
+
+@pytest.mark.parametrize("files", ([], ["file"]))
+def test_open_group(mocker, files):
+    """Test houdini_saved_file_menu.ui.open_group()."""
+    mock_manager = mocker.patch("houdini_recent_files_menu.api.RecentFileManager")
+    mock_manager.return_value.get_group_files.return_value = files
+    mock_choose = mocker.patch("houdini_recent_files_menu.ui._choose_file_to_open")
+
+    ui.open_group("/proj")
+
+    mock_manager.return_value.get_group_files.assert_called_with("/proj")
+
+    if files:
+        mock_choose.assert_called_with(files, "Recent files in /proj:", "Open Recent Files")
+
+    else:
+        mock_choose.assert_not_called()
+
+
+class Test_search_recent_files:
+    """Test houdini_saved_file_menu.ui.search_recent_files()."""
+
+    @pytest.mark.parametrize("result", ((1, "file"), (0, " ")))
+    def test_cancelled(self, mocker, result):
+        """Test when the search is cancelled or empty."""
+        mocker.patch("hou.ui.readInput", return_value=result)
+        mock_manager = mocker.patch("houdini_recent_files_menu.api.RecentFileManager")
+
+        ui.search_recent_files()
+
+        mock_manager.assert_not_called()
+
+    def test_no_matches(self, mocker):
+        """Test when nothing matches the search."""
+        mocker.patch("hou.ui.readInput", return_value=(0, "file"))
+        mock_manager = mocker.patch("houdini_recent_files_menu.api.RecentFileManager")
+        mock_manager.return_value.search.return_value = []
+        mock_display = mocker.patch("hou.ui.displayMessage")
+        mock_select = mocker.patch("hou.ui.selectFromList")
+
+        ui.search_recent_files()
+
+        mock_manager.return_value.search.assert_called_with("file")
+        mock_display.assert_called()
+        mock_select.assert_not_called()
+
+    @pytest.mark.parametrize("selection", ((), (1,)))
+    def test_select(self, mocker, selection):
+        """Test choosing a file to open."""
+        recent_files = [
+            api.RecentFile("/test/path/file1.hipnc", 1710886869.0176835, "20.5.178"),
+            api.RecentFile("/test/path/file2.hipnc", 1722337846.0559487, "20.5.310"),
+        ]
+
+        mocker.patch("hou.ui.readInput", return_value=(0, "file"))
+        mock_manager = mocker.patch("houdini_recent_files_menu.api.RecentFileManager")
+        mock_manager.return_value.search.return_value = recent_files
+        mocker.patch("houdini_recent_files_menu.ui._render_cells", side_effect=lambda f: (f.posix_path, "", ""))
+        mock_select = mocker.patch("hou.ui.selectFromList", return_value=selection)
+        mock_load = mocker.patch("hou.hipFile.load")
+
+        ui.search_recent_files()
+
+        assert mock_select.call_args[0][0] == ["/test/path/file1.hipnc", "/test/path/file2.hipnc"]
+
+        if selection:
+            mock_load.assert_called_with("/test/path/file2.hipnc")
+
+        else:
+            mock_load.assert_not_called()
+
+
+def test_warm_up(mocker):
+    """Test houdini_saved_file_menu.ui.warm_up()."""
+    mock_thread = mocker.patch("threading.Thread")
+    mock_execute = mocker.patch("hdefereval.executeDeferred")
+
+    ui.warm_up()
+
+    mock_thread.assert_called_with(target=ui._load_in_background, name="recent_files_warm_up", daemon=True)
+    mock_execute.assert_called_with(mock_thread.return_value.start)
@@ -0,0 +1,249 @@
+"""Test the houdini_recent_files_menu.watcher module."""
+
+# Standard Library
+import ctypes
+import errno
+import pathlib
+import time
+
+# Third Party
+import pytest
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import constants, watcher
+
+# Fixtures
+
+
+@pytest.fixture
+def watched_path(tmp_path):
+    """Fixture providing the path to a file to watch."""
+    return tmp_path / "recent_houdini_files.json"
+
+
+def _wait_for_change(inst, timeout=5.0):
+    """Wait for a watcher to report a change."""
+    end = time.monotonic() + timeout
+
+    while time.monotonic() < end:
+        if inst.check_changed():
+            return True
+
+        time.sleep(0.01)
+
+    return False
+
+
+# Tests
+
+
+class TestFileWatcher:
+    """Test the houdini_recent_files_menu.watcher.FileWatcher object."""
+
+    def test_check_changed(self, watched_path):
+        """Test FileWatcher.check_changed()."""
+        inst = watcher.PollingWatcher([watched_path], 1)
+
+        assert not inst.check_changed()
+
+        inst._changed.set()
+
+        # The change should only be reported once.
+        assert inst.check_changed()
+        assert not inst.check_changed()
+
+    def test_stop(self, watched_path):
+        """Test FileWatcher.stop() when the watcher was never started."""
+        inst = watcher.PollingWatcher([watched_path], 1)
+
+        inst.stop()
+
+        assert inst._thread is None
+
+
+class TestInotifyWatcher:
+    """Test the houdini_recent_files_menu.watcher.InotifyWatcher object."""
+
+    def test_watch(self, watched_path):
+        """Test that changes to the watched file, and only that file, are reported."""
+        inst = watcher.InotifyWatcher([watched_path])
+        inst.start()
+
+        try:
+            (watched_path.parent / "other.json").write_text("{}")
+            time.sleep(0.1)
+            assert not inst.check_changed()
+
+            watched_path.write_text("{}")
+            assert _wait_for_change(inst)
+
+            # Replacing the file should also be reported.
+            temp_path = watched_path.with_suffix(".tmp")
+            temp_path.write_text("{}")
+            time.sleep(0.1)
+            inst.check_changed()
+
+            temp_path.replace(watched_path)
+            assert _wait_for_change(inst)
+
+        finally:
+            inst.stop()
+
+        assert inst._thread is None
+
+    def test_init_failure(self, mocker, watched_path):
+        """Test when inotify cannot be initialized."""
+        mock_libc = mocker.patch("houdini_recent_files_menu.watcher._get_libc").return_value
+        mock_libc.inotify_init1.return_value = -1
+        mocker.patch("ctypes.get_errno", return_value=errno.EMFILE)
+
+        with pytest.raises(OSError, match="Too many open files"):
+            watcher.InotifyWatcher([watched_path])
+
+    def test_add_watch_failure(self, tmp_path):
+        """Test when the directory cannot be watched."""
+        with pytest.raises(FileNotFoundError):
+            watcher.InotifyWatcher([tmp_path / "missing" / "recent_houdini_files.json"])
+
+
+class TestPollingWatcher:
+    """Test the houdini_recent_files_menu.watcher.PollingWatcher object."""
+
+    def test_watch(self, watched_path):
+        """Test that changes to the watched file are reported."""
+        inst = watcher.PollingWatcher([watched_path], 0.01)
+        inst.start()
+
+        try:
+            time.sleep(0.05)
+            assert not inst.check_changed()
+
+            watched_path.write_text("{}")
+            assert _wait_for_change(inst)
+
+            watched_path.write_text('{"foo": {}}')
+            assert _wait_for_change(inst)
+
+            watched_path.unlink()
+            assert _wait_for_change(inst)
+
+        finally:
+            inst.stop()
+
+
+# Non-Public Functions
+
+
+class Test_get_libc:
+    """Test houdini_recent_files_menu.watcher._get_libc()."""
+
+    def test(self):
+        """Test loading the C library."""
+        assert isinstance(watcher._get_libc(), ctypes.CDLL)
+
+    def test_unsupported_platform(self, mocker):
+        """Test when the platform is not Linux."""
+        mocker.patch("sys.platform", "darwin")
+
+        with pytest.raises(OSError, match="inotify"):
+            watcher._get_libc()
+
+    def test_no_inotify(self, mocker):
+        """Test when the C library does not provide inotify."""
+        mocker.patch("ctypes.CDLL", return_value=object())
+
+        with pytest.raises(OSError, match="inotify"):
+            watcher._get_libc()
+
+
+class Test_is_network_filesystem:
+    """Test houdini_recent_files_menu.watcher._is_network_filesystem()."""
+
+    @pytest.mark.parametrize(
+        "directory,expected",
+        (
+            ("/jobs/show/recent", True),
+            ("/jobs/show/missing/recent", True),
+            ("/jobs/local data/recent", False),
+            ("/jobs", True),
+            ("/jobsite", False),
+            ("/home/user", False),
+        ),
+    )
+    def test(self, monkeypatch, tmp_path, directory, expected):
+        """Test finding the filesystem type of the most specific mount point containing the directory."""
+        mounts_path = tmp_path / "mounts"
+        mounts_path.write_text(
+            "/dev/sda1 / ext4 rw 0 0\n\nserver:/jobs /jobs nfs4 rw 0 0\n/dev/sdb1 /jobs/local\\040data xfs rw 0 0\n"
+        )
+        monkeypatch.setattr(watcher, "_MOUNTS_PATH", mounts_path)
+
+        assert watcher._is_network_filesystem(pathlib.Path(directory)) is expected
+
+    def test_no_mounts(self, monkeypatch, tmp_path):
+        """Test when the mount table cannot be read."""
+        monkeypatch.setattr(watcher, "_MOUNTS_PATH", tmp_path / "missing")
+
+        assert not watcher._is_network_filesystem(tmp_path)
+
+
+# Functions
+
+
+class Test_create_watcher:
+    """Test houdini_recent_files_menu.watcher.create_watcher()."""
+
+    def test_disabled(self, monkeypatch, watched_path):
+        """Test when watching is disabled."""
+        monkeypatch.delenv(constants.WATCH_MODE_VAR_NAME, raising=False)
+
+        assert watcher.create_watcher([watched_path]) is None
+
+    @pytest.mark.parametrize(
+        "mode,expected_type",
+        (
+            (constants.WATCH_MODE__INOTIFY, watcher.InotifyWatcher),
+            (constants.WATCH_MODE__POLL, watcher.PollingWatcher),
+        ),
+    )
+    def test_mode(self, monkeypatch, watched_path, mode, expected_type):
+        """Test creating a watcher for each mode."""
+        monkeypatch.setenv(constants.WATCH_MODE_VAR_NAME, mode)
+
+        inst = watcher.create_watcher([watched_path])
+
+        try:
+            assert isinstance(inst, expected_type)
+            assert inst.paths == (watched_path,)
+            assert inst._thread.is_alive()
+
+        finally:
+            inst.stop()
+
+    def test_network_filesystem(self, mocker, monkeypatch, watched_path):
+        """Test that polling is used when the files are on a network filesystem."""
+        monkeypatch.setenv(constants.WATCH_MODE_VAR_NAME, constants.WATCH_MODE__INOTIFY)
+        mock_is_network = mocker.patch("houdini_recent_files_menu.watcher._is_network_filesystem", return_value=True)
+
+        inst = watcher.create_watcher([watched_path])
+
+        try:
+            assert isinstance(inst, watcher.PollingWatcher)
+            mock_is_network.assert_called_once_with(watched_path.parent)
+
+        finally:
+            inst.stop()
+
+    def test_inotify_fallback(self, monkeypatch, tmp_path):
+        """Test that polling is used when inotify cannot be used."""
+        monkeypatch.setenv(constants.WATCH_MODE_VAR_NAME, constants.WATCH_MODE__INOTIFY)
+        monkeypatch.setenv(constants.POLL_INTERVAL_VAR_NAME, "0.5")
+
+        inst = watcher.create_watcher([tmp_path / "missing" / "recent_houdini_files.json"])
+
+        try:
+            assert isinstance(inst, watcher.PollingWatcher)
+            assert inst.interval == pytest.approx(0.5)
+
+        finally:
+            inst.stop()
@@ -0,0 +1,127 @@
+"""Test the houdini_recent_files_menu.writer module."""
+
+# Standard Library
+import threading
+import time
+
+# Third Party
+import pytest
+
+# Houdini Recent Files Menu
+from houdini_recent_files_menu import writer
+
+# Tests
+
+
+class TestWriteBehindQueue:
+    """Test the houdini_recent_files_menu.writer.WriteBehindQueue object."""
+
+    def test_enqueue(self):
+        """Test that a burst of updates is written as a single batch."""
+        batches = []
+        written = threading.Event()
+
+        def _write(items):
+            batches.append(items)
+            written.set()
+
+        inst = writer.WriteBehindQueue(_write, 0.05, "test_enqueue")
+
+        inst.enqueue("a", 1)
+        inst.enqueue("b", 2)
+        inst.enqueue("a", 3)
+
+        assert len(inst) == 2
+
+        assert written.wait(5)
+
+        # Repeated updates for the same key should be combined, keeping the latest.
+        assert batches == [[2, 3]]
+        assert len(inst) == 0
+        assert inst._thread.daemon
+
+    def test_enqueue__debounce(self):
+        """Test that items are not written until nothing has been queued for the delay."""
+        batches = []
+        written = threading.Event()
+
+        def _write(items):
+            batches.append(items)
+            written.set()
+
+        inst = writer.WriteBehindQueue(_write, 0.2, "test_debounce")
+
+        inst.enqueue("a", 1)
+        time.sleep(0.1)
+        inst.enqueue("a", 2)
+        time.sleep(0.1)
+
+        # The second update restarted the delay, so nothing has been written yet.
+        assert not batches
+
+        assert written.wait(5)
+        assert batches == [[2]]
+
+    def test_enqueue__write_failure(self, caplog):
+        """Test that items which fail to be written are reported and retried with the next batch."""
+        batches = []
+        attempted = threading.Event()
+        written = threading.Event()
+
+        def _write(items):
+            if not attempted.is_set():
+                attempted.set()
+                raise OSError("Disk full")
+
+            batches.append(items)
+            written.set()
+
+        inst = writer.WriteBehindQueue(_write, 0.01, "test_write_failure")
+
+        inst.enqueue("a", 1)
+        assert attempted.wait(5)
+
+        # The failed items should be kept without being retried until something else is queued.
+        time.sleep(0.1)
+        assert len(inst) == 1
+        assert not batches
+
+        # The failure should be reported along with what caused it.
+        (record,) = caplog.records
+        assert record.name == writer.__name__
+        assert record.levelname == "ERROR"
+        assert "Disk full" in record.exc_text
+
+        inst.enqueue("b", 2)
+
+        assert written.wait(5)
+        assert batches == [[1, 2]]
+
+    def test_flush(self, mocker):
+        """Test WriteBehindQueue.flush()."""
+        mock_write = mocker.MagicMock()
+
+        inst = writer.WriteBehindQueue(mock_write, 60, "test_flush")
+
+        # Nothing should be written when nothing is queued.
+        inst.flush()
+        mock_write.assert_not_called()
+
+        inst.enqueue("a", 1)
+        inst.flush()
+
+        mock_write.assert_called_once_with([1])
+        assert len(inst) == 0
+
+    def test_flush__failure(self, mocker):
+        """Test WriteBehindQueue.flush() when writing fails."""
+        inst = writer.WriteBehindQueue(mocker.MagicMock(side_effect=OSError("Disk full")), 60, "test_flush_failure")
+
+        inst.enqueue("a", 1)
+        inst.enqueue("b", 2)
+
+        with pytest.raises(OSError, match="Disk full"):
+            inst.flush()
+
+        # The items should be kept to be written later.
+        assert inst._pending == {"a": 1, "b": 2}